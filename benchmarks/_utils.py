@@ -0,0 +1,166 @@
+"""
+helpers shared by the benchmark scripts
+"""
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Dict, Any, Optional
+
+BASELINE_FORMAT_VERSION = 1
+
+# the statistic that is compared with the baseline
+BASELINE_METRIC = "p50"
+
+
+def percentile(sorted_samples: List[float], q: float) -> float:
+    """
+    the q-th percentile (0 <= q <= 100) of the sorted samples, using linear interpolation
+    """
+    if not sorted_samples:
+        return float("nan")
+    pos = (len(sorted_samples) - 1) * q / 100.0
+    lower = int(pos)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (
+        pos - lower
+    )
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    summarize the latency samples (in seconds), the results are in microseconds
+    """
+    samples = sorted(samples)
+    to_us = 1e6
+    return {
+        "count": len(samples),
+        "min": samples[0] * to_us,
+        "p50": percentile(samples, 50) * to_us,
+        "p90": percentile(samples, 90) * to_us,
+        "p99": percentile(samples, 99) * to_us,
+        "max": samples[-1] * to_us,
+        "mean": sum(samples) / len(samples) * to_us,
+    }
+
+
+def time_calls(func: Callable[[], Any], repeat: int, warmup: int = 3) -> List[float]:
+    """
+    call func repeat times (after warmup calls) and return the latency of each call in seconds
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def measure_allocations(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    measure the memory allocated by each call of func with tracemalloc. this is done in a separate pass, because
+    tracing the allocations slows the calls down.
+    :return: the mean and the max of the peak traced memory (in bytes) of the calls
+    """
+    func()
+    peaks = []
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            # clearing the traces resets the peak too
+            tracemalloc.clear_traces()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return {
+        "alloc_peak_mean": sum(peaks) / len(peaks),
+        "alloc_peak_max": max(peaks),
+    }
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+def make_report(name: str, results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "version": BASELINE_FORMAT_VERSION,
+        "benchmark": name,
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def write_json(path: str, data: Dict[str, Any]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("version", None) != BASELINE_FORMAT_VERSION:
+        raise ValueError(
+            f"unsupported baseline format: {baseline.get('version', None)}"
+        )
+    return baseline
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Any],
+    threshold: float,
+    metric: str = BASELINE_METRIC,
+) -> List[str]:
+    """
+    compare the results with the baseline, return the descriptions of the cases whose metric is more than
+    threshold (e.g. 0.2 for 20%) slower than the baseline. cases missing from either side are ignored.
+    """
+    regressions = []
+    baseline_results = baseline.get("results", {})
+    for case, stats in results.items():
+        base_stats = baseline_results.get(case, None)
+        if not base_stats or metric not in base_stats or metric not in stats:
+            continue
+        base_value = base_stats[metric]
+        value = stats[metric]
+        if base_value > 0 and value > base_value * (1.0 + threshold):
+            regressions.append(
+                f"{case}: {metric} {value:.1f} vs baseline {base_value:.1f} "
+                f"({(value / base_value - 1.0) * 100:+.1f}%)"
+            )
+    return regressions
+
+
+def print_table(results: Dict[str, Dict[str, Any]], columns: List[str], file=None):
+    file = file or sys.stdout
+    name_width = max([len("case")] + [len(case) for case in results])
+    widths = [max(14, len(col) + 2) for col in columns]
+    header = "case".ljust(name_width) + "".join(
+        col.rjust(width) for col, width in zip(columns, widths)
+    )
+    print(header, file=file)
+    print("-" * len(header), file=file)
+    for case, stats in results.items():
+        cells = []
+        for col, width in zip(columns, widths):
+            value: Optional[Any] = stats.get(col, None)
+            if isinstance(value, float):
+                cells.append(f"{value:.1f}".rjust(width))
+            else:
+                cells.append(f"{'' if value is None else value}".rjust(width))
+        print(case.ljust(name_width) + "".join(cells), file=file)
@@ -0,0 +1,173 @@
+"""
+benchmark the import time of function2widgets with `python -X importtime`, each scenario in a fresh interpreter.
+
+for every scenario, the total import time (the sum of the cumulative times of the top level imports, in
+microseconds) is measured N times, and the modules that take the most time are listed for the first run.
+"from function2widgets import *" imports everything, it is the cost of importing the package eagerly.
+
+usage:
+    python -m benchmarks.import_bench [-n 10] [--top 5] [--json results.json]
+    python -m benchmarks.import_bench --baseline baseline.json [--threshold 0.2]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from benchmarks._utils import (
+    summarize,
+    make_report,
+    write_json,
+    load_baseline,
+    find_regressions,
+    print_table,
+    BASELINE_METRIC,
+)
+
+SCENARIOS = OrderedDict(
+    [
+        ("python", "pass"),
+        ("package", "import function2widgets"),
+        ("parser", "from function2widgets import FunctionInfoParser"),
+        ("info", "from function2widgets.info import FunctionInfo"),
+        ("one widget", "from function2widgets import LineEdit"),
+        ("factory", "from function2widgets import ParameterWidgetFactory"),
+        ("code editor", "from function2widgets import CodeEditor"),
+        ("everything", "from function2widgets import *"),
+    ]
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int, int]]:
+    """
+    parse the output of -X importtime
+    :return: a list of (module name, depth, self time, cumulative time), times in microseconds
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        self_time, cumulative, name = fields
+        try:
+            self_us = int(self_time)
+            cumulative_us = int(cumulative)
+        except ValueError:
+            # the header line
+            continue
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((stripped, depth, self_us, cumulative_us))
+    return entries
+
+
+def run_scenario(statement: str) -> List[Tuple[str, int, int, int]]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (PROJECT_ROOT, env.get("PYTHONPATH", "")) if path
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def total_import_time(entries: List[Tuple[str, int, int, int]]) -> int:
+    return sum(cumulative for _, depth, _, cumulative in entries if depth == 0)
+
+
+def top_modules(
+    entries: List[Tuple[str, int, int, int]], count: int
+) -> List[Tuple[str, int]]:
+    """
+    the top level imports that take the most time
+    """
+    top_level = [
+        (name, cumulative) for name, depth, _, cumulative in entries if depth == 0
+    ]
+    return sorted(top_level, key=lambda item: -item[1])[:count]
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    arg_parser.add_argument("-n", type=int, default=10, help="runs per scenario")
+    arg_parser.add_argument(
+        "--top", type=int, default=5, help="the slowest imports listed per scenario"
+    )
+    arg_parser.add_argument(
+        "--filter", default="", help="only run the scenarios containing this text"
+    )
+    arg_parser.add_argument("--json", help="write the results to this file")
+    arg_parser.add_argument(
+        "--save-baseline", help="write the results as a baseline to this file"
+    )
+    arg_parser.add_argument("--baseline", help="compare the results with this baseline")
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="the allowed slowdown relative to the baseline (default: 0.2, i.e. 20%%)",
+    )
+    args = arg_parser.parse_args()
+
+    results = OrderedDict()
+    slowest: Dict[str, List[Tuple[str, int]]] = OrderedDict()
+    for name, statement in SCENARIOS.items():
+        if args.filter and args.filter not in name:
+            continue
+        samples = []
+        for i in range(args.n):
+            entries = run_scenario(statement)
+            samples.append(total_import_time(entries) / 1e6)
+            if i == 0:
+                slowest[name] = top_modules(entries, args.top)
+        results[f"import[{name}]"] = summarize(samples)
+
+    print_table(results, ["p50", "p90", "min", "mean"])
+    print()
+    for name, modules in slowest.items():
+        print(f"{name}: {SCENARIOS[name]}")
+        for module, cumulative in modules:
+            print(f"    {module:<40}{cumulative:>10} us")
+
+    report = make_report("import", results)
+    report["slowest_imports"] = slowest
+    if args.json:
+        write_json(args.json, report)
+    if args.save_baseline:
+        write_json(args.save_baseline, report)
+
+    if args.baseline:
+        regressions = find_regressions(
+            results, load_baseline(args.baseline), args.threshold
+        )
+        if regressions:
+            print(
+                f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%} "
+                f"({BASELINE_METRIC}):",
+                file=sys.stderr,
+            )
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            return 1
+        print(f"\nno regression over {args.threshold:.0%} ({BASELINE_METRIC})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+benchmark the parser hot path: FunctionInfoParser.parse, FunctionDocstringParser.parse, WidgetConfigsParser.parse
+and the type resolution (parse_type_info / resolve_type_info), and loading the same functions from precompiled specs
+(function_info_from_spec).
+
+the functions are generated, varying one dimension at a time from a reference case: the number of parameters,
+the docstring style (rest/google/numpy/epydoc), the complexity of the annotations and the size of the @widgets
+block. the per-call latency percentiles (in microseconds) and the allocations (in bytes) are reported.
+
+usage:
+    python -m benchmarks.parser_bench [--repeat 200] [--json results.json]
+    python -m benchmarks.parser_bench --save-baseline baseline.json
+    python -m benchmarks.parser_bench --baseline baseline.json [--threshold 0.2]
+
+with --baseline, the exit code is 1 if the p50 latency of any case is more than threshold slower than the
+baseline.
+"""
+
+import argparse
+import sys
+import typing
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks._utils import (
+    summarize,
+    time_calls,
+    measure_allocations,
+    make_report,
+    write_json,
+    load_baseline,
+    find_regressions,
+    print_table,
+    BASELINE_METRIC,
+)
+from function2widgets.common import parse_type_info
+from function2widgets.parser.docstr_parser import FunctionDocstringParser
+from function2widgets.parser.function_parser import FunctionInfoParser
+from function2widgets.parser.parameter_parser import resolve_type_info
+from function2widgets.parser.widgetconfigs_parser import WidgetConfigsParser
+from function2widgets.spec import (
+    compile_function_spec,
+    dumps_spec,
+    loads_spec,
+    function_info_from_spec,
+)
+
+DOCSTRING_STYLES = ("rest", "google", "numpy", "epydoc")
+PARAM_COUNTS = (5, 20, 80)
+# annotation complexity -> the annotations cycled through by the parameters, with a default value for each
+ANNOTATIONS = {
+    "none": [("", "0")],
+    "simple": [("int", "0"), ("float", "0.0"), ("str", "''"), ("bool", "False")],
+    "generic": [
+        ("List[int]", "None"),
+        ("Dict[str, List[int]]", "None"),
+        ("Tuple[int, str]", "None"),
+        ("Optional[int]", "None"),
+    ],
+    "literal": [
+        ("Literal['a', 'b', 'c']", "'a'"),
+        ("Union[int, str, None]", "None"),
+        ("Optional[Literal['x, y', 'z']]", "None"),
+    ],
+}
+WIDGETS_BLOCK_SIZES = ("none", "small", "full")
+
+REFERENCE_CASE = {
+    "style": "rest",
+    "params": 20,
+    "annotations": "simple",
+    "widgets": "small",
+}
+
+
+def _param_type(annotations: str, index: int) -> Tuple[str, str]:
+    choices = ANNOTATIONS[annotations]
+    return choices[index % len(choices)]
+
+
+def make_docstring(style: str, params: int, annotations: str, widgets: str) -> str:
+    lines = ["generated function for benchmarking.", ""]
+    typenames = [_param_type(annotations, i)[0] or "int" for i in range(params)]
+    if style == "rest":
+        for i in range(params):
+            lines.append(f":param p{i}: the description of p{i}")
+            lines.append(f":type p{i}: {typenames[i]}")
+        lines.append(":return: nothing")
+    elif style == "google":
+        lines.append("Args:")
+        for i in range(params):
+            lines.append(f"    p{i} ({typenames[i]}): the description of p{i}")
+        lines.append("")
+        lines.append("Returns:")
+        lines.append("    None: nothing")
+    elif style == "numpy":
+        lines.append("Parameters")
+        lines.append("----------")
+        for i in range(params):
+            lines.append(f"p{i} : {typenames[i]}")
+            lines.append(f"    the description of p{i}")
+        lines.append("")
+        lines.append("Returns")
+        lines.append("-------")
+        lines.append("None")
+    elif style == "epydoc":
+        for i in range(params):
+            lines.append(f"@param p{i}: the description of p{i}")
+            lines.append(f"@type p{i}: {typenames[i]}")
+        lines.append("@return: nothing")
+    else:
+        raise ValueError(f"unknown docstring style: {style}")
+
+    if widgets != "none":
+        configured = params if widgets == "full" else min(params, 3)
+        lines.append("")
+        lines.append("@widgets")
+        for i in range(configured):
+            lines.append(f"[p{i}]")
+            lines.append(f'label = "parameter {i}"')
+            lines.append(f'description = "the description of p{i}"')
+            lines.append("")
+        lines.append("@end")
+    return "\n" + "\n".join(f"    {line}" if line else "" for line in lines) + "\n    "
+
+
+def make_function(style: str, params: int, annotations: str, widgets: str) -> Callable:
+    args = []
+    for i in range(params):
+        annotation, default = _param_type(annotations, i)
+        if annotation:
+            args.append(f"p{i}: {annotation} = {default}")
+        else:
+            args.append(f"p{i}={default}")
+    docstring = make_docstring(style, params, annotations, widgets)
+    source = f"def generated({', '.join(args)}):\n    '''{docstring}'''\n    pass\n"
+    namespace = {name: getattr(typing, name) for name in typing.__all__}
+    exec(source, namespace)
+    return namespace["generated"]
+
+
+def iter_function_cases():
+    seen = set()
+    variations = [
+        ("style", DOCSTRING_STYLES),
+        ("params", PARAM_COUNTS),
+        ("annotations", tuple(ANNOTATIONS.keys())),
+        ("widgets", WIDGETS_BLOCK_SIZES),
+    ]
+    for key, values in variations:
+        for value in values:
+            case = dict(REFERENCE_CASE, **{key: value})
+            name = "style={style},params={params},annotations={annotations},widgets={widgets}".format(
+                **case
+            )
+            if name in seen:
+                continue
+            seen.add(name)
+            yield name, case
+
+
+def make_benchmarks() -> "OrderedDict[str, Callable[[], Any]]":
+    benchmarks = OrderedDict()
+    func_parser = FunctionInfoParser()
+    docstring_parser = FunctionDocstringParser()
+    widget_configs_parser = WidgetConfigsParser()
+
+    for name, case in iter_function_cases():
+        func = make_function(**case)
+        docstring = func.__doc__
+        benchmarks[f"FunctionInfoParser.parse[{name}]"] = (
+            lambda f=func: func_parser.parse(f)
+        )
+        # loading a precompiled spec instead of parsing the function
+        spec_json = dumps_spec(compile_function_spec(func_parser.parse(func)))
+        benchmarks[f"function_info_from_spec[{name}]"] = (
+            lambda s=spec_json: function_info_from_spec(loads_spec(s))
+        )
+        benchmarks[f"FunctionDocstringParser.parse[{name}]"] = (
+            lambda d=docstring: docstring_parser.parse(d).get_function_description()
+        )
+        if case["widgets"] != "none":
+            benchmarks[f"WidgetConfigsParser.parse[{name}]"] = (
+                lambda d=docstring: widget_configs_parser.parse(d)
+            )
+
+    annotations: List[Tuple[str, Any]] = []
+    namespace = {name: getattr(typing, name) for name in typing.__all__}
+    for complexity, choices in ANNOTATIONS.items():
+        for annotation_str, _ in choices:
+            if annotation_str:
+                annotations.append((annotation_str, eval(annotation_str, namespace)))
+    for annotation_str, annotation in annotations:
+        benchmarks[f"parse_type_info[{annotation_str}]"] = lambda a=str(
+            annotation
+        ): parse_type_info(a)
+        benchmarks[f"resolve_type_info[{annotation_str}]"] = (
+            lambda a=annotation: resolve_type_info(a)
+        )
+    return benchmarks
+
+
+def run_benchmarks(
+    benchmarks: Dict[str, Callable[[], Any]], repeat: int, allocations: bool
+) -> Dict[str, Dict[str, Any]]:
+    results = OrderedDict()
+    for case, func in benchmarks.items():
+        stats = summarize(time_calls(func, repeat=repeat))
+        if allocations:
+            stats.update(measure_allocations(func, repeat=max(1, repeat // 10)))
+        results[case] = stats
+    return results
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    arg_parser.add_argument("--repeat", type=int, default=200, help="calls per case")
+    arg_parser.add_argument(
+        "--filter", default="", help="only run the cases containing this text"
+    )
+    arg_parser.add_argument(
+        "--no-allocations", action="store_true", help="skip the tracemalloc pass"
+    )
+    arg_parser.add_argument("--json", help="write the results to this file")
+    arg_parser.add_argument(
+        "--save-baseline", help="write the results as a baseline to this file"
+    )
+    arg_parser.add_argument("--baseline", help="compare the results with this baseline")
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="the allowed slowdown relative to the baseline (default: 0.2, i.e. 20%%)",
+    )
+    args = arg_parser.parse_args()
+
+    benchmarks = make_benchmarks()
+    if args.filter:
+        benchmarks = OrderedDict(
+            (case, func) for case, func in benchmarks.items() if args.filter in case
+        )
+    results = run_benchmarks(benchmarks, args.repeat, not args.no_allocations)
+
+    columns = ["p50", "p90", "p99", "mean"]
+    if not args.no_allocations:
+        columns.append("alloc_peak_mean")
+    print_table(results, columns)
+
+    report = make_report("parser", results)
+    if args.json:
+        write_json(args.json, report)
+    if args.save_baseline:
+        write_json(args.save_baseline, report)
+
+    if args.baseline:
+        regressions = find_regressions(
+            results, load_baseline(args.baseline), args.threshold
+        )
+        if regressions:
+            print(
+                f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%} "
+                f"({BASELINE_METRIC}):",
+                file=sys.stderr,
+            )
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            return 1
+        print(f"\nno regression over {args.threshold:.0%} ({BASELINE_METRIC})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+"""
+benchmark the construction of the parameter widgets, headless (QT_QPA_PLATFORM defaults to offscreen).
+
+for every class in BASIC_PARAMETER_WIDGETS, the following are measured N times:
+    construct   creating the widget through ParameterWidgetFactory (args included)
+    roundtrip   set_value() followed by get_value()
+    show        showing the widget and activating its layout
+
+then a form of --form-size parameters (cycling through all the widget classes) is built with
+ParameterWidgetFactory.create_widgets_for_function, and the time spent on each widget class is reported.
+the same form is also built with WidgetPipeline, reporting the total time and the longest time the event loop
+is blocked (max_stall).
+
+usage:
+    python -m benchmarks.widget_bench [-n 50] [--form-size 200] [--json results.json]
+    python -m benchmarks.widget_bench --baseline baseline.json [--threshold 0.2]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime, date
+from datetime import time as dt_time
+from typing import Any, Dict, List, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from benchmarks._utils import (
+    summarize,
+    make_report,
+    write_json,
+    load_baseline,
+    find_regressions,
+    print_table,
+    BASELINE_METRIC,
+)
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.info import FunctionInfo, ParameterInfo, ParameterWidgetInfo
+from function2widgets.pipeline import WidgetPipeline
+from function2widgets.widget import BaseParameterWidget
+from function2widgets.widgets.allwidgets import BASIC_PARAMETER_WIDGETS
+from function2widgets.widgets.misc import Color
+
+# widget class name -> (extra widget args, a value for the set_value/get_value round trip)
+WIDGET_SAMPLES: Dict[str, Tuple[Dict[str, Any], Any]] = {
+    "LineEdit": ({"default": "text"}, "another text"),
+    "IntLineEdit": ({"default": 1}, 42),
+    "FloatLineEdit": ({"default": 1.0}, 3.14),
+    "PathEdit": ({"default": "/tmp"}, "/usr/bin"),
+    "FilePathEdit": ({"default": "/tmp/a.txt"}, "/tmp/b.txt"),
+    "DirPathEdit": ({"default": "/tmp"}, "/usr"),
+    "PlainTextEdit": ({"default": "line 1\nline 2"}, "line 3\nline 4"),
+    "CodeEdit": ({"default": "print('hello')"}, "def f():\n    return 1\n"),
+    "CodeEditor": ({"default": "print('hello')"}, "def f():\n    return 1\n"),
+    "JsonEditor": ({"default": {"a": [1, 2, 3]}}, {"b": {"c": [4, 5, 6]}}),
+    "DictEditor": ({"default": {"a": 1}}, {"b": 2, "c": [3, 4]}),
+    "ListEditor": ({"default": [1, 2, 3]}, [4, 5, {"a": 6}]),
+    "TupleEditor": ({"default": (1, 2)}, (3, 4, 5)),
+    "ComboBox": ({"default": "a", "items": ["a", "b", "c"]}, "b"),
+    "ComboBoxEdit": ({"default": "a", "items": ["a", "b", "c"]}, "d"),
+    "CheckBox": ({"default": False}, True),
+    "RadioButtonGroup": ({"items": ["a", "b", "c"]}, "b"),
+    "CheckBoxGroup": ({"default": ["a"], "items": ["a", "b", "c"]}, ["b", "c"]),
+    "IntSpinBox": ({"default": 1}, 42),
+    "FloatSpinBox": ({"default": 1.0}, 3.5),
+    "Dial": ({"default": 1}, 42),
+    "Slider": ({"default": 1}, 42),
+    "DateEdit": ({"default": date(2020, 1, 1)}, date(2021, 2, 3)),
+    "TimeEdit": ({"default": dt_time(12, 0, 0)}, dt_time(13, 14, 15)),
+    "DateTimeEdit": (
+        {"default": datetime(2020, 1, 1, 12, 0, 0)},
+        datetime(2021, 2, 3, 13, 14, 15),
+    ),
+    "ColorEdit": ({"default": Color(255, 0, 0)}, Color(0, 128, 255)),
+}
+
+
+def widget_kwargs(widget_class_name: str, parameter_name: str) -> Dict[str, Any]:
+    extra_args, _ = WIDGET_SAMPLES.get(widget_class_name, ({}, None))
+    return dict(extra_args, parameter_name=parameter_name)
+
+
+def dispose(app: QApplication, widgets: List[QWidget]):
+    for widget in widgets:
+        widget.deleteLater()
+    widgets.clear()
+    app.processEvents()
+
+
+def bench_construct(
+    app: QApplication, factory: ParameterWidgetFactory, name: str, n: int
+) -> List[float]:
+    samples = []
+    widgets = []
+    kwargs = widget_kwargs(name, "p")
+    perf_counter = time.perf_counter
+    for _ in range(n):
+        start = perf_counter()
+        widget = factory._create_widget(name, **kwargs)
+        samples.append(perf_counter() - start)
+        widgets.append(widget)
+    dispose(app, widgets)
+    return samples
+
+
+def bench_roundtrip(widget: BaseParameterWidget, value: Any, n: int) -> List[float]:
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(n):
+        start = perf_counter()
+        widget.set_value(value)
+        widget.get_value()
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def bench_show(
+    app: QApplication, factory: ParameterWidgetFactory, name: str, n: int
+) -> List[float]:
+    samples = []
+    widgets = []
+    kwargs = widget_kwargs(name, "p")
+    perf_counter = time.perf_counter
+    for _ in range(n):
+        widget = factory._create_widget(name, **kwargs)
+        widgets.append(widget)
+        start = perf_counter()
+        widget.show()
+        layout = widget.layout()
+        if layout is not None:
+            layout.activate()
+        widget.sizeHint()
+        app.processEvents()
+        samples.append(perf_counter() - start)
+        widget.hide()
+    dispose(app, widgets)
+    return samples
+
+
+def make_form(size: int) -> FunctionInfo:
+    names = sorted(BASIC_PARAMETER_WIDGETS.keys())
+    parameters = []
+    for i in range(size):
+        widget_class_name = names[i % len(names)]
+        param_name = f"p{i}"
+        widget_args = widget_kwargs(widget_class_name, param_name)
+        parameters.append(
+            ParameterInfo(
+                name=param_name,
+                default=widget_args.get("default", None),
+                typename="any",
+                widget=ParameterWidgetInfo(
+                    widget_class=widget_class_name, widget_args=widget_args
+                ),
+            )
+        )
+    return FunctionInfo(name="form", description="", parameters=parameters)
+
+
+def bench_form(
+    app: QApplication, factory: ParameterWidgetFactory, func_info: FunctionInfo, n: int
+) -> Dict[str, Dict[str, Any]]:
+    results = OrderedDict()
+    totals = []
+    per_class: Dict[str, List[float]] = OrderedDict()
+    perf_counter = time.perf_counter
+    for _ in range(n):
+        start = perf_counter()
+        widgets = factory.create_widgets_for_function(func_info)
+        totals.append(perf_counter() - start)
+        dispose(app, list(widgets.values()))
+
+        # the same form, built parameter by parameter to attribute the time to the widget classes
+        class_times: Dict[str, float] = {}
+        built = []
+        for param_info in func_info.parameters:
+            start = perf_counter()
+            widget = factory.create_widget_for_parameter(param_info)
+            elapsed = perf_counter() - start
+            built.append(widget)
+            widget_class_name = param_info.widget.widget_class
+            class_times[widget_class_name] = (
+                class_times.get(widget_class_name, 0.0) + elapsed
+            )
+        dispose(app, built)
+        for widget_class_name, elapsed in class_times.items():
+            per_class.setdefault(widget_class_name, []).append(elapsed)
+
+    results[f"form[{len(func_info.parameters)} params]"] = summarize(totals)
+    for widget_class_name, samples in sorted(
+        per_class.items(), key=lambda item: -sum(item[1])
+    ):
+        results[f"form[{len(func_info.parameters)} params]/{widget_class_name}"] = (
+            summarize(samples)
+        )
+    return results
+
+
+def bench_pipeline(
+    app: QApplication, factory: ParameterWidgetFactory, func_info: FunctionInfo, n: int
+) -> Dict[str, Dict[str, Any]]:
+    results = OrderedDict()
+    totals = []
+    stalls = []
+    perf_counter = time.perf_counter
+    for _ in range(n):
+        pipeline = WidgetPipeline(factory)
+        start = perf_counter()
+        job = pipeline.build(func_info)
+        last = start
+        max_stall = 0.0
+        while not job.is_done():
+            app.processEvents()
+            now = perf_counter()
+            max_stall = max(max_stall, now - last)
+            last = now
+        totals.append(perf_counter() - start)
+        stalls.append(max_stall)
+        dispose(app, list(job.widgets().values()))
+        pipeline.close()
+
+    name = f"pipeline[{len(func_info.parameters)} params, chunk {WidgetPipeline.DEFAULT_CHUNK_SIZE}]"
+    results[name] = summarize(totals)
+    results[f"{name}/max_stall"] = summarize(stalls)
+    return results
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    arg_parser.add_argument(
+        "-n", type=int, default=50, help="repetitions per widget class"
+    )
+    arg_parser.add_argument(
+        "--form-size", type=int, default=200, help="parameters of the form"
+    )
+    arg_parser.add_argument(
+        "--form-repeat", type=int, default=5, help="repetitions of the form"
+    )
+    arg_parser.add_argument(
+        "--filter",
+        default="",
+        help="only benchmark the widget classes containing this text",
+    )
+    arg_parser.add_argument("--json", help="write the results to this file")
+    arg_parser.add_argument(
+        "--save-baseline", help="write the results as a baseline to this file"
+    )
+    arg_parser.add_argument("--baseline", help="compare the results with this baseline")
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="the allowed slowdown relative to the baseline (default: 0.2, i.e. 20%%)",
+    )
+    args = arg_parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    factory = ParameterWidgetFactory()
+
+    results = OrderedDict()
+    errors = OrderedDict()
+    for name in BASIC_PARAMETER_WIDGETS:
+        if args.filter and args.filter not in name:
+            continue
+        try:
+            results[f"construct[{name}]"] = summarize(
+                bench_construct(app, factory, name, args.n)
+            )
+            widget = factory._create_widget(name, **widget_kwargs(name, "p"))
+            _, value = WIDGET_SAMPLES.get(name, ({}, None))
+            results[f"roundtrip[{name}]"] = summarize(
+                bench_roundtrip(widget, value, args.n)
+            )
+            dispose(app, [widget])
+            results[f"show[{name}]"] = summarize(bench_show(app, factory, name, args.n))
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+
+    if args.form_size > 0 and not args.filter:
+        form = make_form(args.form_size)
+        results.update(bench_form(app, factory, form, args.form_repeat))
+        results.update(bench_pipeline(app, factory, form, args.form_repeat))
+
+    print_table(results, ["p50", "p90", "p99", "mean"])
+    for name, error in errors.items():
+        print(f"{name}: {error}", file=sys.stderr)
+
+    report = make_report("widgets", results)
+    report["environment"]["qt"] = QT_VERSION_STR
+    report["environment"]["pyqt"] = PYQT_VERSION_STR
+    report["environment"]["qpa_platform"] = os.environ.get("QT_QPA_PLATFORM", "")
+    report["errors"] = errors
+    if args.json:
+        write_json(args.json, report)
+    if args.save_baseline:
+        write_json(args.save_baseline, report)
+
+    if args.baseline:
+        regressions = find_regressions(
+            results, load_baseline(args.baseline), args.threshold
+        )
+        if regressions:
+            print(
+                f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%} "
+                f"({BASELINE_METRIC}):",
+                file=sys.stderr,
+            )
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            return 1
+        print(f"\nno regression over {args.threshold:.0%} ({BASELINE_METRIC})")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
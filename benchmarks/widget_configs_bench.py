@@ -0,0 +1,103 @@
+"""
+benchmark the widget configs block extraction.
+
+compares the legacy regex based extraction (search + sub + search) with the single-pass scanner over synthetic
+docstrings of growing length.
+
+usage: python -m benchmarks.widget_configs_bench [--count 10000] [--repeat 3]
+"""
+
+import argparse
+import re
+import time
+from typing import List, Tuple
+
+from function2widgets.parser.widgetconfigs_parser import WidgetConfigsParser
+
+LEGACY_WIDGET_CONFIGS_BLOCK_PATTERN = re.compile(
+    r"^(\s*@widgets\s*(.*\n.+)^\s*@end\s*\n)", re.MULTILINE | re.DOTALL
+)
+
+
+def legacy_split(raw_docstring_text: str) -> Tuple[str, str]:
+    match = LEGACY_WIDGET_CONFIGS_BLOCK_PATTERN.search(raw_docstring_text)
+    if match:
+        docstring_text = LEGACY_WIDGET_CONFIGS_BLOCK_PATTERN.sub("", raw_docstring_text)
+    else:
+        docstring_text = raw_docstring_text
+    match = LEGACY_WIDGET_CONFIGS_BLOCK_PATTERN.search(raw_docstring_text)
+    if not match:
+        return docstring_text, ""
+    return docstring_text, match.group(2)
+
+
+def single_pass_split(raw_docstring_text: str) -> Tuple[str, str]:
+    return WidgetConfigsParser.split_widget_configs_block(raw_docstring_text)
+
+
+def make_docstring(index: int, params: int) -> str:
+    indent = "    "
+    lines = [f"function #{index} with {params} parameters.", ""]
+    lines.extend(
+        f":param arg{i}: description of the parameter arg{i}" for i in range(params)
+    )
+    lines.append(":return: nothing")
+    lines.append("")
+    lines.append("@widgets")
+    for i in range(params):
+        lines.append(f"[arg{i}]")
+        lines.append('widget_class = "IntSpinBox"')
+        lines.append(f"default = {i}")
+        lines.append("")
+    lines.append("@end")
+    return (
+        "\n"
+        + "\n".join(indent + line if line else "" for line in lines)
+        + "\n"
+        + indent
+    )
+
+
+def make_docstrings(count: int) -> List[str]:
+    # the docstrings grow from 1 parameter up to 100 parameters
+    return [make_docstring(i, 1 + i * 100 // count) for i in range(count)]
+
+
+def run(func, docstrings: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for docstring in docstrings:
+            func(docstring)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def check(docstrings: List[str]):
+    for docstring in docstrings:
+        legacy_text, legacy_block = legacy_split(docstring)
+        text, block = single_pass_split(docstring)
+        if legacy_block.strip() != block.strip() or legacy_text.split() != text.split():
+            raise AssertionError(f"results differ for docstring:\n{docstring}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--count", type=int, default=10000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    docstrings = make_docstrings(args.count)
+    check(docstrings)
+    total_chars = sum(len(d) for d in docstrings)
+    print(f"{len(docstrings)} docstrings, {total_chars} characters in total")
+
+    legacy = run(legacy_split, docstrings, args.repeat)
+    single_pass = run(single_pass_split, docstrings, args.repeat)
+    print(f"legacy regex : {legacy:.4f}s")
+    print(f"single pass  : {single_pass:.4f}s")
+    print(f"speedup      : {legacy / single_pass:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
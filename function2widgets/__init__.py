@@ -1,10 +1,86 @@
-from .factory import ParameterWidgetFactory
-from .info import (
-    FunctionInfo,
-    ParameterInfo,
-    ParameterWidgetInfo,
-    FunctionDocstringInfo,
-)
-from .widget import BaseWidgetArgs, BaseParameterWidget
-from .parser import *
-from .widgets import *
+from typing import TYPE_CHECKING
+
+from ._lazyimport import lazy_attributes
+from . import parser, widgets
+
+if TYPE_CHECKING:
+    from .factory import ParameterWidgetFactory
+    from .form import ParameterForm
+    from .history import ValueHistory, HistoryEntry
+    from .lazy import LazyParameterWidget
+    from .panel import VirtualParameterPanel
+    from .pipeline import WidgetPipeline, WidgetBuildJob
+    from .pool import WidgetPool
+    from .watcher import FunctionWatcher
+    from .preset import PresetStore, PresetInfo, function_key
+    from .diff import (
+        FunctionInfoDiff,
+        ParameterDiff,
+        diff_function_info,
+    )
+    from .spec import (
+        SpecError,
+        compile_function_spec,
+        function_info_from_spec,
+        dumps_spec,
+        loads_spec,
+        write_spec_file,
+        read_spec_file,
+    )
+    from .info import (
+        FunctionInfo,
+        FunctionParseResult,
+        ParameterInfo,
+        ParameterWidgetInfo,
+        FunctionDocstringInfo,
+    )
+    from .widget import (
+        BaseWidgetArgs,
+        BaseParameterWidget,
+        WidgetArgsBuilder,
+        WidgetArgsError,
+    )
+    from .parser import *
+    from .widgets import *
+
+# the modules are imported when their attributes are accessed for the first time, so that scripts that only need
+# the parser or a few widgets do not pay for importing all the widgets (and PyQt6.Qsci)
+_LAZY_ATTRIBUTES = {
+    "ParameterWidgetFactory": ".factory",
+    "ParameterForm": ".form",
+    "ValueHistory": ".history",
+    "HistoryEntry": ".history",
+    "LazyParameterWidget": ".lazy",
+    "VirtualParameterPanel": ".panel",
+    "WidgetPipeline": ".pipeline",
+    "WidgetBuildJob": ".pipeline",
+    "WidgetPool": ".pool",
+    "FunctionWatcher": ".watcher",
+    "PresetStore": ".preset",
+    "PresetInfo": ".preset",
+    "function_key": ".preset",
+    "FunctionInfoDiff": ".diff",
+    "ParameterDiff": ".diff",
+    "diff_function_info": ".diff",
+    "SpecError": ".spec",
+    "compile_function_spec": ".spec",
+    "function_info_from_spec": ".spec",
+    "dumps_spec": ".spec",
+    "loads_spec": ".spec",
+    "write_spec_file": ".spec",
+    "read_spec_file": ".spec",
+    "FunctionInfo": ".info",
+    "FunctionParseResult": ".info",
+    "ParameterInfo": ".info",
+    "ParameterWidgetInfo": ".info",
+    "FunctionDocstringInfo": ".info",
+    "BaseWidgetArgs": ".widget",
+    "BaseParameterWidget": ".widget",
+    "WidgetArgsBuilder": ".widget",
+    "WidgetArgsError": ".widget",
+}
+_LAZY_ATTRIBUTES.update(dict.fromkeys(parser.__all__, ".parser"))
+_LAZY_ATTRIBUTES.update(dict.fromkeys(widgets.__all__, ".widgets"))
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
@@ -0,0 +1,39 @@
+"""
+lazy attribute loading for the packages of function2widgets (PEP 562)
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    package_name: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    create the module level __getattr__ and __dir__ functions of a package, which import the module defining an
+    attribute when the attribute is accessed for the first time.
+
+    usage (in the __init__.py of the package):
+        __getattr__, __dir__ = lazy_attributes(__name__, {"LineEdit": ".stredit"})
+        __all__ = [...]
+
+    :param package_name: the __name__ of the package
+    :param attributes: attribute name -> the name of the module that defines it, relative to the package
+    :return: (__getattr__, __dir__)
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name, None)
+        if module_name is None:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        module = importlib.import_module(module_name, package_name)
+        value = getattr(module, name)
+        # later accesses do not go through __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(attributes))
+
+    return __getattr__, __dir__
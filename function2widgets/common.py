@@ -3,10 +3,10 @@ import logging
 import os.path
 import re
 import warnings
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, TYPE_CHECKING
 
-import tomli
-from PyQt6.QtCore import QDateTime, QDate, QTime
+if TYPE_CHECKING:
+    from PyQt6.QtCore import QDateTime, QDate, QTime
 
 TYPING_ANNOTATION_PATTERN = re.compile(r"^(typing\..+?)(\[.+])*$")
 
@@ -19,6 +19,19 @@ class AlreadyRegisteredError(Exception):
     pass
 
 
+def values_equal(a: Any, b: Any) -> bool:
+    """
+    compare two default values or widget args, the values that cannot be compared (or whose comparison does not
+    return a bool, e.g. arrays) are considered different unless they are the same object
+    """
+    if a is b:
+        return True
+    try:
+        return bool(type(a) is type(b) and a == b)
+    except Exception:
+        return False
+
+
 def safe_del(target: dict, key: str, *more_keys: str) -> dict:
     if not more_keys:
         if key in target:
@@ -73,6 +86,9 @@ def safe_eval(literal: str) -> str:
 
 
 def load_toml(toml_str: str, error_on_fail: bool = True) -> Dict[str, Any]:
+    # tomli is imported on first use, most docstrings do not have a widget configs block
+    import tomli
+
     try:
         return tomli.loads(toml_str)
     except BaseException as e:
@@ -98,13 +114,22 @@ def parse_type_info(annotation_str: str) -> (str, Optional[List[str]]):
     return typename, type_extras
 
 
-def to_datetime(datetime_str: str, datetime_format: str) -> QDateTime:
+# the Qt types are imported on first use, so that the parser does not depend on Qt
+
+
+def to_datetime(datetime_str: str, datetime_format: str) -> "QDateTime":
+    from PyQt6.QtCore import QDateTime
+
     return QDateTime.fromString(datetime_str, datetime_format)
 
 
-def to_date(date_str: str, date_format: str) -> QDate:
+def to_date(date_str: str, date_format: str) -> "QDate":
+    from PyQt6.QtCore import QDate
+
     return QDate.fromString(date_str, date_format)
 
 
-def to_time(time_str: str, time_format: str) -> QTime:
+def to_time(time_str: str, time_format: str) -> "QTime":
+    from PyQt6.QtCore import QTime
+
     return QTime.fromString(time_str, time_format)
@@ -0,0 +1,173 @@
+import dataclasses
+from typing import Any, Dict, List, Optional
+
+from function2widgets.common import values_equal
+from function2widgets.info import FunctionInfo, ParameterInfo, ParameterWidgetInfo
+from function2widgets.parser.function_parser import FunctionInfoParser
+from function2widgets.parser.widget_resolver import WidgetTypeResolver
+
+
+@dataclasses.dataclass
+class ParameterDiff(object):
+    name: str
+    old: Optional[ParameterInfo]
+    new: Optional[ParameterInfo]
+    # the names of the fields of the ParameterInfo that differ, except the widget, e.g. "typename" and "default"
+    changes: List[str] = dataclasses.field(default_factory=list)
+    # the names of the widget args that differ, and "widget_class" if the widget class differs
+    widget_changes: List[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def added(self) -> bool:
+        return self.old is None
+
+    @property
+    def removed(self) -> bool:
+        return self.new is None
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.changes or self.widget_changes)
+
+    @property
+    def widget_changed(self) -> bool:
+        """
+        whether the widget of the parameter must be created, or rebuilt (or reconfigured)
+        """
+        return self.added or bool(self.widget_changes)
+
+    @property
+    def type_changed(self) -> bool:
+        return "typename" in self.changes
+
+
+@dataclasses.dataclass
+class FunctionInfoDiff(object):
+    # in the order of the new parameters, followed by the removed parameters
+    parameters: List[ParameterDiff]
+    order_changed: bool = False
+
+    @property
+    def added(self) -> List[str]:
+        return [diff.name for diff in self.parameters if diff.added]
+
+    @property
+    def removed(self) -> List[str]:
+        return [diff.name for diff in self.parameters if diff.removed]
+
+    @property
+    def changed(self) -> List[str]:
+        return [
+            diff.name
+            for diff in self.parameters
+            if not diff.added and not diff.removed and diff.changed
+        ]
+
+    @property
+    def unchanged(self) -> List[str]:
+        return [
+            diff.name
+            for diff in self.parameters
+            if not diff.added and not diff.removed and not diff.changed
+        ]
+
+    def get(self, param_name: str) -> Optional[ParameterDiff]:
+        for diff in self.parameters:
+            if diff.name == param_name:
+                return diff
+        return None
+
+    def __bool__(self) -> bool:
+        return self.order_changed or any(
+            diff.added or diff.removed or diff.changed for diff in self.parameters
+        )
+
+
+def diff_parameter_info(
+    old: ParameterInfo,
+    new: ParameterInfo,
+    type_resolver: Optional[WidgetTypeResolver] = None,
+) -> ParameterDiff:
+    """
+    compare two versions of a parameter
+    :param old:
+    :param new:
+    :param type_resolver: the resolver used for the parameters without widget info
+    :return:
+    """
+    diff = ParameterDiff(new.name, old, new)
+    for field in ("typename", "type_extras", "default", "description"):
+        if not values_equal(getattr(old, field), getattr(new, field)):
+            diff.changes.append(field)
+
+    old_widget = _widget_info(old, type_resolver)
+    new_widget = _widget_info(new, type_resolver)
+    if old_widget.widget_class != new_widget.widget_class:
+        diff.widget_changes.append("widget_class")
+    placeholder = object()
+    for key in list(old_widget.widget_args) + [
+        key for key in new_widget.widget_args if key not in old_widget.widget_args
+    ]:
+        old_value = old_widget.widget_args.get(key, placeholder)
+        new_value = new_widget.widget_args.get(key, placeholder)
+        if not values_equal(old_value, new_value):
+            diff.widget_changes.append(key)
+    return diff
+
+
+def diff_function_info(
+    old: FunctionInfo,
+    new: FunctionInfo,
+    type_resolver: Optional[WidgetTypeResolver] = None,
+) -> FunctionInfoDiff:
+    """
+    compare two versions of a function parameter by parameter, e.g. the ones parsed before and after the
+    module of the function is reloaded. the parameters are matched by name.
+    :param old:
+    :param new:
+    :param type_resolver: the resolver used for the parameters without widget info, default_widget_resolver()
+    if it is None
+    :return:
+    """
+    return diff_parameters(old.parameters, new.parameters, type_resolver)
+
+
+def diff_parameters(
+    old_parameters: List[ParameterInfo],
+    new_parameters: List[ParameterInfo],
+    type_resolver: Optional[WidgetTypeResolver] = None,
+) -> FunctionInfoDiff:
+    """
+    see diff_function_info()
+    """
+    old_params: Dict[str, ParameterInfo] = {
+        param.name: param for param in old_parameters
+    }
+    new_params: Dict[str, ParameterInfo] = {
+        param.name: param for param in new_parameters
+    }
+
+    parameters = []
+    for name, new_param in new_params.items():
+        old_param = old_params.get(name, None)
+        if old_param is None:
+            parameters.append(ParameterDiff(name, None, new_param))
+        else:
+            parameters.append(diff_parameter_info(old_param, new_param, type_resolver))
+    for name, old_param in old_params.items():
+        if name not in new_params:
+            parameters.append(ParameterDiff(name, old_param, None))
+
+    kept_old_order = [name for name in old_params if name in new_params]
+    kept_new_order = [name for name in new_params if name in old_params]
+    return FunctionInfoDiff(
+        parameters=parameters, order_changed=kept_old_order != kept_new_order
+    )
+
+
+def _widget_info(
+    param_info: ParameterInfo, type_resolver: Optional[WidgetTypeResolver]
+) -> ParameterWidgetInfo:
+    if param_info.widget:
+        return param_info.widget
+    return FunctionInfoParser.make_default_param_widget_info(param_info, type_resolver)
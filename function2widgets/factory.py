@@ -1,81 +1,394 @@
-from typing import Type, Dict
+import logging
+from typing import Type, Dict, Optional, Any, Tuple, Union, Iterable, Mapping
 
 from PyQt6.QtWidgets import QApplication
 
 from function2widgets.common import (
     AlreadyRegisteredError,
     NotRegisteredError,
+    values_equal,
 )
+from function2widgets.form import ParameterForm
 from function2widgets.info import ParameterInfo, FunctionInfo
-from function2widgets.parser.function_parser import FunctionInfoParser
-from function2widgets.widget import BaseParameterWidget, BaseWidgetArgs
-from function2widgets.widgets.allwidgets import BASIC_PARAMETER_WIDGETS
+from function2widgets.lazy import LazyParameterWidget
+from function2widgets.pool import WidgetPool
+from function2widgets.spec import function_info_from_spec
+from function2widgets.diff import diff_function_info
+from function2widgets.parser.function_parser import (
+    FunctionInfoParser,
+    default_widget_resolver,
+)
+from function2widgets.parser.widget_resolver import WidgetTypeResolver, TypePredicate
+from function2widgets.widget import (
+    BaseParameterWidget,
+    BaseWidgetArgs,
+    WidgetArgsBuilder,
+)
+from function2widgets.widgets.allwidgets import (
+    BASIC_PARAMETER_WIDGETS,
+    LazyWidgetRegistry,
+)
+from function2widgets.widgets.base import CommonParameterWidget
+
+# the value of a widget is not carried over to its updated widget
+_NO_VALUE = object()
 
 
 class ParameterWidgetFactory(object):
-    def __init__(self, register_basic_parameter_widgets: bool = True):
+    def __init__(
+        self,
+        register_basic_parameter_widgets: bool = True,
+        type_resolver: Optional[WidgetTypeResolver] = None,
+        widget_pool: Optional[WidgetPool] = None,
+    ):
+        """
+        :param register_basic_parameter_widgets:
+        :param type_resolver: the resolver that maps types to widget classes, default_widget_resolver() is used
+        if it is not given. pass the same resolver to FunctionInfoParser to make the types registered here
+        apply to the parsed functions.
+        :param widget_pool: the pool of the released widgets, the widgets created by the factory are taken from
+        the pool when possible. widgets are released to the pool with release_widget() or release_widgets().
+        """
         self._widget_classes = {}
+        # widget class name -> the registry that has the widget class, the widget class is taken from the
+        # registry (i.e. its module is imported) when it is used for the first time
+        self._lazy_widget_classes: Dict[str, LazyWidgetRegistry] = {}
+        self._args_builders: Dict[Type[BaseParameterWidget], WidgetArgsBuilder] = {}
+        if type_resolver is None:
+            type_resolver = default_widget_resolver()
+        self._type_resolver: WidgetTypeResolver = type_resolver
+        self._widget_pool: Optional[WidgetPool] = widget_pool
 
         if register_basic_parameter_widgets:
             self.register_all(BASIC_PARAMETER_WIDGETS)
 
     def register(self, widget_class_name: str, widget_class: Type[BaseParameterWidget]):
-        if widget_class_name in self._widget_classes:
+        if self.is_registered(widget_class_name):
             raise AlreadyRegisteredError(
                 QApplication.tr(f"widget type {widget_class_name} already registered")
             )
         self._widget_classes[widget_class_name] = widget_class
 
-    def register_all(self, widgets: Dict[str, Type[BaseParameterWidget]]):
+    def register_all(self, widgets: Mapping[str, Type[BaseParameterWidget]]):
+        if isinstance(widgets, LazyWidgetRegistry):
+            for widget_class_name in widgets:
+                if widgets.is_loaded(widget_class_name):
+                    self.register(widget_class_name, widgets[widget_class_name])
+                elif self.is_registered(widget_class_name):
+                    raise AlreadyRegisteredError(
+                        QApplication.tr(
+                            f"widget type {widget_class_name} already registered"
+                        )
+                    )
+                else:
+                    self._lazy_widget_classes[widget_class_name] = widgets
+            return
         for widget_class_name, widget_class in widgets.items():
             self.register(widget_class_name, widget_class)
 
     def unregister(self, widget_class_name: str):
-        if widget_class_name not in self._widget_classes:
+        if not self.is_registered(widget_class_name):
             raise NotRegisteredError(
                 QApplication.tr(f"widget type {widget_class_name} not registered")
             )
-        del self._widget_classes[widget_class_name]
+        if self._lazy_widget_classes.pop(widget_class_name, None) is not None:
+            return
+        widget_class = self._widget_classes.pop(widget_class_name)
+        self._args_builders.pop(widget_class, None)
 
     def is_registered(self, widget_class_name: str) -> bool:
-        return widget_class_name in self._widget_classes
+        return (
+            widget_class_name in self._widget_classes
+            or widget_class_name in self._lazy_widget_classes
+        )
 
     def get_widget_class(self, widget_class_name: str) -> Type[BaseParameterWidget]:
-        if not self.is_registered(widget_class_name):
+        widget_class = self._widget_classes.get(widget_class_name, None)
+        if widget_class is not None:
+            return widget_class
+        registry = self._lazy_widget_classes.get(widget_class_name, None)
+        if registry is None:
             raise NotRegisteredError(
                 QApplication.tr(f"widget type {widget_class_name} not registered")
             )
-        return self._widget_classes[widget_class_name]
+        widget_class = registry[widget_class_name]
+        self._widget_classes[widget_class_name] = widget_class
+        del self._lazy_widget_classes[widget_class_name]
+        return widget_class
 
     def clear(self):
         self._widget_classes.clear()
+        self._lazy_widget_classes.clear()
+        self._args_builders.clear()
 
-    def create_widget_for_parameter(
-        self, param_info: ParameterInfo
-    ) -> BaseParameterWidget:
-        param_widget_info = param_info.widget
-        if not param_widget_info:
-            param_widget_info = FunctionInfoParser.make_default_param_widget_info(
-                param_info
-            )
+    @property
+    def type_resolver(self) -> WidgetTypeResolver:
+        return self._type_resolver
+
+    @property
+    def widget_pool(self) -> Optional[WidgetPool]:
+        return self._widget_pool
+
+    def register_type(
+        self,
+        type_: Any,
+        widget_class_name: str,
+        default_args: Optional[Dict[str, Any]] = None,
+        replace: bool = False,
+    ):
+        """
+        use the widget class widget_class_name for the parameters annotated with type_ or its subclasses
+        :param type_:
+        :param widget_class_name:
+        :param default_args: the widget args applied before the ones derived from the parameter
+        :param replace:
+        :return:
+        """
+        self._type_resolver.register_type(
+            type_, widget_class_name, default_args=default_args, replace=replace
+        )
 
-        widget = self._create_widget(
-            widget_class_name=param_widget_info.widget_class,
-            **param_widget_info.widget_args,
+    def register_type_rule(
+        self,
+        predicate: TypePredicate,
+        widget_class_name: str,
+        default_args: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        use the widget class widget_class_name for the parameters whose annotation satisfies predicate
+        :param predicate:
+        :param widget_class_name:
+        :param default_args: the widget args applied before the ones derived from the parameter
+        :return:
+        """
+        self._type_resolver.register_type_rule(
+            predicate, widget_class_name, default_args=default_args
         )
-        return widget
+
+    def create_widget_for_parameter(
+        self, param_info: ParameterInfo, lazy: bool = False
+    ) -> BaseParameterWidget:
+        """
+        :param param_info:
+        :param lazy: return a LazyParameterWidget, which creates the real widget when it is painted or accessed
+        for the first time
+        :return:
+        """
+        widget_class, widget_args = self.create_widget_args_for_parameter(param_info)
+        if lazy:
+            return LazyParameterWidget(widget_class, widget_args, parent=None)
+        return self._new_widget(widget_class, widget_args)
 
     def create_widgets_for_function(
-        self, func_info: FunctionInfo
+        self, func_info: FunctionInfo, lazy: bool = False
     ) -> Dict[str, BaseParameterWidget]:
+        """
+        :param func_info:
+        :param lazy: create LazyParameterWidgets, which is much faster for functions with lots of parameters
+        :return:
+        """
         widgets = {}
         for param_info in func_info.parameters:
-            widget = self.create_widget_for_parameter(param_info)
+            widget = self.create_widget_for_parameter(param_info, lazy=lazy)
             widgets[param_info.name] = widget
         return widgets
 
+    def create_form_for_function(
+        self, func_info: FunctionInfo, lazy: bool = False
+    ) -> ParameterForm:
+        """
+        create the widgets of a function and wrap them in a ParameterForm
+        :param func_info:
+        :param lazy: see create_widgets_for_function()
+        :return:
+        """
+        return ParameterForm(self.create_widgets_for_function(func_info, lazy=lazy))
+
+    def create_widgets_for_spec(
+        self, spec: Dict[str, Any], lazy: bool = False
+    ) -> Dict[str, BaseParameterWidget]:
+        """
+        create the widgets from a compiled spec (see function2widgets.spec), without parsing the function
+        :param spec: the spec, e.g. the one returned by read_spec_file()
+        :param lazy: see create_widgets_for_function()
+        :return:
+        :raise SpecError: if spec is not a spec of a supported version
+        """
+        return self.create_widgets_for_function(
+            function_info_from_spec(spec), lazy=lazy
+        )
+
+    def update_widgets_for_function(
+        self,
+        widgets: Dict[str, BaseParameterWidget],
+        old_func_info: FunctionInfo,
+        new_func_info: FunctionInfo,
+        keep_values: bool = True,
+        lazy: bool = False,
+    ) -> Dict[str, BaseParameterWidget]:
+        """
+        update the widgets created for old_func_info to new_func_info, e.g. after the module of the function is
+        reloaded, instead of creating all the widgets again.
+
+        the widgets of the unchanged parameters are kept as they are. the widget of a parameter whose widget
+        class or widget args changed is reconfigured if possible, otherwise it is replaced by a new widget (in
+        the layout of its parent too, if it has one) and released. the widgets of the removed parameters are
+        released. the widgets of the new parameters are created, it is up to the caller to put them into the form.
+        :param widgets: the widgets of old_func_info, parameter name -> widget
+        :param old_func_info:
+        :param new_func_info:
+        :param keep_values: keep the values entered by the user if the typename of the parameter is unchanged and
+        the updated widget accepts the value. the values equal to the old default value are not kept, so that the
+        updated widgets show the new default values. a value rejected by the updated widget (with a ValueError or
+        a TypeError) is logged and dropped, the other errors are raised.
+        :param lazy: create LazyParameterWidgets for the new and replaced parameters
+        :return: the widgets of new_func_info, in the order of its parameters
+        """
+        diff = diff_function_info(old_func_info, new_func_info, self._type_resolver)
+        updated = {}
+        for param_diff in diff.parameters:
+            widget = widgets.get(param_diff.name, None)
+            if param_diff.removed:
+                if widget is not None:
+                    self.release_widget(widget)
+                continue
+            if widget is None:
+                updated[param_diff.name] = self.create_widget_for_parameter(
+                    param_diff.new, lazy=lazy
+                )
+            elif param_diff.widget_changed:
+                keep_value = keep_values and not param_diff.type_changed
+                updated[param_diff.name] = self._update_widget(
+                    widget, param_diff.new, keep_value, lazy
+                )
+            else:
+                updated[param_diff.name] = widget
+        return updated
+
+    def release_widget(self, widget: BaseParameterWidget):
+        """
+        release a widget created by the factory that is no longer used. the widget is put into the widget pool
+        if possible, otherwise it is deleted.
+        :param widget:
+        :return:
+        """
+        if isinstance(widget, LazyParameterWidget):
+            widget.deleteLater()
+            return
+        if self._widget_pool is None or not self._widget_pool.release(widget):
+            widget.hide()
+            widget.deleteLater()
+
+    def release_widgets(
+        self,
+        widgets: Union[Dict[str, BaseParameterWidget], Iterable[BaseParameterWidget]],
+    ):
+        """
+        release the widgets, e.g. the ones created by create_widgets_for_function(), see release_widget()
+        :param widgets:
+        :return:
+        """
+        if isinstance(widgets, dict):
+            widgets = widgets.values()
+        for widget in list(widgets):
+            self.release_widget(widget)
+
+    def create_widget_args(self, widget_class_name: str, **kwargs) -> BaseWidgetArgs:
+        """
+        create the (normalized) args for the widget class widget_class_name
+        :param widget_class_name:
+        :param kwargs: the widget args
+        :return:
+        :raise WidgetArgsError: if some of the widget args are unknown to the widget class or missing
+        """
+        widget_class = self.get_widget_class(widget_class_name)
+        return self._get_args_builder(widget_class).build(kwargs)
+
+    def create_widget_args_for_parameter(
+        self, param_info: ParameterInfo
+    ) -> Tuple[Type[BaseParameterWidget], BaseWidgetArgs]:
+        """
+        get the widget class of the parameter and create its (normalized) args, without creating the widget
+        :param param_info:
+        :return: (widget class, widget args)
+        """
+        param_widget_info = param_info.widget
+        if not param_widget_info:
+            param_widget_info = FunctionInfoParser.make_default_param_widget_info(
+                param_info, self._type_resolver
+            )
+        widget_class = self.get_widget_class(param_widget_info.widget_class)
+        widget_args = self._get_args_builder(widget_class).build(
+            param_widget_info.widget_args
+        )
+        return widget_class, widget_args
+
+    def _get_args_builder(
+        self, widget_class: Type[BaseParameterWidget]
+    ) -> WidgetArgsBuilder:
+        builder = self._args_builders.get(widget_class, None)
+        if builder is None:
+            builder = WidgetArgsBuilder(widget_class)
+            self._args_builders[widget_class] = builder
+        return builder
+
     def _create_widget(self, widget_class_name: str, **kwargs) -> BaseParameterWidget:
         widget_class = self.get_widget_class(widget_class_name)
-        widget_args_class: Type[BaseWidgetArgs] = widget_class.widget_args_class()
-        widget_args = widget_args_class.new(kwargs=kwargs)
+        widget_args = self._get_args_builder(widget_class).build(kwargs)
+        return self._new_widget(widget_class, widget_args)
+
+    def _update_widget(
+        self,
+        widget: BaseParameterWidget,
+        param_info: ParameterInfo,
+        keep_value: bool,
+        lazy: bool,
+    ) -> BaseParameterWidget:
+        value = _NO_VALUE
+        if keep_value:
+            try:
+                value = widget.get_value()
+            except (ValueError, TypeError) as e:
+                # the value entered by the user is invalid, there is nothing to keep
+                logging.debug(f"value of parameter '{param_info.name}' not kept: {e}")
+            else:
+                if values_equal(value, widget.default):
+                    value = _NO_VALUE
+
+        widget_class, widget_args = self.create_widget_args_for_parameter(param_info)
+        if (
+            type(widget) is widget_class
+            and isinstance(widget, CommonParameterWidget)
+            and widget.can_reconfigure(widget_args)
+        ):
+            widget.reconfigure(widget_args)
+            new_widget = widget
+        else:
+            if lazy:
+                new_widget = LazyParameterWidget(widget_class, widget_args, parent=None)
+            else:
+                new_widget = self._new_widget(widget_class, widget_args)
+            parent = widget.parentWidget()
+            if parent is not None and parent.layout() is not None:
+                parent.layout().replaceWidget(widget, new_widget)
+            self.release_widget(widget)
+
+        if value is not _NO_VALUE:
+            try:
+                new_widget.set_value(value)
+            except (ValueError, TypeError) as e:
+                # the value is not accepted by the updated widget, which keeps its default value
+                logging.warning(
+                    f"value of parameter '{param_info.name}' not kept: {value!r} is rejected by the updated "
+                    f"widget: {e}"
+                )
+        return new_widget
+
+    def _new_widget(
+        self, widget_class: Type[BaseParameterWidget], widget_args: BaseWidgetArgs
+    ) -> BaseParameterWidget:
+        if self._widget_pool is not None:
+            widget = self._widget_pool.acquire(widget_class, widget_args)
+            if widget is not None:
+                return widget
         return widget_class(args=widget_args, parent=None)
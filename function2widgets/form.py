@@ -0,0 +1,139 @@
+import contextlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from PyQt6.QtWidgets import QWidget
+
+from function2widgets.common import values_equal
+from function2widgets.widget import BaseParameterWidget
+
+
+class ParameterForm(object):
+    """
+    a form made of the widgets of a function, e.g. the ones created by
+    ParameterWidgetFactory.create_widgets_for_function(), with bulk operations on the values of all the widgets.
+
+    restore() sets the values of the widgets whose value differs from the new one only. while the values are set,
+    the signals of the parameter widgets are blocked and the updates (repaints) of their parents are disabled, so
+    the form is repainted once. the signals of the child widgets inside the parameter widgets are not blocked,
+    the parameter widgets rely on them to keep their child widgets in sync.
+    """
+
+    def __init__(self, widgets: Mapping[str, BaseParameterWidget]):
+        """
+        :param widgets: parameter name -> widget, in the order of the parameters
+        """
+        self._widgets: Dict[str, BaseParameterWidget] = OrderedDict(widgets)
+
+    def widgets(self) -> Dict[str, BaseParameterWidget]:
+        return OrderedDict(self._widgets)
+
+    def widget(self, parameter_name: str) -> BaseParameterWidget:
+        return self._widgets[parameter_name]
+
+    def parameter_names(self) -> List[str]:
+        return list(self._widgets)
+
+    def __getitem__(self, parameter_name: str) -> BaseParameterWidget:
+        return self._widgets[parameter_name]
+
+    def __contains__(self, parameter_name: object) -> bool:
+        return parameter_name in self._widgets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._widgets)
+
+    def __len__(self) -> int:
+        return len(self._widgets)
+
+    def defaults(self) -> Dict[str, Any]:
+        """
+        the default values of the parameters
+        :return:
+        """
+        return OrderedDict(
+            (parameter_name, widget.default)
+            for parameter_name, widget in self._widgets.items()
+        )
+
+    def snapshot(self, ignore_errors: bool = False) -> Dict[str, Any]:
+        """
+        get the values of all the parameters, e.g. the arguments to call the function with
+        :param ignore_errors: leave out the parameters whose value is invalid instead of raising the error
+        :return: parameter name -> value, in the order of the parameters
+        """
+        values = OrderedDict()
+        for parameter_name, widget in self._widgets.items():
+            try:
+                values[parameter_name] = widget.get_value()
+            except ValueError:
+                if not ignore_errors:
+                    raise
+        return values
+
+    def restore(self, values: Mapping[str, Any], strict: bool = False) -> List[str]:
+        """
+        set the values of the parameters, e.g. the ones returned by snapshot() or loaded from a preset. only the
+        widgets whose current value differs from the new one are set.
+        :param values: parameter name -> value, the parameters not in values are not changed
+        :param strict: raise KeyError for the unknown parameters in values instead of ignoring them
+        :return: the names of the parameters whose value is set
+        :raise ValueError: if a value is rejected by its widget, the values before it are set already
+        """
+        if strict:
+            unknown = [name for name in values if name not in self._widgets]
+            if unknown:
+                raise KeyError(f"no such parameters: {', '.join(unknown)}")
+
+        changes = []
+        for parameter_name, value in values.items():
+            widget = self._widgets.get(parameter_name, None)
+            if widget is None:
+                continue
+            try:
+                current = widget.get_value()
+            except ValueError:
+                # the current input is invalid, so it differs from any value
+                changes.append((parameter_name, widget, value))
+                continue
+            if not values_equal(current, value):
+                changes.append((parameter_name, widget, value))
+
+        if not changes:
+            return []
+        with self.bulk_update([widget for _, widget, _ in changes]):
+            for _, widget, value in changes:
+                widget.set_value(value)
+        return [parameter_name for parameter_name, _, _ in changes]
+
+    def reset(self) -> List[str]:
+        """
+        set all the parameters to their default values
+        :return: the names of the parameters whose value is set
+        """
+        return self.restore(self.defaults())
+
+    @contextlib.contextmanager
+    def bulk_update(self, widgets: Optional[List[BaseParameterWidget]] = None):
+        """
+        block the signals of the widgets and disable the updates of their parents while changing them
+        :param widgets: the widgets to change, all the widgets of the form if it is None
+        :return:
+        """
+        if widgets is None:
+            widgets = list(self._widgets.values())
+        blocked = [(widget, widget.blockSignals(True)) for widget in widgets]
+        containers: Dict[int, QWidget] = {}
+        for widget in widgets:
+            container = widget.parentWidget() or widget
+            if container.updatesEnabled():
+                containers.setdefault(id(container), container)
+        for container in containers.values():
+            container.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for widget, was_blocked in blocked:
+                widget.blockSignals(was_blocked)
+            for container in containers.values():
+                container.setUpdatesEnabled(True)
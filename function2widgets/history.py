@@ -0,0 +1,349 @@
+import functools
+import sys
+import time
+from collections import deque, namedtuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, pyqtBoundSignal, pyqtSignal
+
+from function2widgets.common import values_equal
+from function2widgets.form import ParameterForm
+from function2widgets.lazy import LazyParameterWidget
+from function2widgets.widget import BaseParameterWidget
+
+# a change of the value of a parameter
+HistoryEntry = namedtuple("HistoryEntry", ["parameter_name", "old", "new"])
+
+# the estimated memory of an entry besides its values
+_ENTRY_OVERHEAD = 200
+
+
+def _estimate_size(value: Any) -> int:
+    # the memory of the value, including the items of the (nested) containers
+    size = sys.getsizeof(value, 64)
+    if isinstance(value, (str, bytes)):
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            _estimate_size(key) + _estimate_size(item) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(_estimate_size(item) for item in value)
+    return size
+
+
+class _Record(object):
+    __slots__ = ("parameter_name", "old", "new", "time", "size", "sealed")
+
+    def __init__(self, parameter_name: str, old: Any, new: Any, timestamp: float):
+        self.parameter_name = parameter_name
+        self.old = old
+        self.new = new
+        self.time = timestamp
+        self.size = 0
+        self.sealed = False
+        self.update_size()
+
+    def update_size(self):
+        self.size = (
+            _ENTRY_OVERHEAD + _estimate_size(self.old) + _estimate_size(self.new)
+        )
+
+    def entry(self) -> HistoryEntry:
+        return HistoryEntry(self.parameter_name, self.old, self.new)
+
+
+class ValueHistory(QObject):
+    """
+    the undo/redo history of the values of a ParameterForm.
+
+    the history listens to the value_change_signals() of the widgets of the form, and records only the changed
+    parameter with its old and new value, not a snapshot of the form. the signals emitted in the same event loop
+    iteration are handled once (e.g. the two toggles of a radio button group), and the changes of the same
+    parameter within coalesce_ms of each other are merged into one entry (e.g. dragging a slider), so that undo
+    goes back to the value before the burst.
+
+    the entries are kept in a bounded ring buffer: the oldest entries are dropped when there are more than
+    max_entries entries or their estimated memory exceeds max_bytes.
+
+    the values set by undo() and redo() are not recorded as new changes, all the other changes are, including
+    the ones made with set_value() and ParameterForm.restore(). restore() blocks the signals of the parameter
+    widgets but not the ones of their child widgets, so the changes of the widgets that signal them with
+    valueEdited only (e.g. ColorEdit) are missed, call record() after restore() to record them too.
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 1000
+    DEFAULT_MAX_BYTES: int = 8 * 1024 * 1024
+    DEFAULT_COALESCE_MS: int = 500
+
+    # emitted when entries are recorded, undone, redone or dropped
+    historyChanged = pyqtSignal()
+
+    def __init__(
+        self,
+        form: ParameterForm,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        coalesce_ms: Optional[int] = None,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        :param form: the form whose values are recorded
+        :param max_entries: the max number of the entries that can be undone, DEFAULT_MAX_ENTRIES if it is None
+        :param max_bytes: the max estimated memory of the entries that can be undone, DEFAULT_MAX_BYTES if it is
+        None
+        :param coalesce_ms: the changes of a parameter within this time of each other are merged,
+        DEFAULT_COALESCE_MS if it is None, 0 to record every change
+        :param parent:
+        """
+        super().__init__(parent)
+        if max_entries is None:
+            max_entries = self.DEFAULT_MAX_ENTRIES
+        if max_bytes is None:
+            max_bytes = self.DEFAULT_MAX_BYTES
+        if coalesce_ms is None:
+            coalesce_ms = self.DEFAULT_COALESCE_MS
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive: {max_entries}")
+
+        self._form = form
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._coalesce_s = coalesce_ms / 1000
+        self._undo_stack: Deque[_Record] = deque()
+        self._redo_stack: List[_Record] = []
+        self._undo_bytes = 0
+        self._redo_bytes = 0
+
+        # parameter name -> the last recorded value
+        self._values: Dict[str, Any] = form.snapshot(ignore_errors=True)
+        # the parameters whose signals are emitted since the last flush, in order
+        self._dirty: Dict[str, None] = {}
+        self._connections: List[Tuple[pyqtBoundSignal, Callable]] = []
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush)
+
+        for parameter_name, widget in form.widgets().items():
+            self._connect_widget(parameter_name, widget)
+
+    @property
+    def form(self) -> ParameterForm:
+        return self._form
+
+    def can_undo(self) -> bool:
+        self.flush()
+        return bool(self._undo_stack)
+
+    def can_redo(self) -> bool:
+        self.flush()
+        return bool(self._redo_stack)
+
+    def undo_entries(self) -> List[HistoryEntry]:
+        """
+        the entries that can be undone, the oldest first
+        :return:
+        """
+        self.flush()
+        return [record.entry() for record in self._undo_stack]
+
+    def redo_entries(self) -> List[HistoryEntry]:
+        """
+        the entries that can be redone, the next one first
+        :return:
+        """
+        self.flush()
+        return [record.entry() for record in reversed(self._redo_stack)]
+
+    def memory_usage(self) -> int:
+        """
+        the estimated memory of the entries in bytes
+        :return:
+        """
+        self.flush()
+        return self._undo_bytes + self._redo_bytes
+
+    def undo(self) -> Optional[HistoryEntry]:
+        """
+        set the parameter of the latest entry back to its old value
+        :return: the undone entry, None if there is nothing to undo
+        :raise ValueError: if the old value is rejected by the widget, the entry is kept then
+        """
+        self.flush()
+        if not self._undo_stack:
+            return None
+        record = self._undo_stack[-1]
+        self._apply(record.parameter_name, record.old)
+        self._undo_stack.pop()
+        self._undo_bytes -= record.size
+        record.sealed = True
+        self._redo_stack.append(record)
+        self._redo_bytes += record.size
+        self.historyChanged.emit()
+        return record.entry()
+
+    def redo(self) -> Optional[HistoryEntry]:
+        """
+        set the parameter of the latest undone entry to its new value again
+        :return: the redone entry, None if there is nothing to redo
+        :raise ValueError: if the new value is rejected by the widget, the entry is kept then
+        """
+        self.flush()
+        if not self._redo_stack:
+            return None
+        record = self._redo_stack[-1]
+        self._apply(record.parameter_name, record.new)
+        self._redo_stack.pop()
+        self._redo_bytes -= record.size
+        self._undo_stack.append(record)
+        self._undo_bytes += record.size
+        self._trim()
+        self.historyChanged.emit()
+        return record.entry()
+
+    def seal(self):
+        """
+        do not merge the next changes into the latest entry, e.g. after the user releases a slider
+        :return:
+        """
+        self.flush()
+        if self._undo_stack:
+            self._undo_stack[-1].sealed = True
+
+    def clear(self):
+        """
+        drop all the entries, the current values become the base of the later changes
+        :return:
+        """
+        self.flush()
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._undo_bytes = 0
+        self._redo_bytes = 0
+        self.historyChanged.emit()
+
+    def close(self):
+        """
+        stop recording the changes, the entries are kept
+        :return:
+        """
+        self.flush()
+        self._flush_timer.stop()
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                # disconnected already, or the widget is deleted
+                pass
+        self._connections.clear()
+
+    def flush(self):
+        """
+        record the pending changes now instead of on the next event loop iteration
+        :return:
+        """
+        self._flush_timer.stop()
+        if not self._dirty:
+            return
+        dirty = list(self._dirty)
+        self._dirty.clear()
+        recorded = False
+        for parameter_name in dirty:
+            if self._record(parameter_name):
+                recorded = True
+        if recorded:
+            self.historyChanged.emit()
+
+    def record(self, parameter_names: Optional[List[str]] = None):
+        """
+        record the changes whose signals are not delivered, e.g. the valueEdited signals blocked by
+        ParameterForm.bulk_update(). the changes that are recorded already are not recorded again
+        :param parameter_names: the parameters to check, all the parameters if it is None
+        :return:
+        """
+        if parameter_names is None:
+            parameter_names = self._form.parameter_names()
+        for parameter_name in parameter_names:
+            self._dirty[parameter_name] = None
+        self.flush()
+
+    def _connect_widget(self, parameter_name: str, widget: BaseParameterWidget):
+        if isinstance(widget, LazyParameterWidget) and not widget.is_materialized():
+            on_materialized = functools.partial(self._on_materialized, parameter_name)
+            widget.materialized.connect(on_materialized)
+            self._connections.append((widget.materialized, on_materialized))
+            return
+        slot = functools.partial(self._on_value_changed, parameter_name)
+        for signal in widget.value_change_signals():
+            signal.connect(slot)
+            self._connections.append((signal, slot))
+
+    def _on_materialized(self, parameter_name: str, widget: BaseParameterWidget):
+        self._connect_widget(parameter_name, widget)
+        # the pending value of the proxy may be rejected by the real widget
+        self._on_value_changed(parameter_name)
+
+    def _on_value_changed(self, parameter_name: str, *_):
+        self._dirty[parameter_name] = None
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _record(self, parameter_name: str) -> bool:
+        try:
+            new = self._form.widget(parameter_name).get_value()
+        except ValueError:
+            # an intermediate input, e.g. "1e" of a float, the change is recorded once the input is valid
+            return False
+        old = self._values.get(parameter_name, None)
+        if values_equal(old, new):
+            return False
+        self._values[parameter_name] = new
+
+        now = time.monotonic()
+        top = self._undo_stack[-1] if self._undo_stack else None
+        if (
+            top is not None
+            and not top.sealed
+            and top.parameter_name == parameter_name
+            and now - top.time <= self._coalesce_s
+            and not self._redo_stack
+        ):
+            self._undo_bytes -= top.size
+            if values_equal(top.old, new):
+                # back to the value before the burst
+                self._undo_stack.pop()
+                return True
+            top.new = new
+            top.time = now
+            top.update_size()
+            self._undo_bytes += top.size
+            self._trim()
+            return True
+
+        self._redo_stack.clear()
+        self._redo_bytes = 0
+        record = _Record(parameter_name, old, new, now)
+        self._undo_stack.append(record)
+        self._undo_bytes += record.size
+        self._trim()
+        return True
+
+    def _apply(self, parameter_name: str, value: Any):
+        widget = self._form.widget(parameter_name)
+        widget.set_value(value)
+        # the signals emitted by set_value() are dropped, the value is not a new change
+        self._dirty.pop(parameter_name, None)
+        try:
+            self._values[parameter_name] = widget.get_value()
+        except ValueError:
+            self._values[parameter_name] = value
+
+    def _trim(self):
+        # keep the latest entry even if it exceeds max_bytes alone
+        while len(self._undo_stack) > 1 and (
+            len(self._undo_stack) > self._max_entries
+            or self._undo_bytes + self._redo_bytes > self._max_bytes
+        ):
+            self._undo_bytes -= self._undo_stack.popleft().size
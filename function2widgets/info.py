@@ -1,8 +1,12 @@
 import dataclasses
+import inspect
+import re
 import warnings
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 
-from docstring_parser import Docstring, DocstringParam
+if TYPE_CHECKING:
+    # docstring_parser is imported on first use, it is not needed until a docstring is parsed
+    from docstring_parser import Docstring, DocstringParam
 
 
 @dataclasses.dataclass
@@ -12,6 +16,17 @@ class FunctionInfo(object):
     parameters: List["ParameterInfo"]
 
 
+@dataclasses.dataclass
+class FunctionParseResult(object):
+    func_obj: Any
+    function_info: Optional[FunctionInfo] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 @dataclasses.dataclass
 class ParameterInfo(object):
     name: str
@@ -20,6 +35,8 @@ class ParameterInfo(object):
     type_extras: Optional[List[str]] = None
     description: Optional[str] = None
     widget: Optional["ParameterWidgetInfo"] = None
+    # the annotation object of the parameter, None if the parameter is not annotated
+    annotation: Any = None
 
 
 @dataclasses.dataclass
@@ -100,20 +117,75 @@ class ParameterWidgetInfo(object):
         return result
 
 
+# the lines that may start a section of the docstring (or its meta info) in any of the styles supported by
+# docstring_parser: ":param x:" (rest), "@param x:" (epydoc), "Args:" (google) and the underlines (numpydoc)
+_DOCSTRING_SECTION_HINT = re.compile(r"^\s*[:@]|:\s*$|^\s*[-=]+\s*$", re.M)
+
+
+def _plain_docstring_description(docstring_text: str) -> Optional[str]:
+    # the description of a docstring without sections, the same as the one parsed by docstring_parser, None if the
+    # docstring may have sections
+    if _DOCSTRING_SECTION_HINT.search(docstring_text):
+        return None
+    text = inspect.cleandoc(docstring_text)
+    short_description, _, long_description_chunk = text.partition("\n")
+    lines = []
+    if short_description:
+        lines.append(short_description)
+        if long_description_chunk.startswith("\n"):
+            lines.append("")
+    long_description = long_description_chunk.strip()
+    if long_description:
+        lines.append(long_description)
+    return "\n".join(lines)
+
+
+def parse_docstring(docstring_text: str) -> "Docstring":
+    import docstring_parser
+    from docstring_parser import Docstring
+
+    if not docstring_text or docstring_text.isspace():
+        return Docstring()
+    try:
+        return docstring_parser.parse(docstring_text)
+    except BaseException as e:
+        warnings.warn(f"cannot parse docstring: {e}")
+        return Docstring()
+
+
 @dataclasses.dataclass
 class FunctionDocstringInfo(object):
     docstring_text: str
-    docstring_obj: Docstring
-    widget_configs: Dict[str, Dict[str, Any]]
-
-    def _find_param(self, param_name: str) -> Optional[DocstringParam]:
-        for param in self.docstring_obj.params:
-            if param.arg_name == param_name:
-                return param
-        return None
+    # docstring_obj will be parsed from docstring_text on first access if not given, use get_docstring_obj() to read it
+    docstring_obj: Optional["Docstring"] = None
+    widget_configs: Dict[str, Dict[str, Any]] = dataclasses.field(default_factory=dict)
+    _params: Optional[Dict[str, "DocstringParam"]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_docstring_obj(self) -> "Docstring":
+        if self.docstring_obj is None:
+            self.docstring_obj = parse_docstring(self.docstring_text)
+        return self.docstring_obj
+
+    def _find_param(self, param_name: str) -> Optional["DocstringParam"]:
+        if self._params is None:
+            # a parameter never mentioned in the docstring cannot be documented, so there is no need to parse it
+            if self.docstring_obj is None and param_name not in self.docstring_text:
+                return None
+            params = {}
+            for param in self.get_docstring_obj().params:
+                params.setdefault(param.arg_name, param)
+            self._params = params
+        return self._params.get(param_name, None)
 
     def get_function_description(self) -> str:
-        desc = self.docstring_obj.description or ""
+        if self.docstring_obj is None:
+            # the docstrings without sections are not parsed
+            desc = _plain_docstring_description(self.docstring_text)
+            if desc is not None:
+                return desc.strip()
+        desc = self.get_docstring_obj().description or ""
         return desc.strip()
 
     def has_parameter(self, param_name: str):
@@ -123,7 +195,7 @@ class FunctionDocstringInfo(object):
         param = self._find_param(param_name)
         if param is None:
             return None
-        return param.description.strip()
+        return (param.description or "").strip()
 
     def get_parameter_default(self, param_name: str) -> Any:
         param = self._find_param(param_name)
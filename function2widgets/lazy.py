@@ -0,0 +1,140 @@
+from typing import Any, List, Optional, Type
+
+from PyQt6.QtCore import QTimer, pyqtBoundSignal, pyqtSignal
+from PyQt6.QtGui import QPaintEvent
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+from function2widgets.values import VALUE_OWNERSHIP_DEEPCOPY, export_value, import_value
+from function2widgets.widget import BaseParameterWidget, BaseWidgetArgs
+
+_NO_VALUE = object()
+
+
+class LazyParameterWidget(BaseParameterWidget):
+    """
+    a lightweight proxy of a parameter widget, the real widget is created only when the proxy is painted for the
+    first time (e.g. when it is scrolled into view) or when the real widget is accessed.
+
+    until then, get_value() and set_value() are answered by the proxy itself: get_value() returns the last value
+    set by set_value() or the default value. the pending value is passed to the real widget once it is created,
+    so a value that the real widget rejects is reported only at that time.
+    """
+
+    # the height of the proxy before the real widget is created, used to lay out forms with many parameters
+    PLACEHOLDER_HEIGHT: int = 80
+
+    materialized = pyqtSignal(BaseParameterWidget)
+
+    def __init__(
+        self,
+        widget_class: Type[BaseParameterWidget],
+        args: BaseWidgetArgs,
+        parent: Optional[QWidget] = None,
+    ):
+        """
+        :param widget_class: the class of the real widget
+        :param args: the args of the real widget, normally created by ParameterWidgetFactory.create_widget_args()
+        :param parent:
+        """
+        self._widget_class = widget_class
+        self._widget: Optional[BaseParameterWidget] = None
+        self._pending_value: Any = _NO_VALUE
+        self._materialize_scheduled = False
+
+        super().__init__(args=args, parent=parent)
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._layout)
+        self.setMinimumHeight(self.PLACEHOLDER_HEIGHT)
+
+    @classmethod
+    def _prepare_args(cls, args: BaseWidgetArgs) -> BaseWidgetArgs:
+        # the args belong to the real widget, they are normalized by the real widget class
+        return args
+
+    @property
+    def widget_class(self) -> Type[BaseParameterWidget]:
+        return self._widget_class
+
+    def is_materialized(self) -> bool:
+        return self._widget is not None
+
+    def widget(self) -> BaseParameterWidget:
+        """
+        get the real widget, create it if it has not been created yet
+        :return:
+        """
+        if self._widget is None:
+            self.materialize()
+        return self._widget
+
+    def materialize(self):
+        """
+        create the real widget and pass the pending value to it
+        :return:
+        """
+        if self._widget is not None:
+            return
+        widget = self._widget_class(args=self._args, parent=self)
+        self._widget = widget
+        self._layout.addWidget(widget)
+        self.setMinimumHeight(0)
+        pending_value = self._pending_value
+        self._pending_value = _NO_VALUE
+        if pending_value is not _NO_VALUE:
+            widget.set_value(pending_value)
+        self._value_change_signals_changed()
+        self.materialized.emit(widget)
+
+    def get_value(self) -> Any:
+        if self._widget is not None:
+            return self._widget.get_value()
+        if self._pending_value is _NO_VALUE:
+            return export_value(self._args.default, self._value_ownership())
+        return export_value(self._pending_value, self._value_ownership())
+
+    def set_value(self, value: Any):
+        if self._widget is not None:
+            self._widget.set_value(value)
+            self._notify_value_changed()
+            return
+        if value is None and self._args.default is not None:
+            raise ValueError(
+                f"value cannot be None unless the default value is set to None(default={self.default})"
+            )
+        value = self._widget_class.normalize_value(self._args, value)
+        self._pending_value = import_value(value, self._value_ownership())
+        self._notify_value_changed()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        """
+        the signals of the real widget, none before it is created (connect to materialized to get them then)
+        :return:
+        """
+        if self._widget is not None:
+            return self._widget.value_change_signals()
+        return []
+
+    def _value_ownership(self) -> str:
+        # the args of the widgets that are not CommonParameterWidgets have no value_ownership
+        return getattr(self._args, "value_ownership", None) or VALUE_OWNERSHIP_DEEPCOPY
+
+    def set_label(self, label: Optional[str]):
+        self.widget().set_label(label)
+
+    def get_label(self) -> Optional[str]:
+        return self.widget().get_label()
+
+    def set_description(self, desc: Optional[str]):
+        self.widget().set_description(desc)
+
+    def get_description(self) -> Optional[str]:
+        return self.widget().get_description()
+
+    def paintEvent(self, event: QPaintEvent):
+        super().paintEvent(event)
+        if self._widget is None and not self._materialize_scheduled:
+            # do not create widgets inside a paint event
+            self._materialize_scheduled = True
+            QTimer.singleShot(0, self.materialize)
@@ -0,0 +1,355 @@
+import warnings
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QResizeEvent
+from PyQt6.QtWidgets import QAbstractScrollArea, QWidget
+
+from function2widgets.common import values_equal
+from function2widgets.diff import diff_parameters
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.info import FunctionInfo, ParameterInfo
+from function2widgets.values import VALUE_OWNERSHIP_DEEPCOPY, export_value, import_value
+from function2widgets.widget import BaseParameterWidget, BaseWidgetArgs
+from function2widgets.widgets.base import CommonParameterWidget
+
+_NO_VALUE = object()
+
+
+def _value_ownership(widget_args: BaseWidgetArgs) -> str:
+    return getattr(widget_args, "value_ownership", None) or VALUE_OWNERSHIP_DEEPCOPY
+
+
+class VirtualParameterPanel(QAbstractScrollArea):
+    """
+    a scrollable panel of parameter widgets that keeps only the rows in (and around) the visible area alive.
+
+    every row has the same height (row_height). when a row scrolls out of view, the value of its widget is saved in
+    the value store of the panel and the widget is recycled: a CommonParameterWidget is rebound to another parameter
+    if their widget args differ in CommonParameterWidget.REBINDABLE_ARGS only, other widgets are deleted. so the
+    number of live widgets depends on the height of the viewport, not on the number of parameters.
+    """
+
+    DEFAULT_ROW_HEIGHT: int = 100
+    # the rows kept alive above and below the visible area
+    DEFAULT_OVERSCAN: int = 2
+
+    def __init__(
+        self,
+        factory: Optional[ParameterWidgetFactory] = None,
+        row_height: Optional[int] = None,
+        overscan: Optional[int] = None,
+        parent: Optional[QWidget] = None,
+    ):
+        """
+        :param factory: the factory used to create the widgets, a ParameterWidgetFactory with the basic widgets is
+        used if it is not given
+        :param row_height: the height of each row, DEFAULT_ROW_HEIGHT if it is None
+        :param overscan: the rows kept alive above and below the visible area, DEFAULT_OVERSCAN if it is None
+        :param parent:
+        """
+        super().__init__(parent)
+
+        if factory is None:
+            factory = ParameterWidgetFactory()
+        if row_height is None:
+            row_height = self.DEFAULT_ROW_HEIGHT
+        if overscan is None:
+            overscan = self.DEFAULT_OVERSCAN
+        if row_height <= 0:
+            raise ValueError(f"row_height must be positive: {row_height}")
+
+        self._factory = factory
+        self._row_height = row_height
+        self._overscan = max(0, overscan)
+
+        self._parameters: List[ParameterInfo] = []
+        self._indexes: Dict[str, int] = {}
+        # parameter name -> the value of the parameter whose row is not alive
+        self._values: Dict[str, Any] = {}
+        # row index -> the widget class and the widget args of the parameter, created on first use
+        self._widget_args_cache: Dict[
+            int, Tuple[Type[BaseParameterWidget], BaseWidgetArgs]
+        ] = {}
+        # row index -> the widget bound to the row
+        self._rows: Dict[int, BaseParameterWidget] = {}
+        # the unbound widgets, the least recently unbound first
+        self._spare_widgets: List[BaseParameterWidget] = []
+
+    @property
+    def factory(self) -> ParameterWidgetFactory:
+        return self._factory
+
+    @property
+    def row_height(self) -> int:
+        return self._row_height
+
+    def set_function(self, func_info: FunctionInfo):
+        self.set_parameters(func_info.parameters)
+
+    def set_parameters(self, parameters: List[ParameterInfo]):
+        """
+        replace the parameters of the panel, the values of the previous parameters are discarded
+        :param parameters:
+        :return:
+        """
+        for widget in list(self._rows.values()) + self._spare_widgets:
+            widget.hide()
+            widget.deleteLater()
+        self._rows.clear()
+        self._spare_widgets.clear()
+        self._values.clear()
+        self._widget_args_cache.clear()
+
+        self._parameters = list(parameters)
+        self._indexes = {
+            param_info.name: index for index, param_info in enumerate(self._parameters)
+        }
+        self.verticalScrollBar().setValue(0)
+        self._update_scroll_range()
+        self._update_rows()
+
+    def update_function(self, func_info: FunctionInfo, keep_values: bool = True):
+        self.update_parameters(func_info.parameters, keep_values=keep_values)
+
+    def update_parameters(
+        self, parameters: List[ParameterInfo], keep_values: bool = True
+    ):
+        """
+        replace the parameters of the panel with a new version of them, e.g. the ones parsed after the module of
+        the function is reloaded, keeping the scroll position and the widgets that can be rebound.
+        :param parameters:
+        :param keep_values: keep the values of the parameters whose typename is unchanged, except the ones equal
+        to the old default value, so that the new default values are shown. the values that are not accepted by
+        the new widgets are discarded when their rows are bound.
+        :return:
+        """
+        for index in list(self._rows):
+            self._unbind_row(index)
+
+        values = {}
+        if keep_values:
+            diff = diff_parameters(
+                self._parameters, parameters, self._factory.type_resolver
+            )
+            for param_diff in diff.parameters:
+                value = self._values.get(param_diff.name, _NO_VALUE)
+                if (
+                    value is _NO_VALUE
+                    or param_diff.new is None
+                    or param_diff.old is None
+                ):
+                    continue
+                if param_diff.type_changed:
+                    continue
+                _, old_widget_args = self._widget_args(self._indexes[param_diff.name])
+                if not values_equal(value, old_widget_args.default):
+                    values[param_diff.name] = value
+        self._values = values
+        self._widget_args_cache.clear()
+
+        self._parameters = list(parameters)
+        self._indexes = {
+            param_info.name: index for index, param_info in enumerate(self._parameters)
+        }
+        self._update_scroll_range()
+        self._update_rows()
+
+    def parameters(self) -> List[ParameterInfo]:
+        return list(self._parameters)
+
+    def parameter_count(self) -> int:
+        return len(self._parameters)
+
+    def live_widget_count(self) -> int:
+        """
+        the number of the widgets owned by the panel, including the spare ones
+        :return:
+        """
+        return len(self._rows) + len(self._spare_widgets)
+
+    def visible_widgets(self) -> Dict[str, BaseParameterWidget]:
+        """
+        get the widgets of the rows that are alive, do not keep them, they are recycled when they are scrolled
+        out of view
+        :return: parameter name -> widget
+        """
+        return {
+            self._parameters[index].name: widget
+            for index, widget in sorted(self._rows.items())
+        }
+
+    def get_value(self, parameter_name: str) -> Any:
+        index = self._index_of(parameter_name)
+        widget = self._rows.get(index, None)
+        if widget is not None:
+            return widget.get_value()
+        _, widget_args = self._widget_args(index)
+        value = self._values.get(parameter_name, _NO_VALUE)
+        if value is _NO_VALUE:
+            value = widget_args.default
+        return export_value(value, _value_ownership(widget_args))
+
+    def set_value(self, parameter_name: str, value: Any):
+        index = self._index_of(parameter_name)
+        widget = self._rows.get(index, None)
+        if widget is not None:
+            widget.set_value(value)
+            return
+        widget_class, widget_args = self._widget_args(index)
+        if value is None and widget_args.default is not None:
+            raise ValueError(
+                f"value cannot be None unless the default value is set to None(default={widget_args.default})"
+            )
+        # store the value the widget would return, e.g. the data of an item of a ComboBox instead of its text
+        value = widget_class.normalize_value(widget_args, value)
+        self._values[parameter_name] = import_value(
+            value, _value_ownership(widget_args)
+        )
+
+    def get_values(self) -> Dict[str, Any]:
+        return OrderedDict(
+            (param_info.name, self.get_value(param_info.name))
+            for param_info in self._parameters
+        )
+
+    def set_values(self, values: Dict[str, Any]):
+        for parameter_name, value in values.items():
+            self.set_value(parameter_name, value)
+
+    def scroll_to(self, parameter_name: str):
+        """
+        scroll the row of the parameter into view
+        :param parameter_name:
+        :return:
+        """
+        index = self._index_of(parameter_name)
+        top = index * self._row_height
+        scroll_bar = self.verticalScrollBar()
+        viewport_height = self.viewport().height()
+        if top < scroll_bar.value():
+            scroll_bar.setValue(top)
+        elif top + self._row_height > scroll_bar.value() + viewport_height:
+            scroll_bar.setValue(top + self._row_height - viewport_height)
+
+    def sizeHint(self) -> QSize:
+        return QSize(400, self._row_height * 5)
+
+    def scrollContentsBy(self, dx: int, dy: int):
+        self._update_rows()
+
+    def resizeEvent(self, event: QResizeEvent):
+        super().resizeEvent(event)
+        self._update_scroll_range()
+        self._update_rows()
+
+    def _index_of(self, parameter_name: str) -> int:
+        index = self._indexes.get(parameter_name, None)
+        if index is None:
+            raise KeyError(f"no such parameter: {parameter_name}")
+        return index
+
+    def _widget_args(
+        self, index: int
+    ) -> Tuple[Type[BaseParameterWidget], BaseWidgetArgs]:
+        # the args are created once per row, the off-screen get_value() and set_value() read them on every call
+        cached = self._widget_args_cache.get(index, None)
+        if cached is None:
+            cached = self._factory.create_widget_args_for_parameter(
+                self._parameters[index]
+            )
+            self._widget_args_cache[index] = cached
+        return cached
+
+    def _update_scroll_range(self):
+        viewport_height = self.viewport().height()
+        content_height = len(self._parameters) * self._row_height
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.setRange(0, max(0, content_height - viewport_height))
+        scroll_bar.setPageStep(viewport_height)
+        scroll_bar.setSingleStep(max(1, self._row_height // 4))
+
+    def _visible_range(self) -> Tuple[int, int]:
+        if not self._parameters:
+            return 0, 0
+        top = self.verticalScrollBar().value()
+        bottom = top + max(0, self.viewport().height() - 1)
+        first = max(0, top // self._row_height - self._overscan)
+        last = min(
+            len(self._parameters) - 1, bottom // self._row_height + self._overscan
+        )
+        return first, last + 1
+
+    def _update_rows(self):
+        first, last = self._visible_range()
+
+        for index in [i for i in self._rows if i < first or i >= last]:
+            self._unbind_row(index)
+
+        for index in range(first, last):
+            if index not in self._rows:
+                self._bind_row(index)
+
+        # keep no more spare widgets than the rows that can be alive at the same time
+        max_spare_widgets = max(1, last - first)
+        while len(self._spare_widgets) > max_spare_widgets:
+            widget = self._spare_widgets.pop(0)
+            widget.deleteLater()
+
+        top = self.verticalScrollBar().value()
+        width = self.viewport().width()
+        for index, widget in self._rows.items():
+            widget.setGeometry(
+                0, index * self._row_height - top, width, self._row_height
+            )
+
+    def _bind_row(self, index: int):
+        parameter_name = self._parameters[index].name
+        widget_class, widget_args = self._widget_args(index)
+        widget = self._take_spare_widget(widget_class, widget_args)
+        if widget is None:
+            widget = widget_class(args=widget_args, parent=self.viewport())
+
+        value = self._values.pop(parameter_name, _NO_VALUE)
+        if value is _NO_VALUE:
+            widget.set_value(widget_args.default)
+        else:
+            try:
+                widget.set_value(value)
+            except Exception as e:
+                # e.g. the value kept by update_parameters() is not accepted by the new widget
+                warnings.warn(
+                    f"the value of parameter '{parameter_name}' is discarded: {e}"
+                )
+                widget.set_value(widget_args.default)
+        self._rows[index] = widget
+        widget.show()
+
+    def _unbind_row(self, index: int):
+        widget = self._rows.pop(index)
+        parameter_name = self._parameters[index].name
+        try:
+            self._values[parameter_name] = widget.get_value()
+        except ValueError as e:
+            warnings.warn(
+                f"the value of parameter '{parameter_name}' is discarded: {e}"
+            )
+        widget.hide()
+        if isinstance(widget, CommonParameterWidget):
+            self._spare_widgets.append(widget)
+        else:
+            widget.deleteLater()
+
+    def _take_spare_widget(
+        self, widget_class: Type[BaseParameterWidget], widget_args: BaseWidgetArgs
+    ) -> Optional[BaseParameterWidget]:
+        for i in range(len(self._spare_widgets) - 1, -1, -1):
+            widget = self._spare_widgets[i]
+            if type(widget) is not widget_class:
+                continue
+            if widget.can_rebind(widget_args):
+                del self._spare_widgets[i]
+                widget.rebind(widget_args)
+                return widget
+        return None
@@ -1,3 +1,25 @@
-from .function_parser import FunctionInfoParser
-from .parameter_parser import ParameterInfoParser
-from .widgetconfigs_parser import WidgetConfigsParser
+from typing import TYPE_CHECKING
+
+from function2widgets._lazyimport import lazy_attributes
+
+if TYPE_CHECKING:
+    from .cache import FunctionInfoCache, DiskFunctionInfoCache, BaseFunctionInfoCache
+    from .function_parser import FunctionInfoParser, default_widget_resolver
+    from .parameter_parser import ParameterInfoParser
+    from .widgetconfigs_parser import WidgetConfigsParser
+    from .widget_resolver import WidgetTypeResolver, ResolvedWidgetType
+
+_LAZY_ATTRIBUTES = {
+    "FunctionInfoCache": ".cache",
+    "DiskFunctionInfoCache": ".cache",
+    "BaseFunctionInfoCache": ".cache",
+    "FunctionInfoParser": ".function_parser",
+    "default_widget_resolver": ".function_parser",
+    "ParameterInfoParser": ".parameter_parser",
+    "WidgetConfigsParser": ".widgetconfigs_parser",
+    "WidgetTypeResolver": ".widget_resolver",
+    "ResolvedWidgetType": ".widget_resolver",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
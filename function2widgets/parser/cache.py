@@ -0,0 +1,461 @@
+import abc
+import copy
+import hashlib
+import logging
+import marshal
+import os
+import pickle
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Optional, Tuple, Dict
+
+from function2widgets.info import FunctionInfo
+
+DEFAULT_CACHE_SIZE = 256
+
+# bump this whenever the layout of the cache files, their keys or the parse results changes
+DISK_CACHE_FORMAT_VERSION = 3
+DISK_CACHE_FILE_SUFFIX = ".f2wcache"
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "max_size", "current_size"])
+
+
+def copy_function_info(func_info: FunctionInfo) -> FunctionInfo:
+    """
+    make a defensive copy of a FunctionInfo object.
+
+    all the containers (parameters, widget infos, widget args, type extras) are copied, while the default
+    values are shared with the original object, just like what a fresh parse returns (the defaults of a
+    freshly parsed FunctionInfo are the very objects stored in the function's __defaults__).
+    :param func_info:
+    :return:
+    """
+    memo = {}
+    for param_info in func_info.parameters:
+        memo[id(param_info.default)] = param_info.default
+    return copy.deepcopy(func_info, memo)
+
+
+def dumps_function_info(func_info: FunctionInfo) -> Optional[bytes]:
+    """
+    pickle a FunctionInfo object, return None if it cannot be pickled, or if it does not compare equal to
+    itself after a pickle round trip, e.g. when some default values are sentinel objects whose identity matters.
+    :param func_info:
+    :return:
+    """
+    try:
+        data = pickle.dumps(func_info, protocol=pickle.HIGHEST_PROTOCOL)
+        if pickle.loads(data) != func_info:
+            return None
+    except Exception as e:
+        logging.debug(f"function info of '{func_info.name}' cannot be pickled: {e}")
+        return None
+    return data
+
+
+class BaseFunctionInfoCache(abc.ABC):
+    """
+    base class of the caches that can be used by FunctionInfoParser.
+
+    the flags passed to get() and put() are part of the keys of the entries. they must have the same meaning in
+    every process (e.g. a fingerprint rather than a counter), since persistent caches store them.
+    """
+
+    @abc.abstractmethod
+    def get(self, func_obj: Any, *flags: Any) -> Optional[FunctionInfo]:
+        """
+        get the cached FunctionInfo of func_obj, return None if it is not cached or the cached one is stale.
+        the returned object is owned by the caller.
+        :param func_obj:
+        :param flags: extra options that affect the parse result
+        :return:
+        """
+        pass
+
+    @abc.abstractmethod
+    def put(self, func_obj: Any, func_info: FunctionInfo, *flags: Any):
+        """
+        cache the FunctionInfo of func_obj
+        :param func_obj:
+        :param func_info:
+        :param flags: extra options that affect the parse result
+        :return:
+        """
+        pass
+
+    @abc.abstractmethod
+    def invalidate(self, func_obj: Any):
+        """
+        remove all cached entries of func_obj
+        :param func_obj:
+        :return:
+        """
+        pass
+
+    @abc.abstractmethod
+    def clear(self):
+        """
+        remove all cached entries
+        :return:
+        """
+        pass
+
+
+class _CacheEntry(object):
+    __slots__ = ("code", "doc", "defaults", "kwdefaults", "func_info")
+
+    def __init__(
+        self,
+        code: Any,
+        doc: Optional[str],
+        defaults: Optional[tuple],
+        kwdefaults: Optional[dict],
+        func_info: FunctionInfo,
+    ):
+        # the entry holds references to the objects whose ids make up the key, so these ids cannot be
+        # reused by other objects while the entry is alive
+        self.code = code
+        self.doc = doc
+        self.defaults = defaults
+        self.kwdefaults = kwdefaults
+        self.func_info = func_info
+
+    def is_valid_for(self, func: Any) -> bool:
+        return (
+            self.code is func.__code__
+            and self.doc is func.__doc__
+            and self.defaults is func.__defaults__
+            and self.kwdefaults is func.__kwdefaults__
+        )
+
+
+class FunctionInfoCache(BaseFunctionInfoCache):
+    """
+    an in-memory LRU cache of parsed FunctionInfo objects.
+
+    entries are keyed by the identity of the function's __code__, __doc__, __defaults__ and __kwdefaults__,
+    so redefining a function, reassigning its docstring or its defaults makes the old entry unreachable.
+    """
+
+    def __init__(self, max_size: Optional[int] = DEFAULT_CACHE_SIZE):
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        self._max_size = max_size
+        self._entries: "OrderedDict[Tuple[Any, ...], _CacheEntry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                max_size=self._max_size,
+                current_size=len(self._entries),
+            )
+
+    def get(self, func_obj: Any, *flags: Any) -> Optional[FunctionInfo]:
+        func = self._unwrap(func_obj)
+        key = self._make_key(func_obj, func, flags)
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None or not entry.is_valid_for(func):
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            func_info = entry.func_info
+        return copy_function_info(func_info)
+
+    def put(self, func_obj: Any, func_info: FunctionInfo, *flags: Any):
+        func = self._unwrap(func_obj)
+        key = self._make_key(func_obj, func, flags)
+        entry = _CacheEntry(
+            code=func.__code__,
+            doc=func.__doc__,
+            defaults=func.__defaults__,
+            kwdefaults=func.__kwdefaults__,
+            func_info=copy_function_info(func_info),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if self._max_size is not None:
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, func_obj: Any):
+        func = self._unwrap(func_obj)
+        with self._lock:
+            stale_keys = [
+                key
+                for key, entry in self._entries.items()
+                if entry.code is func.__code__
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _unwrap(func_obj: Any) -> Any:
+        return getattr(func_obj, "__func__", func_obj)
+
+    @staticmethod
+    def _make_key(func_obj: Any, func: Any, flags: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        # a bound method and its underlying function have different signatures
+        is_method = func_obj is not func
+        return (
+            id(func.__code__),
+            id(func.__doc__),
+            id(func.__defaults__),
+            id(func.__kwdefaults__),
+            is_method,
+            *flags,
+        )
+
+
+class _ModuleCacheRecord(object):
+    __slots__ = ("path", "mtime", "entries", "dirty")
+
+    def __init__(self, path: str, mtime: int, entries: Dict[Tuple[Any, ...], bytes]):
+        self.path = path
+        self.mtime = mtime
+        self.entries = entries
+        self.dirty = False
+
+
+class DiskFunctionInfoCache(BaseFunctionInfoCache):
+    """
+    a persistent cache of parsed FunctionInfo objects, stored in cache_dir with one pickle file per module file.
+
+    entries are keyed by the path and the mtime of the module file, and by a hash of the function's code,
+    docstring and the repr of its defaults, so a cache file is discarded as a whole once its module file is modified. functions which are
+    not defined in a file (e.g. the ones created by exec()) are never cached. a parse result that cannot be
+    pickled, or that does not compare equal to itself after a pickle round trip (e.g. its defaults are
+    sentinel objects), is not cached either, so these functions always fall back to a live parse.
+
+    new entries are kept in memory until flush() is called (or the cache is used as a context manager).
+    """
+
+    def __init__(self, cache_dir: str):
+        self._cache_dir = cache_dir
+        self._records: Dict[str, _ModuleCacheRecord] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            current_size = sum(len(r.entries) for r in self._records.values())
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                max_size=None,
+                current_size=current_size,
+            )
+
+    def get(self, func_obj: Any, *flags: Any) -> Optional[FunctionInfo]:
+        location = self._locate(func_obj)
+        key = self._make_key(func_obj, flags)
+        with self._lock:
+            if location is None or key is None:
+                self._misses += 1
+                return None
+            path, mtime = location
+            record = self._get_record(path, mtime)
+            data = record.entries.get(key, None)
+            if data is None:
+                self._misses += 1
+                return None
+            try:
+                func_info = pickle.loads(data)
+            except Exception as e:
+                logging.debug(f"failed to load cached function info of {path}: {e}")
+                del record.entries[key]
+                record.dirty = True
+                self._misses += 1
+                return None
+            self._hits += 1
+            return func_info
+
+    def put(self, func_obj: Any, func_info: FunctionInfo, *flags: Any):
+        location = self._locate(func_obj)
+        if location is None:
+            return
+        path, mtime = location
+        key = self._make_key(func_obj, flags)
+        if key is None:
+            return
+        data = dumps_function_info(func_info)
+        if data is None:
+            return
+        with self._lock:
+            record = self._get_record(path, mtime)
+            record.entries[key] = data
+            record.dirty = True
+
+    def invalidate(self, func_obj: Any):
+        location = self._locate(func_obj)
+        if location is None:
+            return
+        path, mtime = location
+        qualname = self._unwrap(func_obj).__qualname__
+        with self._lock:
+            record = self._get_record(path, mtime)
+            stale_keys = [key for key in record.entries if key[0] == qualname]
+            for key in stale_keys:
+                del record.entries[key]
+            if stale_keys:
+                record.dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self._hits = 0
+            self._misses = 0
+            if not os.path.isdir(self._cache_dir):
+                return
+            for filename in os.listdir(self._cache_dir):
+                if filename.endswith(DISK_CACHE_FILE_SUFFIX):
+                    os.remove(os.path.join(self._cache_dir, filename))
+
+    def flush(self):
+        """
+        write all modified entries to the cache files
+        :return:
+        """
+        with self._lock:
+            dirty_records = [r for r in self._records.values() if r.dirty]
+            if not dirty_records:
+                return
+            os.makedirs(self._cache_dir, exist_ok=True)
+            for record in dirty_records:
+                self._write_record(record)
+                record.dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def _get_record(self, path: str, mtime: int) -> _ModuleCacheRecord:
+        record = self._records.get(path, None)
+        if record is None:
+            record = self._read_record(path, mtime)
+            self._records[path] = record
+        if record.mtime != mtime:
+            # the module file has been modified, all its entries are stale
+            record = _ModuleCacheRecord(path=path, mtime=mtime, entries={})
+            record.dirty = True
+            self._records[path] = record
+        return record
+
+    def _cache_file_of(self, path: str) -> str:
+        filename = hashlib.sha1(path.encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, filename + DISK_CACHE_FILE_SUFFIX)
+
+    def _read_record(self, path: str, mtime: int) -> _ModuleCacheRecord:
+        cache_file = self._cache_file_of(path)
+        empty_record = _ModuleCacheRecord(path=path, mtime=mtime, entries={})
+        if not os.path.isfile(cache_file):
+            return empty_record
+        try:
+            with open(cache_file, "rb") as f:
+                content = pickle.load(f)
+        except Exception as e:
+            logging.debug(f"failed to read cache file {cache_file}: {e}")
+            return empty_record
+        if (
+            not isinstance(content, dict)
+            or content.get("version", None) != DISK_CACHE_FORMAT_VERSION
+            or content.get("path", None) != path
+            or not isinstance(content.get("entries", None), dict)
+        ):
+            return empty_record
+        return _ModuleCacheRecord(
+            path=path, mtime=content.get("mtime", None), entries=content["entries"]
+        )
+
+    def _write_record(self, record: _ModuleCacheRecord):
+        cache_file = self._cache_file_of(record.path)
+        content = {
+            "version": DISK_CACHE_FORMAT_VERSION,
+            "path": record.path,
+            "mtime": record.mtime,
+            "entries": record.entries,
+        }
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logging.warning(f"failed to write cache file {cache_file}: {e}")
+            if os.path.isfile(tmp_file):
+                os.remove(tmp_file)
+
+    @staticmethod
+    def _unwrap(func_obj: Any) -> Any:
+        return getattr(func_obj, "__func__", func_obj)
+
+    @classmethod
+    def _locate(cls, func_obj: Any) -> Optional[Tuple[str, int]]:
+        path = cls._unwrap(func_obj).__code__.co_filename
+        try:
+            return path, os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def _make_key(
+        cls, func_obj: Any, flags: Tuple[Any, ...]
+    ) -> Optional[Tuple[Any, ...]]:
+        # None if the function cannot be cached
+        func = cls._unwrap(func_obj)
+        try:
+            # the defaults can be reassigned without modifying the module file
+            defaults = repr((func.__defaults__, func.__kwdefaults__))
+        except Exception as e:
+            logging.debug(f"defaults of {func.__qualname__} have no repr: {e}")
+            return None
+        digest = hashlib.sha1(marshal.dumps(func.__code__))
+        digest.update((func.__doc__ or "").encode("utf-8", errors="surrogatepass"))
+        digest.update(defaults.encode("utf-8", errors="surrogatepass"))
+        is_method = func_obj is not func
+        return func.__qualname__, digest.hexdigest(), is_method, *flags
@@ -1,7 +1,3 @@
-import warnings
-
-import docstring_parser
-
 from function2widgets.info import FunctionDocstringInfo
 from function2widgets.parser.widgetconfigs_parser import WidgetConfigsParser
 
@@ -16,30 +12,22 @@ class FunctionDocstringParser(object):
         self._widget_configs_parser = WidgetConfigsParser()
 
     def parse(self, raw_docstring_text: str) -> FunctionDocstringInfo:
-        docstring_text = WidgetConfigsParser.remove_widget_configs_block(
-            raw_docstring_text
+        docstring_text, widget_configs_block = (
+            WidgetConfigsParser.split_widget_configs_block(raw_docstring_text)
         )
-        docstring_obj = self._get_docstring_obj(docstring_text)
         try:
-            widget_configs = self._widget_configs_parser.parse(raw_docstring_text)
+            widget_configs = self._widget_configs_parser.parse_widget_configs_block(
+                widget_configs_block
+            )
         except BaseException as e:
             raise ParseException("failed to parse widget configs block") from e
         docstring_info = FunctionDocstringInfo(
             docstring_text=docstring_text,
-            docstring_obj=docstring_obj,
             widget_configs=widget_configs,
         )
 
         return docstring_info
 
-    @staticmethod
-    def _get_docstring_obj(docstring_text: str) -> docstring_parser.Docstring:
-        try:
-            return docstring_parser.parse(docstring_text)
-        except BaseException as e:
-            warnings.warn(f"cannot parse docstring: {e}")
-            return docstring_parser.Docstring()
-
     # def _to_param_widgets_infos(
     #     self, widget_configs: Dict[str, Any]
     # ) -> Dict[str, ParameterWidgetInfo]:
@@ -1,73 +1,150 @@
+import enum
 import inspect
+import logging
+import pathlib
+import pickle
 import typing
 from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, date, time
-from typing import Any
-
-from PyQt6.QtCore import QDateTime, QDate, QTime
-from PyQt6.QtGui import QColor
+from types import ModuleType
+from typing import Any, Optional, Iterable, List, Tuple
 
+from function2widgets.color import Color
 from function2widgets.info import (
     FunctionInfo,
+    FunctionParseResult,
     FunctionDocstringInfo,
     ParameterWidgetInfo,
     ParameterInfo,
 )
+from function2widgets.parser.cache import BaseFunctionInfoCache, dumps_function_info
 from function2widgets.parser.docstr_parser import FunctionDocstringParser
 from function2widgets.parser.parameter_parser import ParameterInfoParser
-from function2widgets.widgets import (
-    CheckBox,
-    IntLineEdit,
-    FloatLineEdit,
-    LineEdit,
-    ListEditor,
-    TupleEditor,
-    DictEditor,
-    ComboBox,
-    JsonEditor,
-    ComboBoxEdit,
-    DateTimeEdit,
-    DateEdit,
-    TimeEdit,
-    ColorEdit,
-)
-from function2widgets.widgets.misc import Color
+from function2widgets.parser.widget_resolver import WidgetTypeResolver
 
+# the widget classes are referred to by their names, so the parser does not import them (and Qt)
 DEFAULT_WIDGET_TYPES = {
-    bool.__name__: CheckBox.__name__,
-    int.__name__: IntLineEdit.__name__,
-    float.__name__: FloatLineEdit.__name__,
-    str.__name__: LineEdit.__name__,
-    list.__name__: ListEditor.__name__,
-    tuple.__name__: TupleEditor.__name__,
-    dict.__name__: DictEditor.__name__,
-    datetime.__name__: DateTimeEdit.__name__,
-    QDateTime.__name__: DateTimeEdit.__name__,
-    date.__name__: DateEdit.__name__,
-    QDate.__name__: DateEdit.__name__,
-    time.__name__: TimeEdit.__name__,
-    QTime.__name__: TimeEdit.__name__,
-    Color.__name__: ColorEdit.__name__,
-    QColor.__name__: ColorEdit.__name__,
-    str(typing.Union): JsonEditor.__name__,
-    str(typing.Optional): JsonEditor.__name__,
-    str(typing.Any): JsonEditor.__name__,
-    "any": JsonEditor.__name__,
+    bool.__name__: "CheckBox",
+    int.__name__: "IntLineEdit",
+    float.__name__: "FloatLineEdit",
+    str.__name__: "LineEdit",
+    list.__name__: "ListEditor",
+    tuple.__name__: "TupleEditor",
+    dict.__name__: "DictEditor",
+    datetime.__name__: "DateTimeEdit",
+    "QDateTime": "DateTimeEdit",
+    date.__name__: "DateEdit",
+    "QDate": "DateEdit",
+    time.__name__: "TimeEdit",
+    "QTime": "TimeEdit",
+    Color.__name__: "ColorEdit",
+    "QColor": "ColorEdit",
+    str(typing.Union): "JsonEditor",
+    str(typing.Optional): "JsonEditor",
+    str(typing.Any): "JsonEditor",
+    "any": "JsonEditor",
 }
 
 
+# the types whose subclasses are resolved to the same widgets as themselves, the Qt types are given by their
+# qualified names
+DEFAULT_WIDGET_CLASS_TYPES = (
+    bool,
+    int,
+    float,
+    str,
+    list,
+    tuple,
+    dict,
+    datetime,
+    "PyQt6.QtCore.QDateTime",
+    date,
+    "PyQt6.QtCore.QDate",
+    time,
+    "PyQt6.QtCore.QTime",
+    Color,
+    "PyQt6.QtGui.QColor",
+)
+
 TYPENAME_FOR_EMPTY = "any"
 DEFAULT_FOR_EMPTY = inspect.Parameter.empty
 FALLBACK_WIDGET_TYPE = DEFAULT_WIDGET_TYPES["any"]
 
-DEFAULT_WIDGET_FOR_LITERALS = ComboBox.__name__
+DEFAULT_WIDGET_FOR_LITERALS = "ComboBox"
+# the items of the ComboBox of an enum are the names of its members, its value is the selected member
+DEFAULT_WIDGET_FOR_ENUMS = "ComboBox"
+DEFAULT_WIDGET_FOR_PATHS = "PathEdit"
+
+
+def is_enum_type(annotation: Any) -> bool:
+    return inspect.isclass(annotation) and issubclass(annotation, enum.Enum)
+
+
+def is_path_type(annotation: Any) -> bool:
+    return inspect.isclass(annotation) and issubclass(annotation, pathlib.PurePath)
+
+
+def make_default_widget_resolver() -> WidgetTypeResolver:
+    """
+    create a WidgetTypeResolver with the builtin mappings (DEFAULT_WIDGET_CLASS_TYPES and DEFAULT_WIDGET_TYPES)
+    and the builtin rules for enums and paths
+    :return:
+    """
+    resolver = WidgetTypeResolver()
+    for type_ in DEFAULT_WIDGET_CLASS_TYPES:
+        if isinstance(type_, str):
+            typename = type_.rpartition(".")[2]
+        else:
+            typename = type_.__name__
+        resolver.register_type(type_, DEFAULT_WIDGET_TYPES[typename])
+    for typename, widget_class in DEFAULT_WIDGET_TYPES.items():
+        resolver.register_typename(typename, widget_class)
+    # the rules are tried before the bases of the annotations, so an IntEnum is an enum rather than an int
+    resolver.register_type_rule(is_enum_type, DEFAULT_WIDGET_FOR_ENUMS)
+    resolver.register_type_rule(is_path_type, DEFAULT_WIDGET_FOR_PATHS)
+    return resolver
+
+
+_default_widget_resolver = make_default_widget_resolver()
+
+
+def default_widget_resolver() -> WidgetTypeResolver:
+    """
+    the WidgetTypeResolver shared by the FunctionInfoParsers and the ParameterWidgetFactories that are not given
+    one explicitly, so the types registered to it apply to all of them.
+    :return:
+    """
+    return _default_widget_resolver
 
 
 class FunctionInfoParser(object):
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[BaseFunctionInfoCache] = None,
+        widget_resolver: Optional[WidgetTypeResolver] = None,
+    ):
+        """
+        :param cache: an optional cache of the parse results, e.g. a FunctionInfoCache.
+        when it is set, parsing the same function again returns a copy of the cached result.
+        :param widget_resolver: the resolver that decides the default widget of each parameter,
+        default_widget_resolver() is used if it is not given.
+        """
         self._parameter_parser: ParameterInfoParser = ParameterInfoParser()
         self._func_docstring_parser: FunctionDocstringParser = FunctionDocstringParser()
+        self._cache: Optional[BaseFunctionInfoCache] = cache
+        if widget_resolver is None:
+            widget_resolver = default_widget_resolver()
+        self._widget_resolver: WidgetTypeResolver = widget_resolver
+
+    @property
+    def cache(self) -> Optional[BaseFunctionInfoCache]:
+        return self._cache
+
+    @property
+    def widget_resolver(self) -> WidgetTypeResolver:
+        return self._widget_resolver
 
     def parse(
         self,
@@ -75,12 +152,188 @@ class FunctionInfoParser(object):
         ignore_self_param: bool = True,
         raw_docstring_as_description: bool = False,
     ) -> FunctionInfo:
-        if inspect.isclass(func_obj):
-            func_obj = func_obj.__init__
+        func_obj = self._check_func_obj(func_obj)
 
-        if not inspect.isfunction(func_obj) and not inspect.ismethod(func_obj):
-            raise TypeError(f"'{func_obj}' is not a function or method")
+        if self._cache is not None:
+            func_info = self._cache.get(
+                func_obj,
+                *self._cache_flags(ignore_self_param, raw_docstring_as_description),
+            )
+            if func_info is not None:
+                return func_info
+
+        func_info = self._parse_uncached(
+            func_obj, ignore_self_param, raw_docstring_as_description
+        )
+
+        if self._cache is not None:
+            self._cache.put(
+                func_obj,
+                func_info,
+                *self._cache_flags(ignore_self_param, raw_docstring_as_description),
+            )
+        return func_info
 
+    def parse_many(
+        self,
+        func_objs: Iterable[Any],
+        ignore_self_param: bool = True,
+        raw_docstring_as_description: bool = False,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[FunctionParseResult]:
+        """
+        parse a batch of functions in parallel, using a process pool.
+
+        the results are returned in the same order as func_objs. an exception raised while parsing a function
+        is stored in its result instead of aborting the batch. functions that cannot be sent to a worker
+        process (e.g. lambdas and nested functions), or whose parse results cannot be sent back (e.g. their
+        defaults cannot be pickled), are parsed in the current process.
+        :param func_objs: the functions (or methods, or classes) to parse
+        :param ignore_self_param:
+        :param raw_docstring_as_description:
+        :param max_workers: the max number of worker processes, only used when executor is not given
+        :param executor: the executor to run the parse jobs, by default a ProcessPoolExecutor is created for
+        this call and shut down before returning
+        :return:
+        """
+        func_objs = list(func_objs)
+        results: List[Optional[FunctionParseResult]] = [None] * len(func_objs)
+        pending = []
+        for index, func_obj in enumerate(func_objs):
+            try:
+                checked_func_obj = self._check_func_obj(func_obj)
+                func_info = None
+                if self._cache is not None:
+                    func_info = self._cache.get(
+                        checked_func_obj,
+                        *self._cache_flags(
+                            ignore_self_param, raw_docstring_as_description
+                        ),
+                    )
+            except Exception as e:
+                results[index] = FunctionParseResult(func_obj=func_obj, error=e)
+                continue
+            if func_info is not None:
+                results[index] = FunctionParseResult(
+                    func_obj=func_obj, function_info=func_info
+                )
+            elif self._is_picklable(checked_func_obj):
+                pending.append((index, checked_func_obj))
+            else:
+                results[index] = self._parse_for_result(
+                    func_obj, ignore_self_param, raw_docstring_as_description
+                )
+
+        # the worker processes need a copy of the resolver to create the same widget infos
+        if (
+            len(pending) > 1
+            and max_workers != 1
+            and self._is_picklable(self._widget_resolver)
+        ):
+            own_executor = executor is None
+            if own_executor:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            try:
+                futures = [
+                    (
+                        index,
+                        executor.submit(
+                            _parse_in_worker,
+                            checked_func_obj,
+                            ignore_self_param,
+                            raw_docstring_as_description,
+                            self._widget_resolver,
+                        ),
+                    )
+                    for index, checked_func_obj in pending
+                ]
+                for index, future in futures:
+                    try:
+                        data, error = future.result()
+                        func_info = pickle.loads(data) if data is not None else None
+                    except Exception as e:
+                        logging.debug(
+                            f"failed to parse {func_objs[index]} in worker: {e}"
+                        )
+                        continue
+                    if func_info is None and error is None:
+                        # the result cannot be sent back safely, parse it locally instead
+                        continue
+                    results[index] = FunctionParseResult(
+                        func_obj=func_objs[index], function_info=func_info, error=error
+                    )
+                    if self._cache is not None and func_info is not None:
+                        self._cache.put(
+                            self._check_func_obj(func_objs[index]),
+                            func_info,
+                            *self._cache_flags(
+                                ignore_self_param, raw_docstring_as_description
+                            ),
+                        )
+            finally:
+                if own_executor:
+                    executor.shutdown(wait=True)
+
+        for index, func_obj in enumerate(func_objs):
+            if results[index] is None:
+                results[index] = self._parse_for_result(
+                    func_obj, ignore_self_param, raw_docstring_as_description
+                )
+        return results
+
+    def parse_module(
+        self,
+        module: ModuleType,
+        ignore_self_param: bool = True,
+        raw_docstring_as_description: bool = False,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[FunctionParseResult]:
+        """
+        parse all the functions defined in a module (in the order of definition), see parse_many()
+        :param module:
+        :param ignore_self_param:
+        :param raw_docstring_as_description:
+        :param max_workers:
+        :param executor:
+        :return:
+        """
+        func_objs = [
+            obj
+            for obj in vars(module).values()
+            if inspect.isfunction(obj) and obj.__module__ == module.__name__
+        ]
+        return self.parse_many(
+            func_objs,
+            ignore_self_param=ignore_self_param,
+            raw_docstring_as_description=raw_docstring_as_description,
+            max_workers=max_workers,
+            executor=executor,
+        )
+
+    def _parse_for_result(
+        self,
+        func_obj: Any,
+        ignore_self_param: bool,
+        raw_docstring_as_description: bool,
+    ) -> FunctionParseResult:
+        try:
+            func_info = self.parse(
+                func_obj,
+                ignore_self_param=ignore_self_param,
+                raw_docstring_as_description=raw_docstring_as_description,
+            )
+        except Exception as e:
+            return FunctionParseResult(func_obj=func_obj, error=e)
+        return FunctionParseResult(func_obj=func_obj, function_info=func_info)
+
+    def _parse_uncached(
+        self,
+        func_obj: Any,
+        ignore_self_param: bool,
+        raw_docstring_as_description: bool,
+    ) -> FunctionInfo:
         func_info = self._parse_signature(
             func_obj=func_obj, ignore_self_param=ignore_self_param
         )
@@ -94,6 +347,34 @@ class FunctionInfoParser(object):
                 func_info.description = tmp
         return func_info
 
+    @staticmethod
+    def _check_func_obj(func_obj: Any) -> Any:
+        if inspect.isclass(func_obj):
+            func_obj = func_obj.__init__
+
+        if not inspect.isfunction(func_obj) and not inspect.ismethod(func_obj):
+            raise TypeError(f"'{func_obj}' is not a function or method")
+        return func_obj
+
+    def _cache_flags(
+        self, ignore_self_param: bool, raw_docstring_as_description: bool
+    ) -> Tuple[Any, ...]:
+        # registering new types to the resolver changes the widget infos. the fingerprint of the resolver is used
+        # rather than its version, which restarts in every process, since the flags are stored by persistent caches
+        return (
+            ignore_self_param,
+            raw_docstring_as_description,
+            self._widget_resolver.fingerprint(),
+        )
+
+    @staticmethod
+    def _is_picklable(func_obj: Any) -> bool:
+        try:
+            pickle.dumps(func_obj)
+        except Exception:
+            return False
+        return True
+
     def _merge(
         self, func_info: FunctionInfo, func_docstring_info: FunctionDocstringInfo
     ) -> FunctionInfo:
@@ -149,7 +430,9 @@ class FunctionInfoParser(object):
     def _create_param_widget_info(
         self, param_info: ParameterInfo, func_docstring_info: FunctionDocstringInfo
     ) -> ParameterWidgetInfo:
-        widget_info = self.make_default_param_widget_info(param_info)
+        widget_info = self.make_default_param_widget_info(
+            param_info, self._widget_resolver
+        )
         widget_configs = func_docstring_info.get_widget_configs(param_info.name)
         if widget_configs:
             widget_info.update_with_flattened_dict(widget_configs)
@@ -159,33 +442,66 @@ class FunctionInfoParser(object):
     @staticmethod
     def make_default_param_widget_info(
         param_info: ParameterInfo,
+        widget_resolver: Optional[WidgetTypeResolver] = None,
     ) -> ParameterWidgetInfo:
-        widget_class = DEFAULT_WIDGET_TYPES.get(
-            param_info.typename, FALLBACK_WIDGET_TYPE
-        )
-
+        if widget_resolver is None:
+            widget_resolver = default_widget_resolver()
+        resolved = widget_resolver.resolve(param_info.annotation, param_info.typename)
         widget_args = OrderedDict()
+        if resolved is None:
+            widget_class = FALLBACK_WIDGET_TYPE
+        else:
+            widget_class = resolved.widget_class
+            widget_args.update(resolved.default_args)
+
         # some spacial processing for particular types
         if param_info.typename == str(typing.Literal):
             if param_info.type_extras:
                 widget_class = DEFAULT_WIDGET_FOR_LITERALS
                 widget_args["items"] = param_info.type_extras
             else:
-                widget_class = ComboBoxEdit.__name__
+                widget_class = "ComboBoxEdit"
                 widget_args["items"] = []
+        elif (
+            widget_class == DEFAULT_WIDGET_FOR_ENUMS
+            and "items" not in widget_args
+            and is_enum_type(param_info.annotation)
+        ):
+            widget_args["items"] = [
+                (member.name, member) for member in param_info.annotation
+            ]
         # set common args for all widgets
         widget_args["parameter_name"] = param_info.name
         if param_info.default is not DEFAULT_FOR_EMPTY:
             widget_args["default"] = param_info.default
         widget_args["label"] = param_info.name
         widget_args["description"] = param_info.description
-        widget_args["stylesheet"] = None
-        widget_args["set_default_on_init"] = None
-        widget_args["hide_default_value_widget"] = None
-        widget_args["default_value_description"] = None
+        widget_args.setdefault("stylesheet", None)
+        widget_args.setdefault("set_default_on_init", None)
+        widget_args.setdefault("hide_default_value_widget", None)
+        widget_args.setdefault("default_value_description", None)
 
         param_widget_info = ParameterWidgetInfo(
             widget_class=widget_class, widget_args=widget_args
         )
 
         return param_widget_info
+
+
+def _parse_in_worker(
+    func_obj: Any,
+    ignore_self_param: bool,
+    raw_docstring_as_description: bool,
+    widget_resolver: WidgetTypeResolver,
+) -> Tuple[Optional[bytes], Optional[BaseException]]:
+    parser = FunctionInfoParser(widget_resolver=widget_resolver)
+    try:
+        func_info = parser.parse(
+            func_obj,
+            ignore_self_param=ignore_self_param,
+            raw_docstring_as_description=raw_docstring_as_description,
+        )
+    except Exception as e:
+        return None, e
+    # (None, None) means the result cannot be pickled safely
+    return dumps_function_info(func_info), None
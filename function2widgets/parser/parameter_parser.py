@@ -1,6 +1,9 @@
+import collections
+import collections.abc
 import inspect
+import types
 import typing
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Tuple, Dict
 
 from function2widgets.common import parse_type_info
 from function2widgets.info import ParameterInfo
@@ -38,6 +41,115 @@ BASIC_TYPING_TYPES = {
 }
 
 
+# typename for the annotation objects themselves
+BASIC_TYPING_OBJECTS = {
+    typing.Any: "any",
+    typing.AnyStr: "str",
+    typing.Union: str(typing.Union),
+    typing.Optional: str(typing.Optional),
+    typing.Literal: str(typing.Literal),
+}
+
+# typename for the origin of generic aliases, e.g. typing.List[int] and list[int] are both of origin list
+BASIC_GENERIC_ORIGINS = {
+    list: "list",
+    tuple: "tuple",
+    dict: "dict",
+    collections.OrderedDict: "dict",
+    collections.abc.MutableMapping: "dict",
+    collections.abc.Iterable: "list",
+    collections.abc.Sequence: "list",
+    collections.abc.MutableSequence: "list",
+}
+
+_UNION_TYPES = (typing.Union,)
+if getattr(types, "UnionType", None) is not None:
+    # X | Y (PEP 604)
+    _UNION_TYPES += (types.UnionType,)
+
+_Annotated = getattr(typing, "Annotated", None)
+
+_NoneType = type(None)
+
+TYPE_INFO_MEMO_SIZE = 1024
+
+# id(annotation) -> (annotation, (typename, type_extras)), the annotation is kept alive so that its id is not reused.
+# annotations are looked up by identity rather than equality, because Literal[1] == Literal[True] on some versions.
+_type_info_memo: Dict[int, Tuple[Any, Tuple[str, Optional[Tuple[str, ...]]]]] = {}
+
+
+def _type_extra(arg: Any) -> str:
+    if arg is Ellipsis:
+        return "..."
+    if inspect.isclass(arg) and not typing.get_args(arg):
+        return arg.__name__
+    return str(arg)
+
+
+def _resolve_type_info(annotation: Any) -> Tuple[str, Optional[Tuple[str, ...]]]:
+    try:
+        typename = BASIC_TYPES.get(annotation, None) or BASIC_TYPING_OBJECTS.get(
+            annotation, None
+        )
+    except TypeError:
+        # unhashable annotation, e.g. Annotated[int, []]
+        typename = None
+    if typename is not None:
+        return typename, None
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if _Annotated is not None and origin is _Annotated:
+        return _resolve_type_info(args[0])
+
+    if origin is typing.Literal:
+        return str(typing.Literal), tuple(str(arg) for arg in args)
+
+    if origin in _UNION_TYPES:
+        not_none_args = tuple(arg for arg in args if arg is not _NoneType)
+        if len(not_none_args) == 1 and len(args) == 2:
+            return str(typing.Optional), (_type_extra(not_none_args[0]),)
+        return str(typing.Union), tuple(_type_extra(arg) for arg in args)
+
+    typename = BASIC_GENERIC_ORIGINS.get(origin, None)
+    if typename is not None:
+        if not args:
+            return typename, None
+        return typename, tuple(_type_extra(arg) for arg in args)
+
+    if origin is None and inspect.isclass(annotation):
+        return annotation.__name__, None
+    return str(annotation), None
+
+
+def resolve_type_info(annotation: Any) -> (str, Optional[List[str]]):
+    """
+    resolve the typename and the type extras of an annotation object, using typing.get_origin() and typing.get_args()
+    instead of parsing its string representation. results are memorized per annotation object.
+    :param annotation:
+    :return: (typename, type_extras)
+    """
+    if isinstance(annotation, str):
+        # string annotation (forward reference)
+        typename, type_extras = parse_type_info(annotation_str=annotation)
+        typename = BASIC_TYPING_TYPES.get(typename, None)
+        if typename is not None:
+            return typename, type_extras
+        return annotation, None
+    memorized = _type_info_memo.get(id(annotation), None)
+    if memorized is not None and memorized[0] is annotation:
+        typename, type_extras = memorized[1]
+    else:
+        typename, type_extras = _resolve_type_info(annotation)
+        if len(_type_info_memo) >= TYPE_INFO_MEMO_SIZE:
+            _type_info_memo.clear()
+        _type_info_memo[id(annotation)] = (annotation, (typename, type_extras))
+    if type_extras is None:
+        return typename, None
+    return typename, list(type_extras)
+
+
 class ParameterInfoParser(object):
     def __init__(self):
         pass
@@ -52,8 +164,21 @@ class ParameterInfoParser(object):
             default=param_default,
             description=None,
             widget=None,
+            annotation=self._parse_annotation(param_obj=param_obj),
         )
 
+    @staticmethod
+    def _parse_annotation(param_obj: inspect.Parameter) -> Any:
+        if param_obj.annotation is inspect.Parameter.empty:
+            return None
+        # the annotation of *args and **kwargs is the type of their items
+        if param_obj.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            return None
+        return param_obj.annotation
+
     @staticmethod
     def _parse_default(param_obj: inspect.Parameter) -> Any:
         if param_obj.default is inspect.Parameter.empty:
@@ -80,16 +205,4 @@ class ParameterInfoParser(object):
             or param_obj.annotation is inspect.Parameter.empty
         ):
             return None, None
-        typename: str = BASIC_TYPES.get(param_obj.annotation, None)
-        if typename is not None:
-            return typename, None
-
-        annotation_str = str(param_obj.annotation)
-        typename, type_extra = parse_type_info(annotation_str=annotation_str)
-        typename = BASIC_TYPING_TYPES.get(typename, None)
-        if typename is not None:
-            return typename, type_extra
-
-        if inspect.isclass(param_obj.annotation):
-            return param_obj.annotation.__name__, None
-        return annotation_str, None
+        return resolve_type_info(param_obj.annotation)
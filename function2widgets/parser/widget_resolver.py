@@ -0,0 +1,307 @@
+import hashlib
+import inspect
+import marshal
+import threading
+import typing
+from collections import namedtuple
+from typing import Any, Optional, Dict, List, Callable
+
+from function2widgets.common import AlreadyRegisteredError, NotRegisteredError
+
+# the result of a resolution: the name of the widget class and the default widget args for it
+ResolvedWidgetType = namedtuple("ResolvedWidgetType", ["widget_class", "default_args"])
+
+TypePredicate = Callable[[Any], bool]
+
+
+def qualified_name(type_: type) -> str:
+    """
+    the name of a type that can be registered with WidgetTypeResolver.register_type(), e.g. "PyQt6.QtGui.QColor"
+    :param type_:
+    :return:
+    """
+    return f"{type_.__module__}.{type_.__qualname__}"
+
+
+def _type_token(type_: Any) -> str:
+    if isinstance(type_, str):
+        return type_
+    if inspect.isclass(type_):
+        return qualified_name(type_)
+    return repr(type_)
+
+
+def _value_token(value: Any) -> str:
+    # the objects whose repr contains their address make the token differ across processes, which is safe
+    if inspect.isclass(value):
+        return qualified_name(value)
+    return repr(value)
+
+
+def _callable_token(func: Any) -> str:
+    func = getattr(func, "__func__", func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return f"{_type_token(type(func))}:{func!r}"
+    digest = hashlib.sha1(marshal.dumps(code))
+    # the same code may be bound to different values, e.g. lambda t: issubclass(t, cls) in a loop
+    for cell in func.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            # an empty cell
+            contents = None
+        digest.update(_value_token(contents).encode("utf-8"))
+    digest.update(_value_token(func.__defaults__).encode("utf-8"))
+    return f"{func.__module__}.{func.__qualname__}:{digest.hexdigest()}"
+
+
+class _TypeRule(object):
+    __slots__ = ("predicate", "resolved")
+
+    def __init__(self, predicate: TypePredicate, resolved: ResolvedWidgetType):
+        self.predicate = predicate
+        self.resolved = resolved
+
+
+class WidgetTypeResolver(object):
+    """
+    a registry that decides which widget class should be used for a parameter.
+
+    a parameter is resolved in the following order:
+
+    1. its annotation (or the origin of a generic annotation, e.g. list for List[int]) is looked up in the types
+       registered with register_type(), by the type itself or by its qualified name;
+    2. the rules registered with register_type_rule() are tried in the order of registration;
+    3. the bases of the annotation are looked up in the registered types, following its MRO;
+    4. if the parameter is not annotated with a class, its typename is looked up in the typenames registered
+       with register_typename().
+
+    the decisions are memorized, so resolving the same annotation again is a dict lookup. the memo is cleared
+    whenever the registry changes.
+    """
+
+    def __init__(self):
+        self._types: Dict[Any, ResolvedWidgetType] = {}
+        self._typenames: Dict[str, ResolvedWidgetType] = {}
+        self._rules: List[_TypeRule] = []
+        self._memo: Dict[Any, Optional[ResolvedWidgetType]] = {}
+        self._version = 0
+        self._fingerprint: Optional[str] = None
+        self._lock = threading.RLock()
+
+    @property
+    def version(self) -> int:
+        """
+        a number that changes whenever the registry changes, it is meaningful in the current process only, see
+        fingerprint()
+        """
+        return self._version
+
+    def fingerprint(self) -> str:
+        """
+        a digest of the registered types, typenames and rules, which is the same in every process for the same
+        registrations, e.g. to key the parse results stored by a persistent cache. the types are identified by their
+        qualified names and the rules by the code of their predicates.
+        :return:
+        """
+        with self._lock:
+            if self._fingerprint is None:
+                self._fingerprint = self._make_fingerprint()
+            return self._fingerprint
+
+    def register_type(
+        self,
+        type_: Any,
+        widget_class: str,
+        default_args: Optional[Dict[str, Any]] = None,
+        replace: bool = False,
+    ):
+        """
+        use widget_class for the parameters annotated with type_ or with a subclass of type_
+        :param type_: the type, or its qualified name ("<module>.<qualname>", e.g. "PyQt6.QtGui.QColor"), which
+        allows to register a type without importing its module
+        :param widget_class: the name of the widget class
+        :param default_args: the widget args applied before the ones derived from the parameter
+        :param replace: replace the existing mapping of type_ instead of raising AlreadyRegisteredError
+        :return:
+        """
+        with self._lock:
+            if not replace and type_ in self._types:
+                raise AlreadyRegisteredError(f"type {type_} already registered")
+            self._types[type_] = ResolvedWidgetType(
+                widget_class, dict(default_args or {})
+            )
+            self._changed()
+
+    def unregister_type(self, type_: Any):
+        with self._lock:
+            if type_ not in self._types:
+                raise NotRegisteredError(f"type {type_} not registered")
+            del self._types[type_]
+            self._changed()
+
+    def register_typename(
+        self,
+        typename: str,
+        widget_class: str,
+        default_args: Optional[Dict[str, Any]] = None,
+        replace: bool = False,
+    ):
+        """
+        use widget_class for the parameters whose typename is typename, e.g. the ones whose type comes from
+        the docstring rather than an annotation
+        :param typename:
+        :param widget_class: the name of the widget class
+        :param default_args: the widget args applied before the ones derived from the parameter
+        :param replace: replace the existing mapping of typename instead of raising AlreadyRegisteredError
+        :return:
+        """
+        with self._lock:
+            if not replace and typename in self._typenames:
+                raise AlreadyRegisteredError(f"typename {typename} already registered")
+            self._typenames[typename] = ResolvedWidgetType(
+                widget_class, dict(default_args or {})
+            )
+            self._changed()
+
+    def unregister_typename(self, typename: str):
+        with self._lock:
+            if typename not in self._typenames:
+                raise NotRegisteredError(f"typename {typename} not registered")
+            del self._typenames[typename]
+            self._changed()
+
+    def register_type_rule(
+        self,
+        predicate: TypePredicate,
+        widget_class: str,
+        default_args: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        use widget_class for the parameters whose annotation satisfies predicate,
+        e.g. lambda t: inspect.isclass(t) and issubclass(t, enum.Enum)
+        :param predicate: a callable that accepts the annotation and returns a bool
+        :param widget_class: the name of the widget class
+        :param default_args: the widget args applied before the ones derived from the parameter
+        :return:
+        """
+        with self._lock:
+            self._rules.append(
+                _TypeRule(
+                    predicate,
+                    ResolvedWidgetType(widget_class, dict(default_args or {})),
+                )
+            )
+            self._changed()
+
+    def unregister_type_rule(self, predicate: TypePredicate):
+        with self._lock:
+            rules = [rule for rule in self._rules if rule.predicate is not predicate]
+            if len(rules) == len(self._rules):
+                raise NotRegisteredError(f"rule {predicate} not registered")
+            self._rules = rules
+            self._changed()
+
+    def resolve(
+        self, annotation: Any, typename: Optional[str] = None
+    ) -> Optional[ResolvedWidgetType]:
+        """
+        resolve the widget class for a parameter, return None if no mapping is found.
+        the default_args of the result is a new dict owned by the caller.
+        :param annotation: the annotation object of the parameter, None if the parameter is not annotated
+        :param typename: the typename of the parameter
+        :return:
+        """
+        if annotation is None or isinstance(annotation, str):
+            key = typename
+        else:
+            key = (annotation, typename)
+        try:
+            resolved = self._memo[key]
+        except KeyError:
+            with self._lock:
+                resolved = self._resolve(annotation, typename)
+                self._memo[key] = resolved
+        except TypeError:
+            # unhashable annotation
+            with self._lock:
+                resolved = self._resolve(annotation, typename)
+        if resolved is None:
+            return None
+        return ResolvedWidgetType(resolved.widget_class, dict(resolved.default_args))
+
+    def _resolve(
+        self, annotation: Any, typename: Optional[str]
+    ) -> Optional[ResolvedWidgetType]:
+        if annotation is not None and not isinstance(annotation, str):
+            resolved = self._resolve_annotation(annotation)
+            if resolved is not None:
+                return resolved
+            if inspect.isclass(typing.get_origin(annotation) or annotation):
+                # the typename of a class is its __name__, which may collide with the one of an unrelated type
+                return None
+        if typename is None:
+            return None
+        return self._typenames.get(typename, None)
+
+    def _resolve_annotation(self, annotation: Any) -> Optional[ResolvedWidgetType]:
+        origin = typing.get_origin(annotation) or annotation
+        for candidate in (annotation, origin):
+            resolved = self._lookup_type(candidate)
+            if resolved is not None:
+                return resolved
+
+        for rule in self._rules:
+            if rule.predicate(annotation):
+                return rule.resolved
+
+        if inspect.isclass(origin):
+            for base in inspect.getmro(origin)[1:]:
+                resolved = self._lookup_type(base)
+                if resolved is not None:
+                    return resolved
+        return None
+
+    def _lookup_type(self, type_: Any) -> Optional[ResolvedWidgetType]:
+        try:
+            resolved = self._types.get(type_, None)
+        except TypeError:
+            return None
+        if resolved is None and inspect.isclass(type_):
+            resolved = self._types.get(qualified_name(type_), None)
+        return resolved
+
+    def _changed(self):
+        self._version += 1
+        self._memo = {}
+        self._fingerprint = None
+
+    def _make_fingerprint(self) -> str:
+        lines = sorted(
+            f"type {_type_token(type_)} {resolved.widget_class} {_value_token(resolved.default_args)}"
+            for type_, resolved in self._types.items()
+        )
+        lines.extend(
+            sorted(
+                f"typename {typename} {resolved.widget_class} {_value_token(resolved.default_args)}"
+                for typename, resolved in self._typenames.items()
+            )
+        )
+        # the rules are tried in order
+        lines.extend(
+            f"rule {_callable_token(rule.predicate)} {rule.resolved.widget_class} "
+            f"{_value_token(rule.resolved.default_args)}"
+            for rule in self._rules
+        )
+        return hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_memo"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
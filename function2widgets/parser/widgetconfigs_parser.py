@@ -1,47 +1,117 @@
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from function2widgets.common import load_toml
 
 WIDGET_CONFIGS_START_TAG = "@widgets"
 WIDGET_CONFIGS_END_TAG = "@end"
 
+# kept for compatibility only, the parser uses find_widget_configs_block(), this pattern backtracks heavily on
+# large docstrings
 WIDGET_CONFIGS_BLOCK_PATTERN = (
     rf"^(\s*{WIDGET_CONFIGS_START_TAG}\s*(.*\n.+)^\s*{WIDGET_CONFIGS_END_TAG}\s*\n)"
 )
 
+_WHITESPACES = re.compile(r"\s*")
+
+
+def find_widget_configs_block(
+    raw_docstring_text: str,
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    locate the widget configs block in linear time, without backtracking.
+
+    the block starts at the first line beginning with the start tag and ends at the last line consisting of the
+    end tag only. the blank lines right before the start tag and right after the end tag belong to the block too.
+    :param raw_docstring_text:
+    :return: None if no block is found, otherwise a tuple of (block_start, content_start, content_end, block_end)
+    """
+    text = raw_docstring_text
+
+    # find the first line beginning with the start tag. the start of the current line is tracked while scanning
+    # forward, and the rest of a line is skipped once a tag is found in the middle of it, so every character is
+    # visited a bounded number of times
+    start_line = 0
+    start_tag_pos = text.find(WIDGET_CONFIGS_START_TAG)
+    while start_tag_pos >= 0:
+        newline = text.rfind("\n", start_line, start_tag_pos)
+        if newline >= 0:
+            start_line = newline + 1
+        if not text[start_line:start_tag_pos].strip():
+            break
+        newline = text.find("\n", start_tag_pos)
+        if newline < 0:
+            return None
+        start_line = newline + 1
+        start_tag_pos = text.find(WIDGET_CONFIGS_START_TAG, start_line)
+    if start_tag_pos < 0:
+        return None
+    content_start = start_tag_pos + len(WIDGET_CONFIGS_START_TAG)
+
+    # find the last line consisting of the end tag only, scanning backward the same way. the end tags on the line
+    # of the start tag do not count
+    end_line_end = len(text)
+    end_tag_pos = text.rfind(WIDGET_CONFIGS_END_TAG, content_start)
+    while end_tag_pos >= 0:
+        newline = text.rfind("\n", content_start, end_tag_pos)
+        if newline < 0:
+            return None
+        end_line = newline + 1
+        newline = text.find("\n", end_tag_pos, end_line_end)
+        if newline >= 0:
+            end_line_end = newline
+        if text[end_line:end_line_end].strip() == WIDGET_CONFIGS_END_TAG:
+            break
+        end_line_end = end_line - 1
+        end_tag_pos = text.rfind(WIDGET_CONFIGS_END_TAG, content_start, end_line_end)
+    if end_tag_pos < 0:
+        return None
+    content_end = end_line
+
+    # take in the blank lines before the start tag
+    preceding = text[:start_line].rstrip()
+    block_start = text.find("\n", len(preceding)) + 1 if preceding else 0
+
+    # take in the blank lines after the end tag
+    following_end = _WHITESPACES.match(
+        text, end_tag_pos + len(WIDGET_CONFIGS_END_TAG)
+    ).end()
+    last_newline = text.rfind("\n", end_line_end, following_end)
+    block_end = last_newline + 1 if last_newline >= 0 else following_end
+
+    return block_start, content_start, content_end, block_end
+
 
 class WidgetConfigsParser(object):
     def parse(self, raw_docstring_text: str) -> Dict[str, Any]:
-        widget_configs_block = self._extract_widget_configs_block(
-            raw_docstring_text
-        ).strip()
-        return self._parse_widget_configs(widget_configs_block)
+        _, widget_configs_block = self.split_widget_configs_block(raw_docstring_text)
+        return self.parse_widget_configs_block(widget_configs_block)
+
+    def parse_widget_configs_block(self, widget_configs_block: str) -> Dict[str, Any]:
+        return self._parse_widget_configs(widget_configs_block.strip())
 
     @staticmethod
-    def remove_widget_configs_block(raw_docstring_text: str) -> str:
-        match_result = re.search(
-            pattern=WIDGET_CONFIGS_BLOCK_PATTERN,
-            string=raw_docstring_text,
-            flags=re.MULTILINE | re.DOTALL,
+    def split_widget_configs_block(raw_docstring_text: str) -> Tuple[str, str]:
+        """
+        split the raw docstring into the docstring without the widget configs block and the content of the block
+        :param raw_docstring_text:
+        :return: (docstring_text, widget_configs_block)
+        """
+        block = find_widget_configs_block(raw_docstring_text)
+        if block is None:
+            return raw_docstring_text, ""
+        block_start, content_start, content_end, block_end = block
+        docstring_text = (
+            raw_docstring_text[:block_start] + raw_docstring_text[block_end:]
         )
-        if match_result:
-            return re.sub(
-                pattern=WIDGET_CONFIGS_BLOCK_PATTERN,
-                repl="",
-                string=raw_docstring_text,
-                flags=re.MULTILINE | re.DOTALL,
-            )
-        return raw_docstring_text
+        return docstring_text, raw_docstring_text[content_start:content_end]
 
     @staticmethod
-    def _extract_widget_configs_block(raw_docstring_text: str) -> str:
-        match_result = re.search(
-            WIDGET_CONFIGS_BLOCK_PATTERN, raw_docstring_text, re.MULTILINE | re.DOTALL
+    def remove_widget_configs_block(raw_docstring_text: str) -> str:
+        docstring_text, _ = WidgetConfigsParser.split_widget_configs_block(
+            raw_docstring_text
         )
-        if match_result:
-            return match_result.group(2)
-        return ""
+        return docstring_text
 
     @staticmethod
     def _parse_widget_configs(widget_configs_block: str) -> Dict[str, Any]:
@@ -0,0 +1,284 @@
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional, Set
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.info import FunctionInfo
+from function2widgets.parser.function_parser import FunctionInfoParser
+from function2widgets.widget import BaseParameterWidget
+
+
+class WidgetBuildJob(QObject):
+    """
+    the widgets of a function being built by a WidgetPipeline. connect to the signals right after the job is
+    returned by WidgetPipeline.build(), they are emitted on later event loop iterations.
+    """
+
+    # the FunctionInfo of the function
+    parsed = pyqtSignal(object)
+    # the name of the parameter and its widget, the widget has no parent
+    widgetCreated = pyqtSignal(str, object)
+    # the number of the created widgets and the number of the parameters
+    progress = pyqtSignal(int, int)
+    # parameter name -> widget, in the order of the parameters
+    finished = pyqtSignal(object)
+    # the exception raised by the parser or by the creation of a widget
+    failed = pyqtSignal(object)
+
+    def __init__(self, func_obj: Any, lazy: bool, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._func_obj = func_obj
+        self._lazy = lazy
+        self._func_info: Optional[FunctionInfo] = None
+        self._widgets: Dict[str, BaseParameterWidget] = OrderedDict()
+        self._error: Optional[BaseException] = None
+        self._done = False
+        self._cancelled = False
+
+    @property
+    def func_obj(self) -> Any:
+        return self._func_obj
+
+    @property
+    def function_info(self) -> Optional[FunctionInfo]:
+        """
+        the FunctionInfo of the function, None until it is parsed
+        """
+        return self._func_info
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        return self._error
+
+    @property
+    def lazy(self) -> bool:
+        """
+        whether the widgets are LazyParameterWidgets
+        """
+        return self._lazy
+
+    def widgets(self) -> Dict[str, BaseParameterWidget]:
+        """
+        the widgets created so far
+        :return:
+        """
+        return OrderedDict(self._widgets)
+
+    def widget_count(self) -> int:
+        """
+        the number of the widgets created so far
+        :return:
+        """
+        return len(self._widgets)
+
+    def is_done(self) -> bool:
+        """
+        whether the job is finished, failed or cancelled
+        """
+        return self._done
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """
+        stop creating the widgets, the widgets created so far are still owned by the caller (see widgets())
+        :return:
+        """
+        if self._done:
+            return
+        self._cancelled = True
+        self._done = True
+
+    # the methods below are called by WidgetPipeline to advance the job
+
+    def _set_func_info(self, func_info: FunctionInfo):
+        self._func_info = func_info
+        self.parsed.emit(func_info)
+
+    def _add_widget(self, parameter_name: str, widget: BaseParameterWidget):
+        self._widgets[parameter_name] = widget
+        self.widgetCreated.emit(parameter_name, widget)
+
+    def _finish(self):
+        self._done = True
+        self.finished.emit(self.widgets())
+
+    def _fail(self, error: BaseException):
+        self._error = error
+        self._done = True
+        self.failed.emit(error)
+
+
+class WidgetPipeline(QObject):
+    """
+    build the widgets of functions without blocking the event loop: the functions are parsed in a background
+    thread, and their widgets are created on the GUI thread, at most chunk_size widgets per event loop iteration,
+    so that the forms can show the widgets progressively and the GUI stays responsive.
+
+    usage:
+        job = pipeline.build(func)
+        job.widgetCreated.connect(lambda name, widget: layout.addWidget(widget))
+        job.finished.connect(on_finished)
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 8
+
+    # emitted from the background thread with the result of a parse
+    _parsed = pyqtSignal(object)
+
+    def __init__(
+        self,
+        factory: Optional[ParameterWidgetFactory] = None,
+        parser: Optional[FunctionInfoParser] = None,
+        chunk_size: Optional[int] = None,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        :param factory: the factory used to create the widgets, a ParameterWidgetFactory with the basic widgets is
+        used if it is not given
+        :param parser: the parser used in the background thread, a FunctionInfoParser using the type resolver of
+        the factory if it is not given
+        :param chunk_size: the max number of widgets created per event loop iteration, DEFAULT_CHUNK_SIZE if it
+        is None
+        :param parent:
+        """
+        super().__init__(parent)
+        if factory is None:
+            factory = ParameterWidgetFactory()
+        if parser is None:
+            parser = FunctionInfoParser(widget_resolver=factory.type_resolver)
+        if chunk_size is None:
+            chunk_size = self.DEFAULT_CHUNK_SIZE
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive: {chunk_size}")
+
+        self._factory = factory
+        self._parser = parser
+        self._chunk_size = chunk_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # the jobs that are not done yet
+        self._jobs: Set[WidgetBuildJob] = set()
+        # the parsed jobs whose widgets are being created, in the order they are parsed
+        self._creating: Deque[WidgetBuildJob] = deque()
+
+        self._timer = QTimer(self)
+        # one chunk per event loop iteration
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._create_next_chunk)
+
+        self._parsed.connect(self._on_parsed)
+
+    @property
+    def factory(self) -> ParameterWidgetFactory:
+        return self._factory
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    def build(self, func_obj: Any, lazy: bool = False) -> WidgetBuildJob:
+        """
+        start to build the widgets of a function
+        :param func_obj: the function, or its FunctionInfo (e.g. loaded from a spec), which is not parsed again
+        :param lazy: create LazyParameterWidgets, see ParameterWidgetFactory.create_widget_for_parameter()
+        :return: the job, whose signals report the progress
+        """
+        job = WidgetBuildJob(func_obj, lazy)
+        self._jobs.add(job)
+        if isinstance(func_obj, FunctionInfo):
+            # deliver the result on a later event loop iteration too, after the caller has connected to the job
+            QTimer.singleShot(0, lambda: self._on_parsed((job, func_obj, None)))
+            return job
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._executor.submit(self._parse, job)
+        return job
+
+    def pending_jobs(self) -> int:
+        """
+        the number of the jobs whose widgets are waiting to be created
+        :return:
+        """
+        return len(self._creating)
+
+    def close(self):
+        """
+        cancel all the jobs and stop the background thread
+        :return:
+        """
+        for job in self._jobs:
+            job.cancel()
+        self._jobs.clear()
+        self._creating.clear()
+        self._timer.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _parse(self, job: WidgetBuildJob):
+        # runs in the background thread
+        if job.is_cancelled():
+            self._parsed.emit((job, None, None))
+            return
+        try:
+            func_info = self._parser.parse(job.func_obj)
+        except BaseException as e:
+            self._parsed.emit((job, None, e))
+        else:
+            self._parsed.emit((job, func_info, None))
+
+    def _on_parsed(self, result):
+        job, func_info, error = result
+        if job.is_done():
+            self._jobs.discard(job)
+            return
+        if error is not None:
+            self._fail(job, error)
+            return
+        job._set_func_info(func_info)
+        if job.is_done():
+            # cancelled by a slot
+            self._jobs.discard(job)
+            return
+        job.progress.emit(0, len(func_info.parameters))
+        self._creating.append(job)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _create_next_chunk(self):
+        while self._creating and self._creating[0].is_done():
+            self._jobs.discard(self._creating.popleft())
+        if not self._creating:
+            self._timer.stop()
+            return
+
+        job = self._creating[0]
+        parameters = job.function_info.parameters
+        total = len(parameters)
+        start = job.widget_count()
+        for param_info in parameters[start : start + self._chunk_size]:
+            try:
+                widget = self._factory.create_widget_for_parameter(
+                    param_info, lazy=job.lazy
+                )
+            except BaseException as e:
+                self._creating.popleft()
+                self._fail(job, e)
+                return
+            job._add_widget(param_info.name, widget)
+            if job.is_done():
+                # cancelled by a slot
+                return
+        job.progress.emit(job.widget_count(), total)
+
+        if job.widget_count() >= total:
+            self._creating.popleft()
+            self._jobs.discard(job)
+            job._finish()
+
+    def _fail(self, job: WidgetBuildJob, error: BaseException):
+        self._jobs.discard(job)
+        job._fail(error)
@@ -0,0 +1,186 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Type
+
+from PyQt6 import sip
+from PyQt6.QtWidgets import QWidget
+
+from function2widgets.widget import BaseParameterWidget, BaseWidgetArgs
+from function2widgets.widgets.base import CommonParameterWidget
+
+
+class WidgetPool(object):
+    """
+    keep the released parameter widgets and reuse them for new parameters of the same widget class.
+
+    a pooled widget is reused when the args of the new parameter differ from its args in the RECONFIGURABLE_ARGS
+    of its class only, it is reconfigured instead of creating a new widget. the RECONFIGURABLE_ARGS of
+    CommonParameterWidget are the common args (label, description, default, ...), IntSpinBox and FloatSpinBox
+    add their range, step, prefix and suffix. for the other widget classes, a parameter whose widget specific args
+    (e.g. the items of a ComboBox) differ from the ones of every pooled widget is a miss.
+    when the pool is full, the least recently released widgets are deleted.
+    """
+
+    DEFAULT_MAX_PER_CLASS: int = 16
+    DEFAULT_MAX_SIZE: int = 128
+
+    def __init__(
+        self, max_per_class: Optional[int] = None, max_size: Optional[int] = None
+    ):
+        """
+        :param max_per_class: the max number of pooled widgets of each widget class, DEFAULT_MAX_PER_CLASS if it
+        is None
+        :param max_size: the max number of pooled widgets, DEFAULT_MAX_SIZE if it is None
+        """
+        if max_per_class is None:
+            max_per_class = self.DEFAULT_MAX_PER_CLASS
+        if max_size is None:
+            max_size = self.DEFAULT_MAX_SIZE
+        if max_per_class < 0 or max_size < 0:
+            raise ValueError("the pool size limits must not be negative")
+
+        self._max_per_class = max_per_class
+        self._max_size = max_size
+        # widget class -> id of the widget -> widget, the least recently released first
+        self._widgets: Dict[
+            Type[BaseParameterWidget], "OrderedDict[int, CommonParameterWidget]"
+        ] = {}
+        # id of the widget -> widget class, the least recently released first
+        self._lru: "OrderedDict[int, Type[BaseParameterWidget]]" = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_per_class(self) -> int:
+        return self._max_per_class
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def size(self, widget_class: Optional[Type[BaseParameterWidget]] = None) -> int:
+        if widget_class is None:
+            return len(self._lru)
+        return len(self._widgets.get(widget_class, ()))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._lru),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    def release(self, widget: BaseParameterWidget) -> bool:
+        """
+        put the widget into the pool, the widget is hidden and detached from its parent.
+        the slots connected to its valueChanged signal are disconnected. the connections made to its
+        value_change_signals() cannot be told apart from its own ones, the caller must disconnect them before
+        releasing the widget, e.g. with ValueHistory.close().
+        :param widget:
+        :return: False if the widget cannot be pooled (the caller still owns the widget)
+        """
+        if not isinstance(widget, CommonParameterWidget) or sip.isdeleted(widget):
+            return False
+        if self._max_size == 0 or self._max_per_class == 0:
+            return False
+        widget_class = type(widget)
+        key = id(widget)
+        if key in self._lru:
+            return True
+
+        if widget.parentWidget() is not None:
+            # a reparented widget is hidden, but not explicitly, so it is shown by the layout it is added to next
+            widget.setParent(None)
+        elif widget.isVisible():
+            # a window
+            widget.hide()
+        try:
+            # the listeners of the old parameter must not receive the values of the new one
+            widget.valueChanged.disconnect()
+        except TypeError:
+            # nothing is connected
+            pass
+
+        widgets = self._widgets.setdefault(widget_class, OrderedDict())
+        widgets[key] = widget
+        self._lru[key] = widget_class
+
+        while len(widgets) > self._max_per_class:
+            self._evict(widget_class, next(iter(widgets)))
+        while len(self._lru) > self._max_size:
+            oldest_key, oldest_class = next(iter(self._lru.items()))
+            self._evict(oldest_class, oldest_key)
+        return True
+
+    def acquire(
+        self,
+        widget_class: Type[BaseParameterWidget],
+        args: BaseWidgetArgs,
+        parent: Optional[QWidget] = None,
+    ) -> Optional[BaseParameterWidget]:
+        """
+        take a pooled widget of widget_class that can be reconfigured with args, and reconfigure it.
+        the widget is shown if parent is given, otherwise it is shown when it is added to the layout of a visible
+        widget, like a new widget. a widget released while it was shown as a window is hidden explicitly, it must be
+        shown by the caller then.
+        :param widget_class:
+        :param args:
+        :param parent: the new parent of the widget
+        :return: the reconfigured widget, or None if there is no such widget in the pool
+        """
+        widgets = self._widgets.get(widget_class, None)
+        if widgets:
+            # the most recently released first
+            for key in reversed(list(widgets.keys())):
+                widget = widgets[key]
+                if sip.isdeleted(widget):
+                    self._remove(widget_class, key)
+                    continue
+                if widget.can_reconfigure(args):
+                    self._remove(widget_class, key)
+                    widget.reconfigure(args)
+                    self._restore_visibility(widget, parent)
+                    self._hits += 1
+                    return widget
+        self._misses += 1
+        return None
+
+    def clear(self):
+        """
+        delete all the pooled widgets
+        :return:
+        """
+        for widgets in self._widgets.values():
+            for widget in widgets.values():
+                if not sip.isdeleted(widget):
+                    widget.deleteLater()
+        self._widgets.clear()
+        self._lru.clear()
+
+    @staticmethod
+    def _restore_visibility(widget: QWidget, parent: Optional[QWidget]):
+        # showing a parentless widget opens a window, it is left to the layout it is added to
+        if parent is not None:
+            widget.setParent(parent)
+            widget.show()
+
+    def _remove(
+        self, widget_class: Type[BaseParameterWidget], key: int
+    ) -> CommonParameterWidget:
+        widgets = self._widgets[widget_class]
+        widget = widgets.pop(key)
+        if not widgets:
+            del self._widgets[widget_class]
+        self._lru.pop(key, None)
+        return widget
+
+    def _evict(self, widget_class: Type[BaseParameterWidget], key: int):
+        widget = self._remove(widget_class, key)
+        self._evictions += 1
+        if not sip.isdeleted(widget):
+            widget.deleteLater()
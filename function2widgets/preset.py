@@ -0,0 +1,277 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import namedtuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from function2widgets.spec import decode_value, encode_value
+
+# bump this whenever the schema of the store or the layout of the preset bodies changes
+PRESET_STORE_FORMAT_VERSION = 1
+
+# the metadata of a preset, listing the presets does not load their bodies
+PresetInfo = namedtuple("PresetInfo", ["function", "name", "updated_at", "size"])
+
+# the bodies are kept out of the index table, so that listing the presets does not read them
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS presets (
+        id INTEGER PRIMARY KEY,
+        function TEXT NOT NULL,
+        name TEXT NOT NULL,
+        updated_at REAL NOT NULL,
+        size INTEGER NOT NULL,
+        UNIQUE (function, name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS bodies (
+        id INTEGER PRIMARY KEY,
+        compressed INTEGER NOT NULL,
+        body BLOB NOT NULL
+    )
+    """,
+)
+
+
+def function_key(func_obj: Any) -> str:
+    """
+    the key of a function in a PresetStore, "<module>:<qualname>"
+    :param func_obj:
+    :return:
+    """
+    return f"{func_obj.__module__}:{func_obj.__qualname__}"
+
+
+class PresetStore(object):
+    """
+    a store of the saved parameter values (presets) of functions, backed by a SQLite database.
+
+    the presets are indexed by (function, name), the function is a key chosen by the caller, e.g. function_key().
+    the values are stored as compact JSON, the values that JSON cannot represent (Color, datetime, QDateTime,
+    tuples, enum members, paths, ...) are tagged the same way as in the specs (see function2widgets.spec.encode_value()), and the large
+    bodies are compressed. listing the presets reads their metadata only, a body is decoded when it is loaded.
+
+    usage:
+        store = PresetStore("presets.db")
+        store.save(function_key(func), "my preset", form.snapshot())
+        form.restore(store.load(function_key(func), "my preset"))
+    """
+
+    # the bodies larger than this (in bytes) are compressed
+    COMPRESS_THRESHOLD: int = 1024
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        :param path: the path of the database file, created if it does not exist, ":memory:" for a store that is
+        not saved to disk
+        :raise ValueError: if the database is created by a newer version of the store
+        """
+        self._path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            # much faster commits, a preset saved before a crash of the OS may be lost
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version > PRESET_STORE_FORMAT_VERSION:
+                self._conn.close()
+                raise ValueError(
+                    f"the preset store '{path}' has a newer format version: {version}"
+                )
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            self._conn.execute(f"PRAGMA user_version = {PRESET_STORE_FORMAT_VERSION}")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def save(
+        self,
+        function: str,
+        name: str,
+        values: Mapping[str, Any],
+        replace: bool = True,
+    ):
+        """
+        :param function: the key of the function
+        :param name: the name of the preset
+        :param values: parameter name -> value, e.g. the ones returned by ParameterForm.snapshot()
+        :param replace: replace the existing preset with the same name instead of raising KeyError
+        :return:
+        :raise SpecError: if some of the values cannot be stored
+        """
+        row = self._make_row(values)
+        with self._lock, self._conn:
+            if not replace and self._find(function, name) is not None:
+                raise KeyError(f"preset '{name}' of '{function}' already exists")
+            self._put(function, name, row)
+
+    def save_many(self, function: str, presets: Mapping[str, Mapping[str, Any]]):
+        """
+        save (or replace) several presets of a function in a single transaction
+        :param function: the key of the function
+        :param presets: preset name -> values
+        :return:
+        :raise SpecError: if some of the values cannot be stored, no preset is saved then
+        """
+        rows = [(name, self._make_row(values)) for name, values in presets.items()]
+        with self._lock, self._conn:
+            for name, row in rows:
+                self._put(function, name, row)
+
+    def load(self, function: str, name: str) -> Dict[str, Any]:
+        """
+        :param function: the key of the function
+        :param name: the name of the preset
+        :return: parameter name -> value
+        :raise KeyError: if there is no such preset
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT compressed, body FROM presets JOIN bodies USING (id) "
+                "WHERE function = ? AND name = ?",
+                (function, name),
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"no preset '{name}' of '{function}'")
+        compressed, body = row
+        if compressed:
+            body = zlib.decompress(body)
+        return decode_value(json.loads(body.decode("utf-8")))
+
+    def get(
+        self, function: str, name: str, default: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            return self.load(function, name)
+        except KeyError:
+            return default
+
+    def has(self, function: str, name: str) -> bool:
+        with self._lock:
+            return self._find(function, name) is not None
+
+    def delete(self, function: str, name: str) -> bool:
+        """
+        :return: False if there is no such preset
+        """
+        with self._lock, self._conn:
+            preset_id = self._find(function, name)
+            if preset_id is None:
+                return False
+            self._conn.execute("DELETE FROM presets WHERE id = ?", (preset_id,))
+            self._conn.execute("DELETE FROM bodies WHERE id = ?", (preset_id,))
+        return True
+
+    def rename(self, function: str, name: str, new_name: str):
+        """
+        :raise KeyError: if there is no such preset, or a preset named new_name exists
+        """
+        with self._lock, self._conn:
+            try:
+                cursor = self._conn.execute(
+                    "UPDATE presets SET name = ? WHERE function = ? AND name = ?",
+                    (new_name, function, name),
+                )
+            except sqlite3.IntegrityError:
+                raise KeyError(
+                    f"preset '{new_name}' of '{function}' already exists"
+                ) from None
+        if cursor.rowcount == 0:
+            raise KeyError(f"no preset '{name}' of '{function}'")
+
+    def names(self, function: str) -> List[str]:
+        """
+        the names of the presets of a function, sorted
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name FROM presets WHERE function = ? ORDER BY name", (function,)
+            ).fetchall()
+        return [name for name, in rows]
+
+    def presets(self, function: str) -> List[PresetInfo]:
+        """
+        the metadata of the presets of a function, sorted by name. the size is the size of the uncompressed body.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT function, name, updated_at, size FROM presets WHERE function = ? ORDER BY name",
+                (function,),
+            ).fetchall()
+        return [PresetInfo(*row) for row in rows]
+
+    def functions(self) -> List[str]:
+        """
+        the keys of the functions that have presets, sorted
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT function FROM presets ORDER BY function"
+            ).fetchall()
+        return [function for function, in rows]
+
+    def count(self, function: Optional[str] = None) -> int:
+        with self._lock:
+            if function is None:
+                row = self._conn.execute("SELECT COUNT(*) FROM presets").fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM presets WHERE function = ?", (function,)
+                ).fetchone()
+        return row[0]
+
+    def _make_row(self, values: Mapping[str, Any]) -> Tuple[int, bool, bytes]:
+        body = json.dumps(
+            encode_value(dict(values)), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        size = len(body)
+        compressed = size > self.COMPRESS_THRESHOLD
+        if compressed:
+            body = zlib.compress(body)
+        return size, compressed, body
+
+    def _find(self, function: str, name: str) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT id FROM presets WHERE function = ? AND name = ?", (function, name)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _put(self, function: str, name: str, row: Tuple[int, bool, bytes]):
+        # called in a transaction
+        size, compressed, body = row
+        preset_id = self._find(function, name)
+        if preset_id is None:
+            cursor = self._conn.execute(
+                "INSERT INTO presets (function, name, updated_at, size) VALUES (?, ?, ?, ?)",
+                (function, name, time.time(), size),
+            )
+            self._conn.execute(
+                "INSERT INTO bodies (id, compressed, body) VALUES (?, ?, ?)",
+                (cursor.lastrowid, int(compressed), body),
+            )
+        else:
+            self._conn.execute(
+                "UPDATE presets SET updated_at = ?, size = ? WHERE id = ?",
+                (time.time(), size, preset_id),
+            )
+            self._conn.execute(
+                "UPDATE bodies SET compressed = ?, body = ? WHERE id = ?",
+                (int(compressed), body, preset_id),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "PresetStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
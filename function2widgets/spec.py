@@ -0,0 +1,404 @@
+"""
+compiled form specs: a FunctionInfo with the widget class and the widget args of every parameter resolved, stored as
+a versioned, static artifact (JSON or msgpack).
+
+a spec can be built into widgets with ParameterWidgetFactory.create_widgets_for_spec() without importing, inspecting
+or parsing the docstring (and the widget configs) of the function, so the specs can be compiled at build time and
+shipped instead of being parsed at runtime. the JSON specs are also plain, diffable text files that can be used
+to check the forms for unexpected changes.
+
+usage (at build time):
+    python -m function2widgets.spec package.module:function -o function.json
+"""
+
+import argparse
+import base64
+import datetime
+import enum
+import importlib
+import json
+import os
+import pathlib
+import sys
+from typing import Any, Dict, List, Optional, Union
+
+from function2widgets.info import FunctionInfo, ParameterInfo, ParameterWidgetInfo
+from function2widgets.parser.function_parser import (
+    DEFAULT_FOR_EMPTY,
+    FunctionInfoParser,
+)
+from function2widgets.parser.widget_resolver import WidgetTypeResolver
+
+SPEC_FORMAT = "function2widgets.spec"
+# bump this whenever the layout of the specs changes
+SPEC_FORMAT_VERSION = 1
+
+SPEC_FORMAT_JSON = "json"
+SPEC_FORMAT_MSGPACK = "msgpack"
+SPEC_FILE_FORMATS = {
+    ".json": SPEC_FORMAT_JSON,
+    ".msgpack": SPEC_FORMAT_MSGPACK,
+    ".mpk": SPEC_FORMAT_MSGPACK,
+}
+
+# the prefix of the keys of the tagged values, e.g. {"$tuple": [1, 2]}
+_TAG_PREFIX = "$"
+
+
+class SpecError(ValueError):
+    pass
+
+
+def compile_function_spec(
+    func_info: FunctionInfo, type_resolver: Optional[WidgetTypeResolver] = None
+) -> Dict[str, Any]:
+    """
+    compile a FunctionInfo into a spec, a dict made of JSON compatible values only.
+    the parameters that have no widget info are resolved with type_resolver.
+    :param func_info:
+    :param type_resolver: the resolver used for the parameters without widget info, default_widget_resolver()
+    if it is None
+    :return:
+    :raise SpecError: if some of the default values or widget args cannot be stored in a spec
+    """
+    parameters = []
+    for param_info in func_info.parameters:
+        param_widget_info = param_info.widget
+        if not param_widget_info:
+            param_widget_info = FunctionInfoParser.make_default_param_widget_info(
+                param_info, type_resolver
+            )
+        try:
+            parameters.append(
+                {
+                    "name": param_info.name,
+                    "typename": param_info.typename,
+                    "type_extras": encode_value(param_info.type_extras),
+                    "description": param_info.description,
+                    "default": encode_value(param_info.default),
+                    "widget_class": param_widget_info.widget_class,
+                    "widget_args": encode_value(dict(param_widget_info.widget_args)),
+                }
+            )
+        except SpecError as e:
+            raise SpecError(
+                f"parameter '{param_info.name}' of '{func_info.name}': {e}"
+            ) from None
+    return {
+        "format": SPEC_FORMAT,
+        "version": SPEC_FORMAT_VERSION,
+        "name": func_info.name,
+        "description": func_info.description,
+        "parameters": parameters,
+    }
+
+
+def function_info_from_spec(spec: Dict[str, Any]) -> FunctionInfo:
+    """
+    rebuild the FunctionInfo from a spec, the widget info of every parameter is set.
+    the annotations are not stored in the specs, they are always None.
+    :param spec:
+    :return:
+    :raise SpecError: if spec is not a spec of a supported version
+    """
+    check_spec(spec)
+    try:
+        parameters = [
+            ParameterInfo(
+                name=param["name"],
+                default=decode_value(param["default"]),
+                typename=param["typename"],
+                type_extras=decode_value(param["type_extras"]),
+                description=param["description"],
+                widget=ParameterWidgetInfo(
+                    widget_class=param["widget_class"],
+                    widget_args=decode_value(param["widget_args"]),
+                ),
+            )
+            for param in spec["parameters"]
+        ]
+        return FunctionInfo(
+            name=spec["name"], description=spec["description"], parameters=parameters
+        )
+    except (KeyError, TypeError) as e:
+        raise SpecError(f"malformed spec: {e!r}") from None
+
+
+def check_spec(spec: Any):
+    """
+    :param spec:
+    :return:
+    :raise SpecError: if spec is not a spec, or its version is not supported
+    """
+    if not isinstance(spec, dict) or spec.get("format", None) != SPEC_FORMAT:
+        raise SpecError("not a function2widgets spec")
+    version = spec.get("version", None)
+    if version != SPEC_FORMAT_VERSION:
+        raise SpecError(
+            f"unsupported spec version {version}, expected {SPEC_FORMAT_VERSION}"
+        )
+
+
+def dumps_spec(spec: Dict[str, Any], fmt: str = SPEC_FORMAT_JSON) -> Union[str, bytes]:
+    """
+    :param spec:
+    :param fmt: SPEC_FORMAT_JSON (returns a str) or SPEC_FORMAT_MSGPACK (returns bytes, requires msgpack)
+    :return:
+    """
+    if fmt == SPEC_FORMAT_JSON:
+        # indented and in a stable order, so that the specs are easy to diff
+        return json.dumps(spec, indent=2, ensure_ascii=False)
+    if fmt == SPEC_FORMAT_MSGPACK:
+        return _msgpack().packb(spec, use_bin_type=True)
+    raise ValueError(f"unknown spec format: {fmt}")
+
+
+def loads_spec(data: Union[str, bytes], fmt: Optional[str] = None) -> Dict[str, Any]:
+    """
+    :param data:
+    :param fmt: SPEC_FORMAT_JSON or SPEC_FORMAT_MSGPACK, str data is JSON and bytes data is msgpack if it is None
+    :return:
+    :raise SpecError: if data is not a spec of a supported version
+    """
+    if fmt is None:
+        fmt = SPEC_FORMAT_JSON if isinstance(data, str) else SPEC_FORMAT_MSGPACK
+    if fmt == SPEC_FORMAT_JSON:
+        spec = json.loads(data)
+    elif fmt == SPEC_FORMAT_MSGPACK:
+        spec = _msgpack().unpackb(data, raw=False)
+    else:
+        raise ValueError(f"unknown spec format: {fmt}")
+    check_spec(spec)
+    return spec
+
+
+def write_spec_file(path: str, spec: Dict[str, Any], fmt: Optional[str] = None):
+    """
+    :param path:
+    :param spec:
+    :param fmt: the format is determined by the suffix of path (see SPEC_FILE_FORMATS) if it is None
+    :return:
+    """
+    data = dumps_spec(spec, fmt or _format_of(path))
+    if isinstance(data, str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+def read_spec_file(path: str, fmt: Optional[str] = None) -> Dict[str, Any]:
+    """
+    :param path:
+    :param fmt: the format is determined by the suffix of path (see SPEC_FILE_FORMATS) if it is None
+    :return:
+    :raise SpecError: if the file is not a spec of a supported version
+    """
+    fmt = fmt or _format_of(path)
+    if fmt == SPEC_FORMAT_JSON:
+        with open(path, "r", encoding="utf-8") as f:
+            return loads_spec(f.read(), fmt)
+    with open(path, "rb") as f:
+        return loads_spec(f.read(), fmt)
+
+
+def encode_value(value: Any) -> Any:
+    """
+    encode a default value or a widget arg into a JSON compatible value.
+    the values that JSON cannot represent as they are (tuples, sets, bytes, dates and times, colors, enum members,
+    paths, dicts with non-str keys, the default of the parameters without default) are stored as tagged values,
+    e.g. {"$tuple": [...]}.
+    enum members are stored by the name of their class, which must be importable, e.g. {"$enum": ["mod:Color", "RED"]};
+    paths are decoded as pathlib.Path.
+    :param value:
+    :return:
+    :raise SpecError: if the value cannot be encoded
+    """
+    # enum members may be ints or strs too (IntEnum, StrEnum), check them first
+    if isinstance(value, enum.Enum):
+        enum_class = type(value)
+        if "<locals>" in enum_class.__qualname__:
+            raise SpecError(f"cannot encode member of local enum {enum_class!r}")
+        return {
+            "$enum": [f"{enum_class.__module__}:{enum_class.__qualname__}", value.name]
+        }
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if value is DEFAULT_FOR_EMPTY:
+        return {"$empty": None}
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {"$tuple": [encode_value(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        items = [encode_value(item) for item in value]
+        try:
+            # sets have no order, sort them to keep the specs stable
+            items.sort()
+        except TypeError:
+            pass
+        return {"$set": items}
+    if isinstance(value, dict):
+        if all(
+            isinstance(key, str) and not key.startswith(_TAG_PREFIX) for key in value
+        ):
+            return {key: encode_value(item) for key, item in value.items()}
+        return {
+            "$dict": [
+                [encode_value(key), encode_value(item)] for key, item in value.items()
+            ]
+        }
+    if isinstance(value, pathlib.PurePath):
+        return {"$path": str(value)}
+    if isinstance(value, bytes):
+        return {"$bytes": base64.b64encode(value).decode("ascii")}
+    # datetime is a subclass of date
+    if isinstance(value, datetime.datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"$time": value.isoformat()}
+
+    # check the types by name, so that encoding the specs does not import Qt
+    type_name = f"{type(value).__module__}.{type(value).__qualname__}"
+    if type_name == "function2widgets.color.Color":
+        return {"$color": list(value.to_rgb_tuple(with_alpha=True))}
+    if type_name == "PyQt6.QtGui.QColor":
+        return {"$qcolor": value.name(value.NameFormat.HexArgb)}
+    if type_name == "PyQt6.QtCore.QDateTime":
+        return {"$qdatetime": value.toString("yyyy-MM-ddTHH:mm:ss.zzz")}
+    if type_name == "PyQt6.QtCore.QDate":
+        return {"$qdate": value.toString("yyyy-MM-dd")}
+    if type_name == "PyQt6.QtCore.QTime":
+        return {"$qtime": value.toString("HH:mm:ss.zzz")}
+    raise SpecError(f"cannot encode value of type {type_name}: {value!r}")
+
+
+def decode_value(value: Any) -> Any:
+    """
+    the reverse of encode_value()
+    :param value:
+    :return:
+    :raise SpecError: if the value has an unknown tag, or names an enum member that cannot be imported
+    """
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) != 1:
+        return {key: decode_value(item) for key, item in value.items()}
+    tag, data = next(iter(value.items()))
+    if not tag.startswith(_TAG_PREFIX):
+        return {tag: decode_value(data)}
+
+    if tag == "$empty":
+        return DEFAULT_FOR_EMPTY
+    if tag == "$tuple":
+        return tuple(decode_value(item) for item in data)
+    if tag == "$set":
+        return set(decode_value(item) for item in data)
+    if tag == "$dict":
+        return {decode_value(key): decode_value(item) for key, item in data}
+    if tag == "$bytes":
+        return base64.b64decode(data)
+    if tag == "$datetime":
+        return datetime.datetime.fromisoformat(data)
+    if tag == "$date":
+        return datetime.date.fromisoformat(data)
+    if tag == "$time":
+        return datetime.time.fromisoformat(data)
+    if tag == "$enum":
+        target, member_name = data
+        try:
+            return _import_object(target)[member_name]
+        except (ImportError, AttributeError, KeyError, ValueError) as e:
+            raise SpecError(
+                f"cannot decode enum member {target}.{member_name}: {e!r}"
+            ) from None
+    if tag == "$path":
+        return pathlib.Path(data)
+    if tag == "$color":
+        from function2widgets.color import Color
+
+        return Color(*data)
+    if tag == "$qcolor":
+        from PyQt6.QtGui import QColor
+
+        return QColor.fromString(data)
+    if tag == "$qdatetime":
+        from PyQt6.QtCore import QDateTime
+
+        return QDateTime.fromString(data, "yyyy-MM-ddTHH:mm:ss.zzz")
+    if tag == "$qdate":
+        from PyQt6.QtCore import QDate
+
+        return QDate.fromString(data, "yyyy-MM-dd")
+    if tag == "$qtime":
+        from PyQt6.QtCore import QTime
+
+        return QTime.fromString(data, "HH:mm:ss.zzz")
+    raise SpecError(f"unknown tag: {tag}")
+
+
+def _format_of(path: str) -> str:
+    suffix = os.path.splitext(path)[1].lower()
+    fmt = SPEC_FILE_FORMATS.get(suffix, None)
+    if fmt is None:
+        raise ValueError(f"cannot determine the spec format of '{path}'")
+    return fmt
+
+
+def _msgpack():
+    # msgpack is an optional dependency, it is needed only for the msgpack specs
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "msgpack is required to read or write msgpack specs: pip install msgpack"
+        ) from None
+    return msgpack
+
+
+def _import_object(target: str) -> Any:
+    module_name, _, qualname = target.partition(":")
+    if not qualname:
+        raise ValueError(f"expected <module>:<function>, got '{target}'")
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m function2widgets.spec",
+        description="compile the spec of a function",
+    )
+    arg_parser.add_argument(
+        "function", help="the function to compile, <module>:<function>"
+    )
+    arg_parser.add_argument(
+        "-o", "--output", help="the spec file, print the JSON spec if not given"
+    )
+    arg_parser.add_argument("--format", choices=[SPEC_FORMAT_JSON, SPEC_FORMAT_MSGPACK])
+    arg_parser.add_argument(
+        "--keep-self", action="store_true", help="keep the self parameter of methods"
+    )
+    args = arg_parser.parse_args(argv)
+
+    func_obj = _import_object(args.function)
+    func_info = FunctionInfoParser().parse(
+        func_obj, ignore_self_param=not args.keep_self
+    )
+    spec = compile_function_spec(func_info)
+    if args.output:
+        write_spec_file(args.output, spec, args.format)
+    else:
+        print(dumps_spec(spec, args.format or SPEC_FORMAT_JSON))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+the ways a parameter widget owns the values passed to set_value() and returned by get_value()
+(the value_ownership arg of CommonParameterWidget):
+
+    deepcopy    the values are deep copied when they are set and when they are read. safe but O(n) for large
+                containers on every access, this is the default. the default value is not copied when the args are
+                created, the caller must not modify it in place (except in frozen mode).
+    shallow     the values are shallow copied, the nested containers are shared with the caller.
+    frozen      the values are frozen when they are set: lists, dicts and sets become FrozenList, FrozenDict and
+                frozenset (recursively), and Colors become FrozenColors, whose modifications raise TypeError.
+                the immutable scalars (numbers, strings, dates and times, enum members, paths, ...) are kept as
+                they are, only the other objects are deep copied. reading a value returns the frozen value
+                itself, which is O(1). FrozenList and FrozenDict are subclasses of list and dict,
+                so they can be passed to code that expects lists and dicts (and serialized as JSON), as long as
+                that code does not modify them. use thaw() to get a mutable copy.
+    shared      the values are neither copied nor frozen, the caller must not modify them (or the stored default
+                value) in place.
+"""
+
+import copy
+import datetime
+import decimal
+import enum
+import fractions
+import pathlib
+import uuid
+from typing import Any
+
+from function2widgets.color import Color
+
+VALUE_OWNERSHIP_DEEPCOPY = "deepcopy"
+VALUE_OWNERSHIP_SHALLOW = "shallow"
+VALUE_OWNERSHIP_FROZEN = "frozen"
+VALUE_OWNERSHIP_SHARED = "shared"
+
+VALUE_OWNERSHIP_MODES = (
+    VALUE_OWNERSHIP_DEEPCOPY,
+    VALUE_OWNERSHIP_SHALLOW,
+    VALUE_OWNERSHIP_FROZEN,
+    VALUE_OWNERSHIP_SHARED,
+)
+
+# the types whose values are immutable, they are never copied
+_ATOMIC_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    range,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    datetime.tzinfo,
+    decimal.Decimal,
+    fractions.Fraction,
+    enum.Enum,
+    pathlib.PurePath,
+    uuid.UUID,
+)
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(
+        f"'{type(self).__name__}' object is frozen, use thaw() to get a mutable copy"
+    )
+
+
+class FrozenList(list):
+    """
+    a list that cannot be modified, see freeze()
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    clear = _readonly
+    sort = _readonly
+    reverse = _readonly
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenList":
+        return self
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+
+class FrozenDict(dict):
+    """
+    a dict that cannot be modified, see freeze()
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenDict":
+        return self
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+
+def _readonly_property(name: str) -> property:
+    return property(getattr(Color, name).fget, _readonly)
+
+
+class FrozenColor(Color):
+    """
+    a Color that cannot be modified, see freeze()
+    """
+
+    r = _readonly_property("r")
+    g = _readonly_property("g")
+    b = _readonly_property("b")
+    a = _readonly_property("a")
+
+    def __reduce__(self):
+        return self.__class__, self.to_rgb_tuple()
+
+    def __copy__(self) -> "FrozenColor":
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenColor":
+        return self
+
+
+_FROZEN_TYPES = _ATOMIC_TYPES + (FrozenList, FrozenDict, FrozenColor)
+
+
+def is_frozen(value: Any) -> bool:
+    """
+    whether the value is immutable as a whole, i.e. freeze() returns it as it is
+    """
+    if isinstance(value, _FROZEN_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_frozen(item) for item in value)
+    return False
+
+
+def freeze(value: Any) -> Any:
+    """
+    make an immutable version of the value: lists, dicts and sets (and the containers nested in them and in tuples)
+    are converted to FrozenList, FrozenDict and frozenset, and Colors to FrozenColors. the immutable scalars and
+    the frozen values are returned as they are, so freezing a value again is O(1). the other objects are deep
+    copied, since they cannot be frozen.
+    :param value:
+    :return:
+    """
+    if isinstance(value, _FROZEN_TYPES):
+        return value
+    if isinstance(value, Color):
+        return FrozenColor(*value.to_rgb_tuple())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        if is_frozen(value):
+            return value
+        items = [freeze(item) for item in value]
+        if hasattr(value, "_fields"):
+            # namedtuple
+            return type(value)(*items)
+        return type(value)(items)
+    return copy.deepcopy(value)
+
+
+def thaw(value: Any) -> Any:
+    """
+    make a mutable deep copy of a frozen value: FrozenLists, FrozenDicts and frozensets are converted to lists,
+    dicts and sets
+    :param value:
+    :return:
+    """
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    if isinstance(value, Color):
+        return Color(*value.to_rgb_tuple())
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return {thaw(item) for item in value}
+    if isinstance(value, tuple):
+        items = [thaw(item) for item in value]
+        if hasattr(value, "_fields"):
+            return type(value)(*items)
+        return type(value)(items)
+    return copy.deepcopy(value)
+
+
+def check_value_ownership(value_ownership: str):
+    """
+    :raise ValueError: if value_ownership is not one of VALUE_OWNERSHIP_MODES
+    """
+    if value_ownership not in VALUE_OWNERSHIP_MODES:
+        raise ValueError(
+            f"unknown value ownership '{value_ownership}', expected one of {VALUE_OWNERSHIP_MODES}"
+        )
+
+
+def import_value(value: Any, value_ownership: str) -> Any:
+    """
+    get the version of a value passed to set_value() that is stored by a widget
+    :param value:
+    :param value_ownership: one of VALUE_OWNERSHIP_MODES
+    :return:
+    """
+    if value_ownership == VALUE_OWNERSHIP_DEEPCOPY:
+        return copy.deepcopy(value)
+    if value_ownership == VALUE_OWNERSHIP_FROZEN:
+        return freeze(value)
+    if value_ownership == VALUE_OWNERSHIP_SHALLOW:
+        return copy.copy(value)
+    return value
+
+
+def export_value(value: Any, value_ownership: str) -> Any:
+    """
+    get the version of a value (or the default value) stored by a widget that is returned by get_value()
+    :param value:
+    :param value_ownership: one of VALUE_OWNERSHIP_MODES
+    :return:
+    """
+    if value_ownership == VALUE_OWNERSHIP_DEEPCOPY:
+        return copy.deepcopy(value)
+    if value_ownership == VALUE_OWNERSHIP_FROZEN:
+        # O(1) for the values imported (or the defaults normalized) in frozen mode
+        return freeze(value)
+    if value_ownership == VALUE_OWNERSHIP_SHALLOW:
+        return copy.copy(value)
+    return value
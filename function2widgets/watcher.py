@@ -0,0 +1,326 @@
+import importlib
+import inspect
+import os
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from function2widgets.diff import diff_function_info
+from function2widgets.info import FunctionInfo
+from function2widgets.panel import VirtualParameterPanel
+from function2widgets.parser.function_parser import FunctionInfoParser
+
+_NOT_POLLED = object()
+
+
+class _WatchedFunction(object):
+    __slots__ = ("key", "module_name", "qualname", "path", "func_info", "panels")
+
+    def __init__(
+        self,
+        key: str,
+        module_name: str,
+        qualname: str,
+        path: str,
+        func_info: FunctionInfo,
+    ):
+        self.key = key
+        self.module_name = module_name
+        self.qualname = qualname
+        self.path = path
+        self.func_info = func_info
+        self.panels: List[VirtualParameterPanel] = []
+
+
+class FunctionWatcher(QObject):
+    """
+    watch the module files of functions, and parse the functions again when their files change, e.g. to refresh
+    the forms while developing the functions.
+
+    the files are watched with QFileSystemWatcher (inotify on linux), or polled if a file cannot be watched that
+    way. the changes are debounced, then the modules are reloaded and the functions are parsed in a background
+    thread, and the results are delivered on the thread of the watcher (the GUI thread): the panels bound to the
+    functions are updated with VirtualParameterPanel.update_function() and functionChanged is emitted.
+
+    only VirtualParameterPanels are updated by the watcher. to update the widgets of a ParameterForm or of a plain
+    layout, connect to functionChanged and call ParameterWidgetFactory.update_widgets_for_function() with the
+    previous and the new FunctionInfo.
+
+    reloading a module executes it again in the background thread, so the watched modules should not create
+    Qt objects at import time.
+    """
+
+    DEFAULT_DEBOUNCE_MS: int = 300
+    DEFAULT_POLL_INTERVAL_MS: int = 1000
+
+    # the key of the function (see watch()), the new FunctionInfo and the FunctionInfoDiff from the previous one
+    functionChanged = pyqtSignal(str, object, object)
+    # the path of the module file or the key of the function, and the exception
+    reloadFailed = pyqtSignal(str, object)
+
+    # emitted from the background thread with the result of a reload
+    _reloaded = pyqtSignal(object)
+
+    def __init__(
+        self,
+        parser: Optional[FunctionInfoParser] = None,
+        debounce_ms: Optional[int] = None,
+        poll_interval_ms: Optional[int] = None,
+        use_file_system_watcher: bool = True,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        :param parser: the parser used to parse the functions, a new FunctionInfoParser if it is not given
+        :param debounce_ms: the time to wait for more changes before reloading a file, DEFAULT_DEBOUNCE_MS if it
+        is None
+        :param poll_interval_ms: the interval of polling the files that QFileSystemWatcher cannot watch,
+        DEFAULT_POLL_INTERVAL_MS if it is None
+        :param use_file_system_watcher: poll all the files instead of using QFileSystemWatcher
+        :param parent:
+        """
+        super().__init__(parent)
+        if parser is None:
+            parser = FunctionInfoParser()
+        if debounce_ms is None:
+            debounce_ms = self.DEFAULT_DEBOUNCE_MS
+        if poll_interval_ms is None:
+            poll_interval_ms = self.DEFAULT_POLL_INTERVAL_MS
+
+        self._parser = parser
+        self._functions: Dict[str, _WatchedFunction] = {}
+        # path -> the keys of the functions defined in the file
+        self._files: Dict[str, Set[str]] = {}
+        # path -> the last seen mtime of the polled files
+        self._polled_files: Dict[str, Optional[int]] = {}
+        # path -> the number of the reloads of the file, the results of the outdated reloads are dropped
+        self._generations: Dict[str, int] = {}
+        self._pending_files: Set[str] = set()
+        # the parsing runs in a single thread, so the modules are not reloaded concurrently
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._file_system_watcher: Optional[QFileSystemWatcher] = None
+        if use_file_system_watcher:
+            self._file_system_watcher = QFileSystemWatcher(self)
+            self._file_system_watcher.fileChanged.connect(self._on_file_changed)
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._reload_pending_files)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self._poll_files)
+
+        self._reloaded.connect(self._on_reloaded)
+
+    def watch(
+        self, func_obj: Any, panel: Optional[VirtualParameterPanel] = None
+    ) -> str:
+        """
+        start to watch the module file of a function
+        :param func_obj: a module level function or class, or a method of a module level class
+        :param panel: the panel updated when the function changes, it is set to the function if it is given
+        :return: the key of the function, "<module>:<qualname>"
+        :raise ValueError: if the function cannot be found again after its module is reloaded, or its source
+        file is unknown
+        """
+        module_name = getattr(func_obj, "__module__", None)
+        qualname = getattr(func_obj, "__qualname__", None)
+        if not module_name or not qualname or "<locals>" in qualname:
+            raise ValueError(f"'{func_obj}' is not defined at the module level")
+        key = f"{module_name}:{qualname}"
+
+        entry = self._functions.get(key, None)
+        if entry is None:
+            path = inspect.getsourcefile(func_obj)
+            if path is None:
+                raise ValueError(f"the source file of '{func_obj}' is unknown")
+            path = os.path.abspath(path)
+            func_info = self._parser.parse(func_obj)
+            entry = _WatchedFunction(key, module_name, qualname, path, func_info)
+            self._functions[key] = entry
+            self._watch_file(path, key)
+
+        if panel is not None:
+            if panel not in entry.panels:
+                entry.panels.append(panel)
+            panel.set_function(entry.func_info)
+        return key
+
+    def unwatch(self, key: str, panel: Optional[VirtualParameterPanel] = None):
+        """
+        :param key: the key returned by watch()
+        :param panel: stop updating this panel only
+        :return:
+        """
+        entry = self._functions.get(key, None)
+        if entry is None:
+            return
+        if panel is not None:
+            if panel in entry.panels:
+                entry.panels.remove(panel)
+            return
+        del self._functions[key]
+        keys = self._files.get(entry.path, None)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                self._unwatch_file(entry.path)
+
+    def watched_functions(self) -> List[str]:
+        return list(self._functions)
+
+    def function_info(self, key: str) -> FunctionInfo:
+        """
+        the latest FunctionInfo of a watched function
+        :param key:
+        :return:
+        """
+        return self._functions[key].func_info
+
+    def close(self):
+        """
+        stop watching all the functions, the reloads in progress are dropped
+        :return:
+        """
+        for path in list(self._files):
+            self._unwatch_file(path)
+        self._functions.clear()
+        self._pending_files.clear()
+        self._debounce_timer.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _watch_file(self, path: str, key: str):
+        keys = self._files.get(path, None)
+        if keys is not None:
+            keys.add(key)
+            return
+        self._files[path] = {key}
+        self._generations.setdefault(path, 0)
+        if self._file_system_watcher is not None and self._file_system_watcher.addPath(
+            path
+        ):
+            return
+        self._polled_files[path] = self._mtime(path)
+        if not self._poll_timer.isActive():
+            self._poll_timer.start()
+
+    def _unwatch_file(self, path: str):
+        del self._files[path]
+        self._pending_files.discard(path)
+        if self._polled_files.pop(path, _NOT_POLLED) is not _NOT_POLLED:
+            if not self._polled_files:
+                self._poll_timer.stop()
+        elif self._file_system_watcher is not None:
+            self._file_system_watcher.removePath(path)
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _poll_files(self):
+        for path, mtime in list(self._polled_files.items()):
+            new_mtime = self._mtime(path)
+            if new_mtime != mtime:
+                self._polled_files[path] = new_mtime
+                self._on_file_changed(path)
+
+    def _on_file_changed(self, path: str):
+        if path not in self._files:
+            return
+        if (
+            self._file_system_watcher is not None
+            and path not in self._polled_files
+            and path not in self._file_system_watcher.files()
+        ):
+            # some editors save a file by replacing it, which removes it from the watcher
+            if not self._file_system_watcher.addPath(path):
+                self._polled_files[path] = self._mtime(path)
+                if not self._poll_timer.isActive():
+                    self._poll_timer.start()
+        self._pending_files.add(path)
+        # wait for more changes, e.g. an editor may write a file in several steps
+        self._debounce_timer.start()
+
+    def _reload_pending_files(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        for path in self._pending_files:
+            self._generations[path] += 1
+            targets = [
+                (key, self._functions[key].module_name, self._functions[key].qualname)
+                for key in self._files.get(path, ())
+            ]
+            self._executor.submit(self._reload, path, self._generations[path], targets)
+        self._pending_files.clear()
+
+    def _reload(self, path: str, generation: int, targets: List[Tuple[str, str, str]]):
+        # runs in the background thread
+        results: Dict[str, Any] = {}
+        error: Optional[BaseException] = None
+        try:
+            modules = {}
+            for _, module_name, _ in targets:
+                if module_name in modules:
+                    continue
+                module = sys.modules.get(module_name, None)
+                if module is None:
+                    module = importlib.import_module(module_name)
+                else:
+                    module = importlib.reload(module)
+                modules[module_name] = module
+
+            for key, module_name, qualname in targets:
+                try:
+                    func_obj = modules[module_name]
+                    for attr in qualname.split("."):
+                        func_obj = getattr(func_obj, attr)
+                    results[key] = self._parser.parse(func_obj)
+                except BaseException as e:
+                    results[key] = e
+        except BaseException as e:
+            error = e
+        self._reloaded.emit((path, generation, results, error))
+
+    def _on_reloaded(
+        self, result: Tuple[str, int, Dict[str, Any], Optional[BaseException]]
+    ):
+        path, generation, results, error = result
+        if self._generations.get(path, None) != generation or path not in self._files:
+            # the file has changed again, or is no longer watched
+            return
+        if error is not None:
+            self.reloadFailed.emit(path, error)
+            return
+
+        for key, func_info in results.items():
+            entry = self._functions.get(key, None)
+            if entry is None:
+                continue
+            if isinstance(func_info, BaseException):
+                self.reloadFailed.emit(key, func_info)
+                continue
+            # the parameters without widget info are resolved the way the parser resolves them
+            diff = diff_function_info(
+                entry.func_info, func_info, self._parser.widget_resolver
+            )
+            entry.func_info = func_info
+            if not diff:
+                continue
+            entry.panels = [panel for panel in entry.panels if not sip.isdeleted(panel)]
+            for panel in entry.panels:
+                try:
+                    panel.update_function(func_info)
+                except Exception as e:
+                    warnings.warn(f"cannot update the panel of '{key}': {e}")
+            self.functionChanged.emit(key, func_info, diff)
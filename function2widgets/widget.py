@@ -1,14 +1,24 @@
 import abc
 import dataclasses
-from typing import Any, Optional, Type, Dict
+import difflib
+from typing import Any, Optional, Type, Dict, Tuple, List
 
+from PyQt6.QtCore import QMetaMethod, QObject, QTimer, pyqtBoundSignal, pyqtSignal
 from PyQt6.QtWidgets import QWidget
 
+from function2widgets.common import values_equal
+
+_NO_VALUE = object()
+
 
 class InvalidValueError(ValueError):
     pass
 
 
+class WidgetArgsError(TypeError):
+    pass
+
+
 @dataclasses.dataclass(frozen=True)
 class BaseWidgetArgs(object):
     parameter_name: str
@@ -25,6 +35,17 @@ class BaseWidgetArgs(object):
         return cls(**kwargs)
 
 
+_ARGS_FIELD_NAMES: Dict[Type[BaseWidgetArgs], Tuple[str, ...]] = {}
+
+
+def _args_field_names(args_class: Type[BaseWidgetArgs]) -> Tuple[str, ...]:
+    field_names = _ARGS_FIELD_NAMES.get(args_class, None)
+    if field_names is None:
+        field_names = tuple(f.name for f in dataclasses.fields(args_class) if f.init)
+        _ARGS_FIELD_NAMES[args_class] = field_names
+    return field_names
+
+
 class BaseParameterWidget(QWidget):
     """
     base class of all parameter widgets
@@ -32,51 +53,88 @@ class BaseParameterWidget(QWidget):
 
     SET_DEFAULT_ON_INIT: bool = True
     HIDE_DEFAULT_VALUE_WIDGET: bool = False
+    # the default timing of valueChanged, see value_changed_timing()
+    VALUE_CHANGED_DEBOUNCE_MS: int = 0
+    VALUE_CHANGED_THROTTLE_MS: int = 0
 
     _WidgetArgsClass = BaseWidgetArgs
 
+    # the new value of the parameter, emitted once the value settles, see value_changed_timing()
+    valueChanged = pyqtSignal(object)
+
+    # created when valueChanged is connected for the first time, the widgets nobody listens to do not watch their
+    # value at all
+    _value_changed_notifier: Optional["_ValueChangedNotifier"] = None
+
     def __init__(self, args: BaseWidgetArgs, parent: Optional[QWidget]):
         super().__init__(parent)
 
+        self.__args = self._prepare_args(args)
+
+        if self.__args.stylesheet is not None:
+            self.setStyleSheet(self.__args.stylesheet)
+
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
         """
+        normalize (and validate) the values of the widget args in place, before they are used by the widget.
+        subclasses that need to adjust their args should override this method and call the super one.
+
         Note:
         1. if 'set_default_on_init' is None, it will be set to class field SET_DEFAULT_ON_INIT
         2. if 'hide_default_value_widget' is None, it will be set to class field HIDE_DEFAULT_VALUE_WIDGET
         3. 'set_default_on_init' will be set to True if 'default' is not None and 'hide_default_value_widget' is True
         4. 'hide_value_default_widget' will be set to False if 'default' is None
         5. 'label' will be set to 'parameter_name', if it is set to None
+
+        :param values: field name -> value of the widget args
+        :return:
         """
         # 1
-        if args.set_default_on_init is None:
-            set_default_on_init = self.__class__.SET_DEFAULT_ON_INIT
-        else:
-            set_default_on_init = args.set_default_on_init
+        if values["set_default_on_init"] is None:
+            values["set_default_on_init"] = cls.SET_DEFAULT_ON_INIT
         # 2
-        if args.hide_default_value_widget is None:
-            hide_default_value_widget = self.__class__.HIDE_DEFAULT_VALUE_WIDGET
-        else:
-            hide_default_value_widget = args.hide_default_value_widget
+        if values["hide_default_value_widget"] is None:
+            values["hide_default_value_widget"] = cls.HIDE_DEFAULT_VALUE_WIDGET
         # 3
-        if args.default is not None and hide_default_value_widget is True:
-            set_default_on_init = True
+        if (
+            values["default"] is not None
+            and values["hide_default_value_widget"] is True
+        ):
+            values["set_default_on_init"] = True
         # 4
-        if args.default is None:
-            hide_default_value_widget = False
+        if values["default"] is None:
+            values["hide_default_value_widget"] = False
         # 5
-        if args.label is None:
-            label = args.parameter_name
-        else:
-            label = args.label
-
-        self.__args = dataclasses.replace(
-            args,
-            label=label,
-            set_default_on_init=set_default_on_init,
-            hide_default_value_widget=hide_default_value_widget,
-        )
+        if values["label"] is None:
+            values["label"] = values["parameter_name"]
 
-        if self.__args.stylesheet is not None:
-            self.setStyleSheet(self.__args.stylesheet)
+    @classmethod
+    def normalize_value(cls, args: BaseWidgetArgs, value: Any) -> Any:
+        """
+        map a value passed to set_value() to the value returned by get_value() without a widget, e.g. the text of
+        an item of a ComboBox to its data, so that the proxies of the widget (LazyParameterWidget and the
+        off-screen rows of VirtualParameterPanel) return what the widget would return
+        :param args: the (normalized) args of the widget
+        :param value:
+        :return:
+        """
+        return value
+
+    @classmethod
+    def _prepare_args(cls, args: BaseWidgetArgs) -> BaseWidgetArgs:
+        # args created by WidgetArgsBuilder are normalized already, they are replaced only if something changes.
+        # the values are compared by identity: a normalized value may equal the original one but differ from it,
+        # e.g. a frozen copy of a list
+        original = {name: getattr(args, name) for name in _args_field_names(type(args))}
+        values = dict(original)
+        cls.normalize_args(values)
+        changes = {
+            name: value for name, value in values.items() if value is not original[name]
+        }
+        if not changes:
+            return args
+        return dataclasses.replace(args, **changes)
 
     @property
     def _args(self) -> BaseWidgetArgs:
@@ -86,6 +144,15 @@ class BaseParameterWidget(QWidget):
         """
         return self.__args
 
+    def _replace_args(self, args: BaseWidgetArgs):
+        """
+        this is for internal use, replace the args of the widget without updating the widget itself.
+        subclasses that support rebinding are responsible for applying the changes.
+        :param args:
+        :return:
+        """
+        self.__args = self._prepare_args(args)
+
     @property
     def parameter_name(self) -> Optional[str]:
         """
@@ -111,6 +178,62 @@ class BaseParameterWidget(QWidget):
         """
         pass
 
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        """
+        get the Qt signals that are emitted when the value of the widget may have changed, either by the user or by
+        set_value(). the arguments of the signals vary, read the value with get_value() when they are emitted.
+        subclasses should override this method, call the super one and add the signals of their child widgets.
+        :return:
+        """
+        return []
+
+    def value_changed_timing(self) -> Tuple[int, int]:
+        """
+        get the timing of valueChanged: (debounce_ms, throttle_ms).
+
+        valueChanged is emitted debounce_ms after the last change of a burst of changes (e.g. dragging a slider or
+        typing), and at most once every throttle_ms while the burst lasts, if throttle_ms is not 0. with the
+        defaults (0, 0), it is emitted once on the next event loop iteration after the changes. it is not emitted
+        if the value is the same as the last emitted value, or if the value is invalid (get_value() raises
+        ValueError).
+
+        the timing is read from the 'value_changed_debounce_ms' and 'value_changed_throttle_ms' widget args, or from
+        the class fields VALUE_CHANGED_DEBOUNCE_MS and VALUE_CHANGED_THROTTLE_MS if the args have no such fields.
+        :return:
+        """
+        debounce_ms = getattr(self._args, "value_changed_debounce_ms", None)
+        if debounce_ms is None:
+            debounce_ms = self.VALUE_CHANGED_DEBOUNCE_MS
+        throttle_ms = getattr(self._args, "value_changed_throttle_ms", None)
+        if throttle_ms is None:
+            throttle_ms = self.VALUE_CHANGED_THROTTLE_MS
+        return debounce_ms, throttle_ms
+
+    def connectNotify(self, signal: QMetaMethod):
+        super().connectNotify(signal)
+        if self._value_changed_notifier is None and signal.name() == b"valueChanged":
+            self._value_changed_notifier = _ValueChangedNotifier(self)
+
+    def _notify_value_changed(self):
+        """
+        this is for internal use, report a change of the value that may not be signaled by value_change_signals(),
+        e.g. a value set by set_value(). the changes made while the signals of the widget are blocked (e.g. by
+        ParameterForm.bulk_update()) are not signaled by valueChanged, the value after them becomes the base of
+        the next valueChanged instead
+        :return:
+        """
+        if self._value_changed_notifier is not None:
+            self._value_changed_notifier.schedule()
+
+    def _value_change_signals_changed(self):
+        """
+        this is for internal use, connect to the signals returned by value_change_signals() again, e.g. after the
+        child widgets are created again
+        :return:
+        """
+        if self._value_changed_notifier is not None:
+            self._value_changed_notifier.connect_signals()
+
     @property
     def default(self) -> Any:
         """
@@ -160,3 +283,160 @@ class BaseParameterWidget(QWidget):
         :return:
         """
         return cls._WidgetArgsClass
+
+
+class _ValueChangedNotifier(QObject):
+    """
+    debounce and throttle the value_change_signals() of a parameter widget into its valueChanged signal
+    """
+
+    def __init__(self, widget: BaseParameterWidget):
+        super().__init__(widget)
+        self._widget = widget
+        self._last_value = self._read_value()
+        self._signals: List[pyqtBoundSignal] = []
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.timeout.connect(self._on_settled)
+
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.timeout.connect(self.emit_if_changed)
+
+        self.connect_signals()
+
+    def connect_signals(self):
+        for signal in self._signals:
+            try:
+                signal.disconnect(self.schedule)
+            except (TypeError, RuntimeError):
+                # the child widget is deleted
+                pass
+        self._signals = self._widget.value_change_signals()
+        for signal in self._signals:
+            signal.connect(self.schedule)
+
+    def schedule(self, *_):
+        if self._widget.signalsBlocked():
+            # drop the pending emission too, the changes before the blocked ones are overwritten by them
+            self._debounce_timer.stop()
+            self._throttle_timer.stop()
+            self._last_value = self._read_value()
+            return
+        debounce_ms, throttle_ms = self._widget.value_changed_timing()
+        if debounce_ms > 0 or throttle_ms <= 0:
+            # restart the debounce timer on every change
+            self._debounce_timer.start(debounce_ms)
+        if throttle_ms > 0 and not self._throttle_timer.isActive():
+            self._throttle_timer.start(throttle_ms)
+
+    def emit_if_changed(self):
+        value = self._read_value()
+        if value is _NO_VALUE or values_equal(value, self._last_value):
+            return
+        self._last_value = value
+        self._widget.valueChanged.emit(value)
+
+    def _on_settled(self):
+        self._throttle_timer.stop()
+        self.emit_if_changed()
+
+    def _read_value(self) -> Any:
+        try:
+            return self._widget.get_value()
+        except ValueError:
+            return _NO_VALUE
+
+
+class WidgetArgsBuilder(object):
+    """
+    create the args of a parameter widget class from a dict of widget args, in a single step.
+
+    the fields of the args class are inspected once when the builder is created. building args checks the keys,
+    fills the defaults and normalizes the values with the widget class's normalize_args() before the args
+    object is created, so the widget does not need to replace the args again.
+    """
+
+    def __init__(self, widget_class: Type[BaseParameterWidget]):
+        self._widget_class = widget_class
+        self._args_class = widget_class.widget_args_class()
+        self._field_names = frozenset(_args_field_names(self._args_class))
+        self._defaults: Dict[str, Any] = {}
+        self._default_factories: Dict[str, Any] = {}
+        required = []
+        for field in dataclasses.fields(self._args_class):
+            if not field.init:
+                continue
+            if field.default is not dataclasses.MISSING:
+                self._defaults[field.name] = field.default
+            elif field.default_factory is not dataclasses.MISSING:
+                self._default_factories[field.name] = field.default_factory
+            else:
+                required.append(field.name)
+        self._required = tuple(required)
+        # respect the args classes that customize the way they are created
+        self._custom_new = (
+            getattr(self._args_class.new, "__func__", None)
+            is not BaseWidgetArgs.new.__func__
+        )
+
+    @property
+    def widget_class(self) -> Type[BaseParameterWidget]:
+        return self._widget_class
+
+    @property
+    def args_class(self) -> Type[BaseWidgetArgs]:
+        return self._args_class
+
+    def build(self, kwargs: Dict[str, Any]) -> BaseWidgetArgs:
+        """
+        :param kwargs: the widget args
+        :return:
+        :raise WidgetArgsError: if some of the widget args are unknown, missing, or of a wrong type
+        :raise ValueError: if some of the widget args have invalid values
+        """
+        unknown = [key for key in kwargs if key not in self._field_names]
+        if unknown:
+            raise WidgetArgsError(self._unknown_arg_message(unknown[0], kwargs))
+
+        values = dict(self._defaults)
+        values.update(kwargs)
+        for name, default_factory in self._default_factories.items():
+            if name not in values:
+                values[name] = default_factory()
+        missing = [name for name in self._required if name not in values]
+        if missing:
+            raise WidgetArgsError(
+                f"missing widget args for {self._widget_class.__name__}{self._param_desc(values)}: "
+                + ", ".join(f"'{name}'" for name in missing)
+            )
+
+        try:
+            self._widget_class.normalize_args(values)
+        except WidgetArgsError:
+            raise
+        except TypeError as e:
+            raise WidgetArgsError(
+                f"invalid widget args for {self._widget_class.__name__}{self._param_desc(values)}: {e}"
+            ) from e
+        if self._custom_new:
+            return self._args_class.new(kwargs=values)
+        return self._args_class(**values)
+
+    def _unknown_arg_message(self, key: str, kwargs: Dict[str, Any]) -> str:
+        msg = f"unknown widget arg '{key}' for {self._widget_class.__name__}{self._param_desc(kwargs)}"
+        parameter_name = kwargs.get("parameter_name", None)
+        if parameter_name:
+            msg += f" (key '{key}' in section [{parameter_name}] of the widget configs)"
+        close_matches = difflib.get_close_matches(key, self._field_names, n=1)
+        if close_matches:
+            msg += f", did you mean '{close_matches[0]}'?"
+        return msg
+
+    @staticmethod
+    def _param_desc(values: Dict[str, Any]) -> str:
+        parameter_name = values.get("parameter_name", None)
+        if not parameter_name:
+            return ""
+        return f" of parameter '{parameter_name}'"
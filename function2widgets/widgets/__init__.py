@@ -1,9 +1,40 @@
-from .allwidgets import BASIC_PARAMETER_WIDGETS
-from .base import CommonParameterWidget, CommonParameterWidgetArgs
-from .editor import *
-from .lineedit import *
-from .misc import *
-from .numberinput import *
-from .pathedit import *
-from .selectwidget import *
-from .textedit import *
+from typing import TYPE_CHECKING
+
+from function2widgets._lazyimport import lazy_attributes
+from . import editor, lineedit, misc, numberinput, pathedit, selectwidget, textedit
+
+if TYPE_CHECKING:
+    from .allwidgets import BASIC_PARAMETER_WIDGETS
+    from .base import CommonParameterWidget, CommonParameterWidgetArgs
+    from .editor import *
+    from .lineedit import *
+    from .misc import *
+    from .numberinput import *
+    from .pathedit import *
+    from .selectwidget import *
+    from .textedit import *
+
+_LAZY_ATTRIBUTES = {
+    "BASIC_PARAMETER_WIDGETS": ".allwidgets",
+    "CommonParameterWidget": ".base",
+    "CommonParameterWidgetArgs": ".base",
+}
+# the subpackages are lazy too, importing them does not import the widget modules
+for _subpackage in (
+    editor,
+    lineedit,
+    misc,
+    numberinput,
+    pathedit,
+    selectwidget,
+    textedit,
+):
+    _LAZY_ATTRIBUTES.update(
+        dict.fromkeys(
+            _subpackage.__all__, "." + _subpackage.__name__.rpartition(".")[2]
+        )
+    )
+del _subpackage
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
@@ -1,9 +1,10 @@
 import inspect
 import warnings
-from typing import Type, Any, Dict, Optional
+from typing import Type, Any, Dict, Optional, Hashable
 
-from PyQt6 import Qsci
+from PyQt6 import Qsci, sip
 from PyQt6.Qsci import QsciScintilla, QsciLexer
+from PyQt6.QtCore import QCoreApplication
 from PyQt6.QtGui import QFont, QColor
 
 AUTO_INDENT = True
@@ -16,6 +17,8 @@ FOLD_STYLE = "BoxTree"
 FONT = "Consolas"
 FONT_SIZE = 12
 ENABLE_LINE_NUMBER = True
+# share one lexer instance per language between all the source code editors
+SHARE_LEXERS = True
 
 DEFAULT_CONFIGS = {
     "AutoIndent": AUTO_INDENT,
@@ -74,7 +77,58 @@ AutoCompletionSources = {
     "APIs": QsciScintilla.AutoCompletionSource.AcsAPIs,
 }
 
-Lexers = _all_lexers()
+_lexers: Optional[Dict[str, Type[QsciLexer]]] = None
+
+
+def lexers() -> Dict[str, Type[QsciLexer]]:
+    """
+    get the lexer classes by their names (e.g. "Python" for QsciLexerPython), the table is built on first use
+    :return:
+    """
+    global _lexers
+    if _lexers is None:
+        _lexers = _all_lexers()
+    return _lexers
+
+
+def __getattr__(name: str) -> Any:
+    # Lexers used to be built at import time, it is kept for compatibility
+    if name == "Lexers":
+        return lexers()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+_shared_lexers: Dict[str, QsciLexer] = {}
+
+
+def shared_lexer(language: str) -> Optional[QsciLexer]:
+    """
+    get the lexer of language that is shared by the source code editors, it is created when it is first used.
+    do not change the shared lexers, changes apply to all the editors using them.
+    :param language: the name of the lexer, e.g. "Python", "JSON"
+    :return: None if there is no such lexer
+    """
+    lexer = _shared_lexers.get(language, None)
+    if lexer is not None and not sip.isdeleted(lexer):
+        return lexer
+    lexer_class = lexers().get(language, None)
+    if not lexer_class:
+        return None
+    # owned by the application, so that it is deleted before the application
+    lexer = lexer_class(parent=QCoreApplication.instance())
+    _shared_lexers[language] = lexer
+    return lexer
+
+
+def configs_fingerprint(configs: Optional[Dict[str, Any]]) -> Hashable:
+    """
+    a hashable value that equals for the equal configs, used to share the editors with the same configs
+    :param configs:
+    :return:
+    """
+    if configs is None:
+        return None
+    return tuple(sorted((name, repr(value)) for name, value in configs.items()))
 
 
 # noinspection PyMethodMayBeStatic,PyUnusedLocal
@@ -128,7 +182,9 @@ class _CodeEditConfigurator(object):
         return WrapModes.get(raw_value, None)
 
     def map_lexer(self, raw_value: str, configs: dict = None) -> Optional[QsciLexer]:
-        lexer = Lexers.get(raw_value, None)
+        if SHARE_LEXERS:
+            return shared_lexer(raw_value)
+        lexer = lexers().get(raw_value, None)
         if not lexer:
             return None
         return lexer(parent=self._target)
@@ -1,46 +1,85 @@
-from function2widgets.widgets.editor.codeeditor import CodeEditor
-from function2widgets.widgets.editor.dicteditor import DictEditor
-from function2widgets.widgets.lineedit import IntLineEdit, FloatLineEdit, LineEdit
-from function2widgets.widgets.editor.jsoneditor import JsonEditor
-from function2widgets.widgets.editor.listeditor import ListEditor
-from function2widgets.widgets.numberinput import IntSpinBox, FloatSpinBox, Dial, Slider
-from function2widgets.widgets.pathedit import PathEdit, FilePathEdit, DirPathEdit
-from function2widgets.widgets.selectwidget.combobox import ComboBox
-from function2widgets.widgets.selectwidget import (
-    ComboBoxEdit,
-    RadioButtonGroup,
-    CheckBoxGroup,
-    CheckBox,
+import importlib
+from typing import Dict, Iterator, MutableMapping, Type, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from function2widgets.widget import BaseParameterWidget
+
+
+class LazyWidgetRegistry(MutableMapping[str, Type["BaseParameterWidget"]]):
+    """
+    a mapping of widget class names to widget classes, whose modules are imported when the classes are looked up
+    for the first time.
+    """
+
+    def __init__(
+        self, widget_classes: Dict[str, Union[str, Type["BaseParameterWidget"]]]
+    ):
+        """
+        :param widget_classes: widget class name -> the widget class, or the name of the module that defines it
+        """
+        self._widget_classes = dict(widget_classes)
+
+    def is_loaded(self, widget_class_name: str) -> bool:
+        return not isinstance(self._widget_classes[widget_class_name], str)
+
+    def __getitem__(self, widget_class_name: str) -> Type["BaseParameterWidget"]:
+        widget_class = self._widget_classes[widget_class_name]
+        if isinstance(widget_class, str):
+            module = importlib.import_module(widget_class)
+            widget_class = getattr(module, widget_class_name)
+            self._widget_classes[widget_class_name] = widget_class
+        return widget_class
+
+    def __setitem__(
+        self, widget_class_name: str, widget_class: Type["BaseParameterWidget"]
+    ):
+        self._widget_classes[widget_class_name] = widget_class
+
+    def __delitem__(self, widget_class_name: str):
+        del self._widget_classes[widget_class_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._widget_classes)
+
+    def __len__(self) -> int:
+        return len(self._widget_classes)
+
+    def __contains__(self, widget_class_name: object) -> bool:
+        return widget_class_name in self._widget_classes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._widget_classes)})"
+
+
+_WIDGETS_PACKAGE = "function2widgets.widgets"
+
+BASIC_PARAMETER_WIDGETS = LazyWidgetRegistry(
+    {
+        "LineEdit": f"{_WIDGETS_PACKAGE}.lineedit.stredit",
+        "IntLineEdit": f"{_WIDGETS_PACKAGE}.lineedit.intedit",
+        "FloatLineEdit": f"{_WIDGETS_PACKAGE}.lineedit.floatedit",
+        "PathEdit": f"{_WIDGETS_PACKAGE}.pathedit.base",
+        "FilePathEdit": f"{_WIDGETS_PACKAGE}.pathedit.filepathedit",
+        "DirPathEdit": f"{_WIDGETS_PACKAGE}.pathedit.dirpathedit",
+        "PlainTextEdit": f"{_WIDGETS_PACKAGE}.textedit.plaintext",
+        "CodeEdit": f"{_WIDGETS_PACKAGE}.textedit.codeedit",
+        "CodeEditor": f"{_WIDGETS_PACKAGE}.editor.codeeditor",
+        "JsonEditor": f"{_WIDGETS_PACKAGE}.editor.jsoneditor",
+        "DictEditor": f"{_WIDGETS_PACKAGE}.editor.dicteditor",
+        "ListEditor": f"{_WIDGETS_PACKAGE}.editor.listeditor",
+        "TupleEditor": f"{_WIDGETS_PACKAGE}.editor.tupleeditor",
+        "ComboBox": f"{_WIDGETS_PACKAGE}.selectwidget.combobox",
+        "ComboBoxEdit": f"{_WIDGETS_PACKAGE}.selectwidget.combobox_edit",
+        "CheckBox": f"{_WIDGETS_PACKAGE}.selectwidget.checkbox",
+        "RadioButtonGroup": f"{_WIDGETS_PACKAGE}.selectwidget.radiobutton_group",
+        "CheckBoxGroup": f"{_WIDGETS_PACKAGE}.selectwidget.checkbox_group",
+        "IntSpinBox": f"{_WIDGETS_PACKAGE}.numberinput.intspin",
+        "FloatSpinBox": f"{_WIDGETS_PACKAGE}.numberinput.floatspin",
+        "Dial": f"{_WIDGETS_PACKAGE}.numberinput.dial",
+        "Slider": f"{_WIDGETS_PACKAGE}.numberinput.slider",
+        "DateEdit": f"{_WIDGETS_PACKAGE}.misc.dateedit",
+        "TimeEdit": f"{_WIDGETS_PACKAGE}.misc.timeedit",
+        "DateTimeEdit": f"{_WIDGETS_PACKAGE}.misc.datetimeedit",
+        "ColorEdit": f"{_WIDGETS_PACKAGE}.misc.coloredit",
+    }
 )
-from function2widgets.widgets.textedit import PlainTextEdit, CodeEdit
-from function2widgets.widgets.editor.tupleeditor import TupleEditor
-from function2widgets.widgets.misc import DateTimeEdit, DateEdit, TimeEdit, ColorEdit
-
-BASIC_PARAMETER_WIDGETS = {
-    LineEdit.__name__: LineEdit,
-    IntLineEdit.__name__: IntLineEdit,
-    FloatLineEdit.__name__: FloatLineEdit,
-    PathEdit.__name__: PathEdit,
-    FilePathEdit.__name__: FilePathEdit,
-    DirPathEdit.__name__: DirPathEdit,
-    PlainTextEdit.__name__: PlainTextEdit,
-    CodeEdit.__name__: CodeEdit,
-    CodeEditor.__name__: CodeEditor,
-    JsonEditor.__name__: JsonEditor,
-    DictEditor.__name__: DictEditor,
-    ListEditor.__name__: ListEditor,
-    TupleEditor.__name__: TupleEditor,
-    ComboBox.__name__: ComboBox,
-    ComboBoxEdit.__name__: ComboBoxEdit,
-    CheckBox.__name__: CheckBox,
-    RadioButtonGroup.__name__: RadioButtonGroup,
-    CheckBoxGroup.__name__: CheckBoxGroup,
-    IntSpinBox.__name__: IntSpinBox,
-    FloatSpinBox.__name__: FloatSpinBox,
-    Dial.__name__: Dial,
-    Slider.__name__: Slider,
-    DateEdit.__name__: DateEdit,
-    TimeEdit.__name__: TimeEdit,
-    DateTimeEdit.__name__: DateTimeEdit,
-    ColorEdit.__name__: ColorEdit,
-}
@@ -1,9 +1,8 @@
 import abc
-import copy
 import dataclasses
-from typing import Any, Optional, cast
+from typing import Any, Optional, cast, Dict, FrozenSet, List
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtBoundSignal, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget,
     QLabel,
@@ -12,7 +11,19 @@ from PyQt6.QtWidgets import (
     QFrame,
 )
 
-from function2widgets.widget import BaseParameterWidget, BaseWidgetArgs
+from function2widgets.values import (
+    VALUE_OWNERSHIP_DEEPCOPY,
+    VALUE_OWNERSHIP_FROZEN,
+    check_value_ownership,
+    export_value,
+    freeze,
+    import_value,
+)
+from function2widgets.widget import (
+    BaseParameterWidget,
+    BaseWidgetArgs,
+    _args_field_names,
+)
 
 POS_TOP = 0
 POS_BOTTOM = 1
@@ -43,11 +54,18 @@ class CommonParameterWidgetArgs(BaseWidgetArgs):
     description_text_indent: Optional[int] = None
     description_stylesheet: Optional[str] = None
     open_external_link: bool = True
+    value_ownership: Optional[str] = None
+    value_changed_debounce_ms: Optional[int] = None
+    value_changed_throttle_ms: Optional[int] = None
 
 
 class CommonParameterWidget(BaseParameterWidget):
     _WidgetArgsClass = CommonParameterWidgetArgs
 
+    # emitted by the widgets whose child widgets do not signal the changes of the value (e.g. the value is edited
+    # in a dialog), when a value is set to the child widgets
+    valueEdited = pyqtSignal()
+
     OBJ_ID_LAYOUT = "_CPW_main_layout"
     OBJ_ID_CENTER_WIDGET = "_CPW_center_widget"
     OBJ_ID_LABEL_WIDGET = "_CPW_label_widget"
@@ -59,33 +77,37 @@ class CommonParameterWidget(BaseParameterWidget):
     DEFAULT_DESCRIPTION_POS = POS_TOP
     DEFAULT_DESCRIPTION_TEXT_INDENT = -1
     DEFAULT_DESCRIPTION_STYLESHEET = DESCRIPTION_STYLESHEET
+    # how the values passed to set_value() and returned by get_value() are copied, see function2widgets.values
+    VALUE_OWNERSHIP = VALUE_OWNERSHIP_DEEPCOPY
+
+    # the widget args that can be changed by rebind() without creating a new widget
+    REBINDABLE_ARGS = frozenset(
+        (
+            "parameter_name",
+            "default",
+            "label",
+            "description",
+            "value_ownership",
+            "value_changed_debounce_ms",
+            "value_changed_throttle_ms",
+        )
+    )
+    # the widget args that can be changed by reconfigure() without creating a new widget
+    RECONFIGURABLE_ARGS = REBINDABLE_ARGS | frozenset(
+        (
+            "stylesheet",
+            "set_default_on_init",
+            "hide_default_value_widget",
+            "default_value_description",
+            "label_stylesheet",
+            "description_text_indent",
+            "description_stylesheet",
+            "open_external_link",
+        )
+    )
 
     def __init__(self, args: CommonParameterWidgetArgs, parent: Optional[QWidget]):
 
-        description_pos = args.description_position
-        if description_pos is None:
-            description_pos = self.DEFAULT_DESCRIPTION_POS
-
-        description_text_indent = args.description_text_indent
-        if description_text_indent is None:
-            description_text_indent = self.DEFAULT_DESCRIPTION_TEXT_INDENT
-
-        label_stylesheet = args.label_stylesheet
-        if label_stylesheet is None:
-            label_stylesheet = self.DEFAULT_LABEL_STYLESHEET
-
-        description_stylesheet = args.description_stylesheet
-        if description_stylesheet is None:
-            description_stylesheet = self.DEFAULT_DESCRIPTION_STYLESHEET
-
-        args = dataclasses.replace(
-            args,
-            description_position=description_pos,
-            description_text_indent=description_text_indent,
-            label_stylesheet=label_stylesheet,
-            description_stylesheet=description_stylesheet,
-        )
-
         super().__init__(args=args, parent=parent)
 
         self._layout = QVBoxLayout(self)
@@ -103,15 +125,27 @@ class CommonParameterWidget(BaseParameterWidget):
         self.set_description(self._args.description)
 
     def set_value(self, value: Any):
-        value = copy.deepcopy(value)
-        if not self._pre_set_value(value):
-            return
-        self.set_value_to_widget(value)
+        value = import_value(value, self._args.value_ownership)
+        try:
+            if not self._pre_set_value(value):
+                return
+            self.set_value_to_widget(value)
+        finally:
+            # valueEdited is not delivered while the signals of the widget are blocked (e.g. by
+            # ParameterForm.bulk_update()), the notifier still needs to know the value after the change
+            self._notify_value_changed()
 
     def get_value(self) -> Any:
         if self._is_use_default():
-            return self._args.default
-        return copy.deepcopy(self.get_value_from_widget())
+            return export_value(self._args.default, self._args.value_ownership)
+        return export_value(self.get_value_from_widget(), self._args.value_ownership)
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        # the value changes to (or from) the default value when the default value checkbox is toggled
+        return super().value_change_signals() + [
+            self.valueEdited,
+            self._default_widget.toggled,
+        ]
 
     @abc.abstractmethod
     def setup_center_widget(self, center_widget: QWidget):
@@ -125,10 +159,131 @@ class CommonParameterWidget(BaseParameterWidget):
     def get_value_from_widget(self) -> Any:
         pass
 
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
+        if values["description_position"] is None:
+            values["description_position"] = cls.DEFAULT_DESCRIPTION_POS
+
+        if values["description_text_indent"] is None:
+            values["description_text_indent"] = cls.DEFAULT_DESCRIPTION_TEXT_INDENT
+
+        if values["label_stylesheet"] is None:
+            values["label_stylesheet"] = cls.DEFAULT_LABEL_STYLESHEET
+
+        if values["description_stylesheet"] is None:
+            values["description_stylesheet"] = cls.DEFAULT_DESCRIPTION_STYLESHEET
+
+        if values["value_ownership"] is None:
+            values["value_ownership"] = cls.VALUE_OWNERSHIP
+        check_value_ownership(values["value_ownership"])
+        if values["value_ownership"] == VALUE_OWNERSHIP_FROZEN:
+            # so that reading the default value is O(1) too
+            values["default"] = freeze(values["default"])
+
+        for name in ("value_changed_debounce_ms", "value_changed_throttle_ms"):
+            if values[name] is not None and values[name] < 0:
+                raise ValueError(f"{name} must not be negative: {values[name]}")
+
+        super().normalize_args(values)
+
     @property
     def _args(self) -> CommonParameterWidgetArgs:
         return cast(CommonParameterWidgetArgs, super()._args)
 
+    def can_rebind(self, args: CommonParameterWidgetArgs) -> bool:
+        """
+        check whether the widget can be rebound to args, i.e. args differs from the current args of the widget
+        in REBINDABLE_ARGS only
+        :param args:
+        :return:
+        """
+        return self._can_replace_args(args, self.__class__.REBINDABLE_ARGS)
+
+    def rebind(self, args: CommonParameterWidgetArgs):
+        """
+        reuse the widget for another parameter. the value of the widget is not changed, call set_value() after
+        rebinding the widget.
+        :param args: the args of the other parameter
+        :return:
+        :raise ValueError: if the widget cannot be rebound to args, see can_rebind()
+        """
+        if not self.can_rebind(args):
+            raise ValueError(
+                f"cannot rebind {self.__class__.__name__} of parameter '{self.parameter_name}' "
+                f"to parameter '{args.parameter_name}'"
+            )
+        self._replace_args(args)
+        self.set_label(self._args.label)
+        self.set_description(self._args.description)
+        self._default_widget.setText(self._default_widget_text())
+
+    def can_reconfigure(self, args: CommonParameterWidgetArgs) -> bool:
+        """
+        check whether the widget can be reconfigured with args, i.e. args differs from the current args of the
+        widget in RECONFIGURABLE_ARGS only
+        :param args:
+        :return:
+        """
+        if not self._can_replace_args(args, self.__class__.RECONFIGURABLE_ARGS):
+            return False
+        # the initial state of a widget that does not set the default value on init cannot be restored
+        return bool(args.set_default_on_init) or args.default is None
+
+    def reconfigure(self, args: CommonParameterWidgetArgs):
+        """
+        reset the widget to the state of a new widget created with args, without creating the child widgets again.
+        subclasses that add names to RECONFIGURABLE_ARGS should override reconfigure_center_widget() to apply them.
+        :param args:
+        :return:
+        :raise ValueError: if the widget cannot be reconfigured with args, see can_reconfigure()
+        """
+        if not self.can_reconfigure(args):
+            raise ValueError(
+                f"cannot reconfigure {self.__class__.__name__} of parameter '{self.parameter_name}' "
+                f"with the args of parameter '{args.parameter_name}'"
+            )
+        self._replace_args(args)
+        args = self._args
+
+        self.setStyleSheet(args.stylesheet or "")
+        self._label_widget.setStyleSheet(args.label_stylesheet)
+        self._description_widget.setStyleSheet(args.description_stylesheet)
+        self._description_widget.setIndent(args.description_text_indent or -1)
+        self._description_widget.setOpenExternalLinks(args.open_external_link is True)
+        self.set_label(args.label)
+        self.set_description(args.description)
+
+        self._default_widget.setText(self._default_widget_text())
+        self._default_widget.setChecked(False)
+        self._default_widget.setHidden(args.hide_default_value_widget is True)
+        self._center_widget.setEnabled(True)
+        self.reconfigure_center_widget()
+        if args.set_default_on_init or args.default is None:
+            self.set_value(args.default)
+
+    def reconfigure_center_widget(self):
+        """
+        apply the widget specific args in RECONFIGURABLE_ARGS to the child widgets, called by reconfigure() after
+        the args are replaced and before the default value is set
+        :return:
+        """
+        pass
+
+    def _can_replace_args(
+        self, args: CommonParameterWidgetArgs, replaceable: FrozenSet[str]
+    ) -> bool:
+        current = self._args
+        if type(args) is not type(current):
+            return False
+        for name in _args_field_names(type(args)):
+            if name in replaceable:
+                continue
+            value = getattr(args, name)
+            current_value = getattr(current, name)
+            if value is not current_value and value != current_value:
+                return False
+        return True
+
     def set_label(self, label: str):
         if not label:
             self._label_widget.setText("")
@@ -151,12 +306,15 @@ class CommonParameterWidget(BaseParameterWidget):
     def get_description(self) -> str:
         return self._description_widget.text()
 
-    def _setup_default_widget(self):
+    def _default_widget_text(self) -> str:
         if self._args.default_value_description is None:
             text = "{}"
         else:
             text = self._args.default_value_description
-        self._default_widget.setText(text.format(self._args.default))
+        return text.format(self._args.default)
+
+    def _setup_default_widget(self):
+        self._default_widget.setText(self._default_widget_text())
         # noinspection PyUnresolvedReferences
         self._default_widget.toggled.connect(self._on_default_widget_state_changed)
         self._default_widget.setHidden(self._args.hide_default_value_widget is True)
@@ -1,5 +1,26 @@
-from .codeeditor import CodeEditorArgs, CodeEditor
-from .jsoneditor import JsonEditorArgs, JsonEditor
-from .dicteditor import DictEditorArgs, DictEditor
-from .listeditor import ListEditorArgs, ListEditor
-from .tupleeditor import TupleEditorArgs, TupleEditor
+from typing import TYPE_CHECKING
+
+from function2widgets._lazyimport import lazy_attributes
+
+if TYPE_CHECKING:
+    from .codeeditor import CodeEditorArgs, CodeEditor
+    from .jsoneditor import JsonEditorArgs, JsonEditor
+    from .dicteditor import DictEditorArgs, DictEditor
+    from .listeditor import ListEditorArgs, ListEditor
+    from .tupleeditor import TupleEditorArgs, TupleEditor
+
+_LAZY_ATTRIBUTES = {
+    "CodeEditorArgs": ".codeeditor",
+    "CodeEditor": ".codeeditor",
+    "JsonEditorArgs": ".jsoneditor",
+    "JsonEditor": ".jsoneditor",
+    "DictEditorArgs": ".dicteditor",
+    "DictEditor": ".dicteditor",
+    "ListEditorArgs": ".listeditor",
+    "ListEditor": ".listeditor",
+    "TupleEditorArgs": ".tupleeditor",
+    "TupleEditor": ".tupleeditor",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
@@ -1,7 +1,9 @@
 import abc
 import dataclasses
-from typing import Any, Optional, cast
+from typing import Any, Optional, cast, Dict, Hashable, Callable
 
+from PyQt6 import sip
+from PyQt6.Qsci import QsciScintilla
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -44,6 +46,13 @@ class BaseCodeEditorDialog(QDialog):
             return
         self._code_edit.apply_configs(configs)
 
+    def reset_undo_history(self):
+        """
+        forget the edits made so far, so that they cannot be undone, e.g. setting the initial value
+        :return:
+        """
+        self._code_edit.SendScintilla(QsciScintilla.SCI_EMPTYUNDOBUFFER)
+
     # noinspection PyUnresolvedReferences
     def setup_ui(self):
         self.resize(800, 600)
@@ -101,9 +110,16 @@ class BaseCodeEditorArgs(CommonParameterWidgetArgs):
     display_widget_text: str = DISPLAY_WIDGET_TEXT
 
 
+# (dialog class, dialog key) -> the dialog shared by the editors
+_shared_dialogs: Dict[Hashable, BaseCodeEditorDialog] = {}
+
+
 class BaseCodeEditor(CommonParameterWidget):
     HIDE_DEFAULT_VALUE_WIDGET = True
     SET_DEFAULT_ON_INIT = True
+    # reuse one edit dialog for the editors with the same dialog class and configs, instead of creating a new
+    # dialog (and source code editor) every time the dialog is opened
+    SHARE_EDIT_DIALOG = True
 
     _WidgetArgsClass = BaseCodeEditorArgs
 
@@ -167,6 +183,7 @@ class BaseCodeEditor(CommonParameterWidget):
 
     def set_value_to_widget(self, value: Any):
         self._current_value = value
+        self.valueEdited.emit()
 
     @abc.abstractmethod
     def source_code_dialog(self) -> BaseCodeEditorDialog:
@@ -177,8 +194,44 @@ class BaseCodeEditor(CommonParameterWidget):
 
     def open_edit_dialog(self):
         dialog = self.source_code_dialog()
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            value = self.fetch_result_from_dialog(dialog)
-        else:
-            value = self._current_value
+        dialog.reset_undo_history()
+        try:
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                value = self.fetch_result_from_dialog(dialog)
+            else:
+                value = self._current_value
+        finally:
+            self._release_edit_dialog(dialog)
         self.set_value(value)
+
+    def _edit_dialog(
+        self,
+        dialog_key: Hashable,
+        create_dialog: Callable[[], BaseCodeEditorDialog],
+    ) -> BaseCodeEditorDialog:
+        """
+        get the shared dialog of dialog_key, or create it with create_dialog() if it does not exist or is in use.
+        a shared dialog is reparented to the editor, set its title and value before showing it.
+        :param dialog_key: the dialogs created by the create_dialog() functions with the same dialog_key must be
+        interchangeable
+        :param create_dialog:
+        :return:
+        """
+        if not self.SHARE_EDIT_DIALOG:
+            return create_dialog()
+        dialog = _shared_dialogs.get(dialog_key, None)
+        if dialog is None or sip.isdeleted(dialog) or dialog.isVisible():
+            dialog = create_dialog()
+            _shared_dialogs[dialog_key] = dialog
+        else:
+            dialog.setParent(self, dialog.windowFlags())
+        return dialog
+
+    def _release_edit_dialog(self, dialog: BaseCodeEditorDialog):
+        if sip.isdeleted(dialog):
+            return
+        if any(shared is dialog for shared in _shared_dialogs.values()):
+            # keep the shared dialog alive when the editor is deleted
+            dialog.setParent(None, dialog.windowFlags())
+        else:
+            dialog.deleteLater()
@@ -3,6 +3,7 @@ from typing import Optional, cast
 
 from PyQt6.QtWidgets import QWidget
 
+from function2widgets.widgets._sourcecodeedit import configs_fingerprint
 from .base import BaseCodeEditor, BaseCodeEditorDialog, BaseCodeEditorArgs
 
 
@@ -53,8 +54,12 @@ class CodeEditor(BaseCodeEditor):
     def source_code_dialog(self) -> CodeEditorDialog:
         configs = self._args.configs or {}
         window_title = self._args.window_title or ""
-        dialog = CodeEditorDialog(
-            configs=configs, window_title=window_title, parent=self
+        dialog = self._edit_dialog(
+            (CodeEditorDialog, configs_fingerprint(configs)),
+            lambda: CodeEditorDialog(
+                configs=configs, window_title=window_title, parent=self
+            ),
         )
+        dialog.setWindowTitle(window_title)
         dialog.set_value(self._current_value)
         return dialog
@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Optional, cast
+from typing import Optional, cast, Dict, Any
 
 from PyQt6.QtWidgets import QWidget
 
@@ -28,10 +28,13 @@ class DictEditor(JsonEditor):
 
     def __init__(self, args: JsonEditorArgs, parent: Optional[QWidget] = None):
 
-        args = dataclasses.replace(args, top_level_types=self.TYPE_RESTRICTIONS)
-
         super().__init__(args=args, parent=parent)
 
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
+        values["top_level_types"] = cls.TYPE_RESTRICTIONS
+        super().normalize_args(values)
+
     def get_value(self) -> Optional[dict]:
         return super().get_value()
 
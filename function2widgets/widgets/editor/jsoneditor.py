@@ -1,12 +1,15 @@
 import dataclasses
 import json
-from typing import Any, Optional, cast
+from typing import Any, Optional, cast, Dict
 
 from PyQt6.QtWidgets import QWidget, QMessageBox
 
 from function2widgets.common import remove_tuple_element
 from function2widgets.widget import InvalidValueError
-from function2widgets.widgets._sourcecodeedit import DEFAULT_CONFIGS
+from function2widgets.widgets._sourcecodeedit import (
+    DEFAULT_CONFIGS,
+    configs_fingerprint,
+)
 from .base import BaseCodeEditorDialog, BaseCodeEditor, BaseCodeEditorArgs
 
 _NoneType = type(None)
@@ -85,12 +88,17 @@ class JsonEditor(BaseCodeEditor):
     _WidgetArgsClass = JsonEditorArgs
 
     def __init__(self, args: JsonEditorArgs, parent: Optional[QWidget] = None):
-        configs = args.configs
+        super().__init__(args=args, parent=parent)
+
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
+        configs = values["configs"]
         if not isinstance(configs, dict):
             configs = DEFAULT_CONFIGS.copy()
-        configs["Lexer"] = "JSON"
-        default = args.default
-        top_level_types = args.top_level_types
+        if configs.get("Lexer", None) != "JSON":
+            configs = {**configs, "Lexer": "JSON"}
+        default = values["default"]
+        top_level_types = values["top_level_types"]
 
         if default is not None:
             top_level_types = remove_tuple_element(top_level_types, _NoneType)
@@ -100,11 +108,10 @@ class JsonEditor(BaseCodeEditor):
                 f"default value '{default}' is not one of the following types: {top_level_types}"
             )
 
-        args = dataclasses.replace(
-            args, configs=configs, top_level_types=top_level_types
-        )
+        values["configs"] = configs
+        values["top_level_types"] = top_level_types
 
-        super().__init__(args=args, parent=parent)
+        super().normalize_args(values)
 
     @property
     def _args(self) -> JsonEditorArgs:
@@ -114,12 +121,16 @@ class JsonEditor(BaseCodeEditor):
         top_level_types = self._args.top_level_types
         configs = self._args.configs
         window_title = self._args.window_title
-        dialog = JsonEditorDialog(
-            top_level_types=top_level_types,
-            configs=configs,
-            window_title=window_title,
-            parent=self,
+        dialog = self._edit_dialog(
+            (JsonEditorDialog, top_level_types, configs_fingerprint(configs)),
+            lambda: JsonEditorDialog(
+                top_level_types=top_level_types,
+                configs=configs,
+                window_title=window_title,
+                parent=self,
+            ),
         )
+        dialog.setWindowTitle(window_title or "")
         dialog.set_value(self._current_value)
         return dialog
 
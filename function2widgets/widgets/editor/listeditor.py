@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Optional, cast
+from typing import Optional, cast, Dict, Any
 
 from PyQt6.QtWidgets import QWidget
 
@@ -27,10 +27,13 @@ class ListEditor(JsonEditor):
         return cast(ListEditorArgs, super()._args)
 
     def __init__(self, args: ListEditorArgs, parent: Optional[QWidget] = None):
-        args = dataclasses.replace(args, top_level_types=self.TYPE_RESTRICTIONS)
-
         super().__init__(args=args, parent=parent)
 
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
+        values["top_level_types"] = cls.TYPE_RESTRICTIONS
+        super().normalize_args(values)
+
     def set_value(self, value: Optional[list]):
         if isinstance(value, (tuple, set)):
             value = list(value)
@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Optional, cast
+from typing import Optional, cast, Dict, Any
 
 from PyQt6.QtWidgets import QWidget
 
@@ -23,10 +23,13 @@ class TupleEditor(JsonEditor):
     TYPE_RESTRICTIONS = (list, set, tuple, _NoneType)
 
     def __init__(self, args: TupleEditorArgs, parent: Optional[QWidget] = None):
-        args = dataclasses.replace(args, top_level_types=self.TYPE_RESTRICTIONS)
-
         super().__init__(args=args, parent=parent)
 
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
+        values["top_level_types"] = cls.TYPE_RESTRICTIONS
+        super().normalize_args(values)
+
     @property
     def _args(self) -> TupleEditorArgs:
         return cast(TupleEditorArgs, super()._args)
@@ -1,3 +1,20 @@
-from .intedit import IntLineEditArgs, IntLineEdit
-from .floatedit import FloatLineEdit, FloatLineEditArgs
-from .stredit import LineEditArgs, LineEdit
+from typing import TYPE_CHECKING
+
+from function2widgets._lazyimport import lazy_attributes
+
+if TYPE_CHECKING:
+    from .intedit import IntLineEditArgs, IntLineEdit
+    from .floatedit import FloatLineEdit, FloatLineEditArgs
+    from .stredit import LineEditArgs, LineEdit
+
+_LAZY_ATTRIBUTES = {
+    "IntLineEditArgs": ".intedit",
+    "IntLineEdit": ".intedit",
+    "FloatLineEdit": ".floatedit",
+    "FloatLineEditArgs": ".floatedit",
+    "LineEditArgs": ".stredit",
+    "LineEdit": ".stredit",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
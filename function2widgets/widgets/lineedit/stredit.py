@@ -1,7 +1,7 @@
 import dataclasses
-from typing import Optional, Literal, cast, Any
+from typing import Optional, Literal, cast, Any, List
 
-from PyQt6.QtCore import QRegularExpression
+from PyQt6.QtCore import QRegularExpression, pyqtBoundSignal
 from PyQt6.QtGui import QRegularExpressionValidator
 from PyQt6.QtWidgets import QWidget, QLineEdit, QVBoxLayout
 
@@ -61,6 +61,9 @@ class LineEdit(CommonParameterWidget):
     def get_value_from_widget(self) -> str:
         return self._value_widget.text()
 
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.textChanged]
+
     @property
     def _args(self) -> LineEditArgs:
         return cast(LineEditArgs, super()._args)
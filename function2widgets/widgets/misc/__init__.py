@@ -1,4 +1,24 @@
-from .datetimeedit import DateTimeEditArgs, DateTimeEdit
-from .timeedit import TimeEditArgs, TimeEdit
-from .dateedit import DateEditArgs, DateEdit
-from .coloredit import ColorEditArgs, ColorEdit, Color
+from typing import TYPE_CHECKING
+
+from function2widgets._lazyimport import lazy_attributes
+
+if TYPE_CHECKING:
+    from .datetimeedit import DateTimeEditArgs, DateTimeEdit
+    from .timeedit import TimeEditArgs, TimeEdit
+    from .dateedit import DateEditArgs, DateEdit
+    from .coloredit import ColorEditArgs, ColorEdit, Color
+
+_LAZY_ATTRIBUTES = {
+    "DateTimeEditArgs": ".datetimeedit",
+    "DateTimeEdit": ".datetimeedit",
+    "TimeEditArgs": ".timeedit",
+    "TimeEdit": ".timeedit",
+    "DateEditArgs": ".dateedit",
+    "DateEdit": ".dateedit",
+    "ColorEditArgs": ".coloredit",
+    "ColorEdit": ".coloredit",
+    "Color": ".coloredit",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
@@ -12,112 +12,13 @@ from PyQt6.QtWidgets import (
     QPushButton,
 )
 
+from function2widgets.color import Color
 from function2widgets.widget import InvalidValueError
 from function2widgets.widgets.base import (
     CommonParameterWidget,
     CommonParameterWidgetArgs,
 )
 
-
-class Color(object):
-    def __init__(self, r: int = 255, g: int = 255, b: int = 255, a: int = 255):
-        self._r = self.map_value(r)
-        self._g = self.map_value(g)
-        self._b = self.map_value(b)
-        self._a = self.map_value(a)
-
-    @property
-    def r(self) -> int:
-        return self._r
-
-    @r.setter
-    def r(self, value: int):
-        self._r = self.map_value(value)
-
-    @property
-    def g(self) -> int:
-        return self._g
-
-    @g.setter
-    def g(self, value: int):
-        self._g = self.map_value(value)
-
-    @property
-    def b(self) -> int:
-        return self._b
-
-    @b.setter
-    def b(self, value: int):
-        self._b = self.map_value(value)
-
-    @property
-    def a(self) -> int:
-        return self._a
-
-    @a.setter
-    def a(self, value: int):
-        self._a = self.map_value(value)
-
-    def get_invert_color(self, invert_alpha: bool = False) -> "Color":
-        new_alpha = self.a
-        if invert_alpha:
-            new_alpha = 255 - self.a
-        return Color(255 - self.r, 255 - self.g, 255 - self.b, new_alpha)
-
-    def to_hex_string(self, with_alpha: bool = True) -> str:
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}" + (
-            f"{self.a:02x}" if with_alpha else ""
-        )
-
-    def to_rgb_string(self, with_alpha: bool = True) -> str:
-        return f"{self.r},{self.g},{self.b}" + (f",{self.a}" if with_alpha else "")
-
-    def to_rgb_tuple(self, with_alpha: bool = True) -> tuple:
-        return (
-            (self.r, self.g, self.b, self.a) if with_alpha else (self.r, self.g, self.b)
-        )
-
-    def to_qt_color(self, with_alpha: bool = True) -> QColor:
-        return QColor(*self.to_rgb_tuple(with_alpha=with_alpha))
-
-    def __repr__(self):
-        return self.to_hex_string(with_alpha=True)
-
-    def __str__(self):
-        return self.to_hex_string(with_alpha=True)
-
-    @classmethod
-    def from_hex_string(cls, hex_str: str) -> "Color":
-        return cls(*QColor.fromString(hex_str).getRgb())
-
-    @classmethod
-    def from_color_name(cls, name: str) -> "Color":
-        return cls(*QColor(name).getRgb())
-
-    @classmethod
-    def from_string(cls, string: str) -> "Color":
-        string = string.strip()
-        if string.startswith("#"):
-            return cls.from_hex_string(string)
-        else:
-            return cls.from_color_name(string)
-
-    @classmethod
-    def from_qt_color(cls, color: QColor) -> "Color":
-        return cls(*color.getRgb())
-
-    @staticmethod
-    def map_value(value: Optional[int]):
-        if value is None:
-            return 255
-        if value < 0:
-            return 0
-        elif value > 255:
-            return 255
-        else:
-            return value
-
-
 DEFAULT_COLOR = "white"
 DEFAULT_DISPLAY_WIDGET_SIZE = 120
 
@@ -208,6 +109,7 @@ class ColorEdit(CommonParameterWidget):
             value = value.to_qt_color()
         self._set_bg_color(value)
         self._update_color_text(value)
+        self.valueEdited.emit()
 
     # def eventFilter(self, obj, event):
     #     if obj == self._value_widget and event.type() == QEvent.Type.MouseButtonPress:
@@ -1,8 +1,8 @@
 import dataclasses
 from datetime import datetime, date
-from typing import Optional, cast, Union
+from typing import Optional, cast, Union, List
 
-from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtCore import Qt, QDate, pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QDateEdit
 
 from function2widgets.common import to_date
@@ -95,3 +95,6 @@ class DateEdit(CommonParameterWidget):
 
     def get_value_from_widget(self) -> date:
         return self._value_widget.date().toPyDate()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.dateChanged]
@@ -1,8 +1,8 @@
 import dataclasses
 from datetime import datetime
-from typing import Optional, cast, Union
+from typing import Optional, cast, Union, List
 
-from PyQt6.QtCore import Qt, QDateTime
+from PyQt6.QtCore import Qt, QDateTime, pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QDateTimeEdit, QVBoxLayout
 
 from function2widgets.widget import InvalidValueError
@@ -109,3 +109,6 @@ class DateTimeEdit(CommonParameterWidget):
 
     def get_value_from_widget(self) -> datetime:
         return self._value_widget.dateTime().toPyDateTime()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.dateTimeChanged]
@@ -1,8 +1,8 @@
 import dataclasses
 from datetime import datetime, time
-from typing import Optional, cast, Union
+from typing import Optional, cast, Union, List
 
-from PyQt6.QtCore import Qt, QTime
+from PyQt6.QtCore import Qt, QTime, pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTimeEdit
 
 from function2widgets.common import to_time
@@ -92,3 +92,6 @@ class TimeEdit(CommonParameterWidget):
 
     def get_value_from_widget(self) -> time:
         return self._value_widget.time().toPyTime()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.timeChanged]
@@ -1,4 +1,23 @@
-from .intspin import IntSpinBox, IntSpinBoxArgs
-from .floatspin import FloatSpinBox, FloatSpinBoxArgs
-from .dial import DialArgs, Dial
-from .slider import SliderArgs, Slider
+from typing import TYPE_CHECKING
+
+from function2widgets._lazyimport import lazy_attributes
+
+if TYPE_CHECKING:
+    from .intspin import IntSpinBox, IntSpinBoxArgs
+    from .floatspin import FloatSpinBox, FloatSpinBoxArgs
+    from .dial import DialArgs, Dial
+    from .slider import SliderArgs, Slider
+
+_LAZY_ATTRIBUTES = {
+    "IntSpinBox": ".intspin",
+    "IntSpinBoxArgs": ".intspin",
+    "FloatSpinBox": ".floatspin",
+    "FloatSpinBoxArgs": ".floatspin",
+    "DialArgs": ".dial",
+    "Dial": ".dial",
+    "SliderArgs": ".slider",
+    "Slider": ".slider",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
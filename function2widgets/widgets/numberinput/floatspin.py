@@ -1,6 +1,7 @@
 import dataclasses
-from typing import Optional, cast
+from typing import Optional, cast, List
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QDoubleSpinBox, QVBoxLayout
 
 from function2widgets.widget import InvalidValueError
@@ -29,6 +30,18 @@ class FloatSpinBox(CommonParameterWidget):
 
     _WidgetArgsClass = FloatSpinBoxArgs
 
+    RECONFIGURABLE_ARGS = CommonParameterWidget.RECONFIGURABLE_ARGS | frozenset(
+        (
+            "min_value",
+            "max_value",
+            "step",
+            "decimals",
+            "prefix",
+            "suffix",
+            "accelerated",
+        )
+    )
+
     def __init__(self, args: FloatSpinBoxArgs, parent: Optional[QWidget] = None):
 
         if args.step is not None and args.step <= 0:
@@ -52,6 +65,14 @@ class FloatSpinBox(CommonParameterWidget):
         center_widget.setContentsMargins(0, 0, 0, 0)
         center_widget_layout.addWidget(self._value_widget)
 
+        self.reconfigure_center_widget()
+
+    def can_reconfigure(self, args: FloatSpinBoxArgs) -> bool:
+        if args.step is not None and args.step <= 0:
+            return False
+        return super().can_reconfigure(args)
+
+    def reconfigure_center_widget(self):
         min_value = self._args.min_value
         max_value = self._args.max_value
         step = self._args.step
@@ -60,6 +81,12 @@ class FloatSpinBox(CommonParameterWidget):
         decimals = self._args.decimals
         accelerated = self._args.accelerated
 
+        # the defaults of QDoubleSpinBox, for the args that are None
+        self._value_widget.setDecimals(2)
+        self._value_widget.setRange(0.0, 99.99)
+        self._value_widget.setSingleStep(1.0)
+        self._value_widget.setPrefix("")
+        self._value_widget.setSuffix("")
         if min_value is not None:
             self._value_widget.setMinimum(min_value)
         if max_value is not None:
@@ -90,3 +117,6 @@ class FloatSpinBox(CommonParameterWidget):
 
     def get_value_from_widget(self) -> float:
         return self._value_widget.value()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.valueChanged]
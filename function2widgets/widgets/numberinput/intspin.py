@@ -1,6 +1,7 @@
 import dataclasses
-from typing import Optional, cast
+from typing import Optional, cast, List
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QSpinBox, QVBoxLayout
 
 from function2widgets.widget import InvalidValueError
@@ -27,6 +28,10 @@ class IntSpinBox(CommonParameterWidget):
 
     _WidgetArgsClass = IntSpinBoxArgs
 
+    RECONFIGURABLE_ARGS = CommonParameterWidget.RECONFIGURABLE_ARGS | frozenset(
+        ("min_value", "max_value", "step", "prefix", "suffix")
+    )
+
     def __init__(self, args: IntSpinBoxArgs, parent: Optional[QWidget] = None):
 
         if args.step is not None and args.step <= 0:
@@ -51,22 +56,31 @@ class IntSpinBox(CommonParameterWidget):
         center_widget.setContentsMargins(0, 0, 0, 0)
         center_widget_layout.addWidget(self._value_widget)
 
+        self.reconfigure_center_widget()
+
+    def can_reconfigure(self, args: IntSpinBoxArgs) -> bool:
+        if args.step is not None and args.step <= 0:
+            return False
+        return super().can_reconfigure(args)
+
+    def reconfigure_center_widget(self):
         min_value = self._args.min_value
         max_value = self._args.max_value
         step = self._args.step
         prefix = self._args.prefix
         suffix = self._args.suffix
 
+        # the defaults of QSpinBox, for the args that are None
+        self._value_widget.setRange(0, 99)
+        self._value_widget.setSingleStep(1)
         if min_value is not None:
             self._value_widget.setMinimum(min_value)
         if max_value is not None:
             self._value_widget.setMaximum(max_value)
         if step is not None:
             self._value_widget.setSingleStep(step)
-        if prefix:
-            self._value_widget.setPrefix(prefix)
-        if suffix:
-            self._value_widget.setSuffix(suffix)
+        self._value_widget.setPrefix(prefix or "")
+        self._value_widget.setSuffix(suffix or "")
 
     def get_value(self) -> Optional[int]:
         return super().get_value()
@@ -84,3 +98,6 @@ class IntSpinBox(CommonParameterWidget):
 
     def get_value_from_widget(self) -> int:
         return self._value_widget.value()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.valueChanged]
@@ -1,7 +1,7 @@
 import dataclasses
-from typing import Optional, cast
+from typing import Optional, cast, List
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtBoundSignal
 from PyQt6.QtWidgets import QSlider, QWidget, QLabel, QVBoxLayout
 
 from function2widgets.widget import InvalidValueError
@@ -125,6 +125,9 @@ class Slider(CommonParameterWidget):
     def get_value_from_widget(self) -> int:
         return self._value_widget.value()
 
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.valueChanged]
+
     def _setup_value_label(self, center_widget_layout: QVBoxLayout):
         self._value_label = QLabel(self._center_widget)
         self._value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1,12 +1,35 @@
-from .base import (
-    PathEditArgs,
-    PathEdit,
-    PATH_DELIMITER,
-    PATH_TYPE_OPEN_FILE,
-    PATH_TYPE_SAVE_FILE,
-    PATH_TYPE_OPEN_FILES,
-    PATH_TYPE_OPEN_DIR,
-    PATH_TYPE_SAVE_DIR,
-)
-from .filepathedit import FilePathEditArgs, FilePathEdit
-from .dirpathedit import DirPathEditArgs, DirPathEdit
+from typing import TYPE_CHECKING
+
+from function2widgets._lazyimport import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import (
+        PathEditArgs,
+        PathEdit,
+        PATH_DELIMITER,
+        PATH_TYPE_OPEN_FILE,
+        PATH_TYPE_SAVE_FILE,
+        PATH_TYPE_OPEN_FILES,
+        PATH_TYPE_OPEN_DIR,
+        PATH_TYPE_SAVE_DIR,
+    )
+    from .filepathedit import FilePathEditArgs, FilePathEdit
+    from .dirpathedit import DirPathEditArgs, DirPathEdit
+
+_LAZY_ATTRIBUTES = {
+    "PathEditArgs": ".base",
+    "PathEdit": ".base",
+    "PATH_DELIMITER": ".base",
+    "PATH_TYPE_OPEN_FILE": ".base",
+    "PATH_TYPE_SAVE_FILE": ".base",
+    "PATH_TYPE_OPEN_FILES": ".base",
+    "PATH_TYPE_OPEN_DIR": ".base",
+    "PATH_TYPE_SAVE_DIR": ".base",
+    "FilePathEditArgs": ".filepathedit",
+    "FilePathEdit": ".filepathedit",
+    "DirPathEditArgs": ".dirpathedit",
+    "DirPathEdit": ".dirpathedit",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
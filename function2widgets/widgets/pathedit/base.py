@@ -1,7 +1,8 @@
 import dataclasses
 import os.path
-from typing import Optional, cast, Any
+from typing import Optional, cast, Any, List, Dict, Union
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import (
     QWidget,
     QLineEdit,
@@ -65,6 +66,13 @@ class PathEdit(CommonParameterWidget):
     def _args(self) -> PathEditArgs:
         return cast(PathEditArgs, super()._args)
 
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
+        # e.g. a pathlib.Path default, the value of the widget is always a str
+        if isinstance(values["default"], os.PathLike):
+            values["default"] = os.fspath(values["default"])
+        super().normalize_args(values)
+
     # noinspection PyUnresolvedReferences
     def setup_center_widget(self, center_widget: QWidget):
         self._value_widget = QLineEdit(center_widget)
@@ -91,7 +99,14 @@ class PathEdit(CommonParameterWidget):
     def get_value(self) -> Optional[str]:
         return super().get_value()
 
-    def set_value(self, value: Optional[str]):
+    @classmethod
+    def normalize_value(cls, args: PathEditArgs, value: Any) -> Any:
+        if isinstance(value, os.PathLike):
+            return os.fspath(value)
+        return value
+
+    def set_value(self, value: Union[str, os.PathLike, None]):
+        value = self.normalize_value(self._args, value)
         if value is not None and not isinstance(value, str):
             raise InvalidValueError(f"value must be str, not {type(value)}")
         super().set_value(value)
@@ -102,6 +117,9 @@ class PathEdit(CommonParameterWidget):
     def get_value_from_widget(self) -> Any:
         return self._value_widget.text()
 
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.textChanged]
+
     def _select_path(self):
         path_type = self._args.path_type
         if path_type == PATH_TYPE_OPEN_FILE:
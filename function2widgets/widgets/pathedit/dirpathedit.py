@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Optional
+from typing import Optional, Dict, Any
 
 from PyQt6.QtWidgets import QWidget
 
@@ -20,17 +20,16 @@ class DirPathEdit(PathEdit):
     _WidgetArgsClass = DirPathEditArgs
 
     def __init__(self, args: DirPathEditArgs, parent: Optional[QWidget] = None):
-        if args.save_dir:
-            path_type = PATH_TYPE_SAVE_DIR
-        else:
-            path_type = PATH_TYPE_OPEN_DIR
+        super().__init__(args=args, parent=parent)
 
-        args = dataclasses.replace(
-            args,
-            path_type=path_type,
-            filters="",
-            init_filter=None,
-            path_delimiter="",
-        )
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
+        if values["save_dir"]:
+            values["path_type"] = PATH_TYPE_SAVE_DIR
+        else:
+            values["path_type"] = PATH_TYPE_OPEN_DIR
+        values["filters"] = ""
+        values["init_filter"] = None
+        values["path_delimiter"] = ""
 
-        super().__init__(args=args, parent=parent)
+        super().normalize_args(values)
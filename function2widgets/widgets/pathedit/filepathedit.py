@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Optional, cast
+from typing import Optional, cast, Dict, Any
 
 from PyQt6.QtWidgets import QWidget
 
@@ -31,13 +31,15 @@ class FilePathEdit(PathEdit):
         return cast(FilePathEditArgs, super()._args)
 
     def __init__(self, args: FilePathEditArgs, parent: Optional[QWidget] = None):
-        if args.save_file:
-            path_type = PATH_TYPE_SAVE_FILE
-        elif args.multiple_files:
-            path_type = PATH_TYPE_OPEN_FILES
-        else:
-            path_type = PATH_TYPE_OPEN_FILE
+        super().__init__(args=args, parent=parent)
 
-        args = dataclasses.replace(args, path_type=path_type)
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
+        if values["save_file"]:
+            values["path_type"] = PATH_TYPE_SAVE_FILE
+        elif values["multiple_files"]:
+            values["path_type"] = PATH_TYPE_OPEN_FILES
+        else:
+            values["path_type"] = PATH_TYPE_OPEN_FILE
 
-        super().__init__(args=args, parent=parent)
+        super().normalize_args(values)
@@ -1,5 +1,26 @@
-from .checkbox import CheckBoxArgs, CheckBox
-from .checkbox_group import CheckBoxGroupArgs, CheckBoxGroup
-from .combobox import ComboBoxArgs, ComboBox
-from .combobox_edit import ComboBoxEditArgs, ComboBoxEdit
-from .radiobutton_group import RadioButtonGroupArgs, RadioButtonGroup
+from typing import TYPE_CHECKING
+
+from function2widgets._lazyimport import lazy_attributes
+
+if TYPE_CHECKING:
+    from .checkbox import CheckBoxArgs, CheckBox
+    from .checkbox_group import CheckBoxGroupArgs, CheckBoxGroup
+    from .combobox import ComboBoxArgs, ComboBox
+    from .combobox_edit import ComboBoxEditArgs, ComboBoxEdit
+    from .radiobutton_group import RadioButtonGroupArgs, RadioButtonGroup
+
+_LAZY_ATTRIBUTES = {
+    "CheckBoxArgs": ".checkbox",
+    "CheckBox": ".checkbox",
+    "CheckBoxGroupArgs": ".checkbox_group",
+    "CheckBoxGroup": ".checkbox_group",
+    "ComboBoxArgs": ".combobox",
+    "ComboBox": ".combobox",
+    "ComboBoxEditArgs": ".combobox_edit",
+    "ComboBoxEdit": ".combobox_edit",
+    "RadioButtonGroupArgs": ".radiobutton_group",
+    "RadioButtonGroup": ".radiobutton_group",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
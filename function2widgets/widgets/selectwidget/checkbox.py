@@ -1,6 +1,7 @@
 import dataclasses
-from typing import Optional, cast
+from typing import Optional, cast, List
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QCheckBox, QApplication, QVBoxLayout
 
 from function2widgets.widgets.base import (
@@ -63,3 +64,6 @@ class CheckBox(CommonParameterWidget):
 
     def get_value_from_widget(self) -> bool:
         return self._checkbox.isChecked()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._checkbox.toggled]
@@ -1,6 +1,7 @@
 import dataclasses
 from typing import Optional, List, cast
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QGridLayout, QCheckBox
 
 from function2widgets.widget import InvalidValueError
@@ -66,6 +67,11 @@ class CheckBoxGroup(CommonParameterWidget):
             if checkbox.isChecked()
         ]
 
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [
+            checkbox.toggled for checkbox in self._checkbox_buttons
+        ]
+
     def set_value_to_widget(self, value: List[str]):
         for checkbox in self._checkbox_buttons:
             if checkbox.text() in value:
@@ -1,8 +1,10 @@
 import dataclasses
-from typing import Optional, List, Union, Tuple, cast, Any
+from typing import Optional, List, Union, Tuple, cast, Any, FrozenSet, Dict
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QComboBox, QVBoxLayout
 
+from function2widgets.values import VALUE_OWNERSHIP_SHARED
 from function2widgets.widget import InvalidValueError
 from function2widgets.widgets.base import (
     CommonParameterWidget,
@@ -10,16 +12,46 @@ from function2widgets.widgets.base import (
 )
 
 
+def _same_data(data: Any, value: Any) -> bool:
+    try:
+        return bool(data is value or data == value)
+    except Exception:
+        return False
+
+
+def _item_data(items: Optional[List[Union[str, Tuple[str, Any]]]], value: Any) -> Any:
+    # the data of the item whose text or data is value (the texts first), value itself if there is no such item
+    if value is None or not items:
+        return value
+    if isinstance(value, str):
+        for item in items:
+            if isinstance(item, str) and item == value:
+                return item
+            if isinstance(item, tuple) and len(item) == 2 and item[0] == value:
+                return item[1]
+    for item in items:
+        if isinstance(item, tuple) and len(item) == 2 and _same_data(item[1], value):
+            return item[1]
+    return value
+
+
 @dataclasses.dataclass(frozen=True)
 class ComboBoxArgs(CommonParameterWidgetArgs):
     parameter_name: str
-    default: Optional[str] = None
+    default: Any = None
     items: List[Union[str, Tuple[str, Any]]] = None
 
 
 class ComboBox(CommonParameterWidget):
+    """
+    the value of a ComboBox is the data of the selected item (the text of the item if it is a str), set_value()
+    and the default value accept the text of an item too
+    """
+
     HIDE_DEFAULT_VALUE_WIDGET = True
     SET_DEFAULT_ON_INIT = True
+    # the values are the data of the items, which are owned by the args already
+    VALUE_OWNERSHIP = VALUE_OWNERSHIP_SHARED
 
     _WidgetArgsClass = ComboBoxArgs
 
@@ -40,7 +72,7 @@ class ComboBox(CommonParameterWidget):
             else:
                 raise ValueError("items must be a list of str or Tuple[str, Any]")
 
-        if args.default not in self._items_with_data and args.default is not None:
+        if args.default is not None and self._data_index(args.default) < 0:
             raise ValueError(f"default value '{args.default}' is not in items")
 
         self._value_widget: Optional[QComboBox] = None
@@ -54,6 +86,29 @@ class ComboBox(CommonParameterWidget):
     def _args(self) -> ComboBoxArgs:
         return cast(ComboBoxArgs, super()._args)
 
+    @classmethod
+    def normalize_args(cls, values: Dict[str, Any]):
+        # the default value may be given as the text of an item, get_value() returns the data of the item
+        values["default"] = _item_data(values["items"], values["default"])
+        super().normalize_args(values)
+
+    @classmethod
+    def normalize_value(cls, args: ComboBoxArgs, value: Any) -> Any:
+        return _item_data(args.items, value)
+
+    def _can_replace_args(
+        self, args: ComboBoxArgs, replaceable: FrozenSet[str]
+    ) -> bool:
+        if args.default is not None and self._data_index(args.default) < 0:
+            return False
+        return super()._can_replace_args(args, replaceable)
+
+    def _data_index(self, value: Any) -> int:
+        for index, data in enumerate(self._items_with_data.values()):
+            if _same_data(data, value):
+                return index
+        return -1
+
     def setup_center_widget(self, center_widget: QWidget):
         self._value_widget = QComboBox(center_widget)
         for text, data in self._items_with_data.items():
@@ -67,17 +122,25 @@ class ComboBox(CommonParameterWidget):
     def get_value(self) -> Any:
         return super().get_value()
 
-    def set_value(self, value: Optional[str]):
-        if value is not None and value not in self._items_with_data.keys():
+    def set_value(self, value: Any):
+        """
+        :param value: the text of an item, or its data (the value returned by get_value())
+        :return:
+        """
+        value = self.normalize_value(self._args, value)
+        if value is not None and self._data_index(value) < 0:
             raise InvalidValueError(f"value {value} is not in items")
         super().set_value(value)
 
-    def set_value_to_widget(self, value: Optional[str]):
+    def set_value_to_widget(self, value: Any):
         if value is None:
             self._value_widget.setCurrentIndex(-1)
         else:
-            self._value_widget.setCurrentText(value)
+            self._value_widget.setCurrentIndex(self._data_index(value))
 
     def get_value_from_widget(self) -> Any:
         current_data = self._value_widget.currentData()
         return current_data
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.currentIndexChanged]
@@ -1,6 +1,7 @@
 import dataclasses
 from typing import Optional, List, cast
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QComboBox, QVBoxLayout
 
 from function2widgets.widget import InvalidValueError
@@ -66,3 +67,6 @@ class ComboBoxEdit(CommonParameterWidget):
 
     def get_value_from_widget(self) -> str:
         return self._value_widget.currentText()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.currentTextChanged]
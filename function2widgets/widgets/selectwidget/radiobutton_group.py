@@ -1,6 +1,7 @@
 import dataclasses
 from typing import Optional, List, cast
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QButtonGroup, QGridLayout, QRadioButton
 
 from function2widgets.widget import InvalidValueError
@@ -98,6 +99,9 @@ class RadioButtonGroup(CommonParameterWidget):
             return None
         return radio_btn.text()
 
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._button_group.buttonToggled]
+
     def _get_radio_button(self, item: Optional[str]) -> Optional[QRadioButton]:
         if item is None:
             return None
@@ -1,2 +1,17 @@
-from .plaintext import PlainTextEditArgs, PlainTextEdit
-from .codeedit import CodeEditArgs, CodeEdit
+from typing import TYPE_CHECKING
+
+from function2widgets._lazyimport import lazy_attributes
+
+if TYPE_CHECKING:
+    from .plaintext import PlainTextEditArgs, PlainTextEdit
+    from .codeedit import CodeEditArgs, CodeEdit
+
+_LAZY_ATTRIBUTES = {
+    "PlainTextEditArgs": ".plaintext",
+    "PlainTextEdit": ".plaintext",
+    "CodeEditArgs": ".codeedit",
+    "CodeEdit": ".codeedit",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+__all__ = list(_LAZY_ATTRIBUTES)
@@ -1,6 +1,7 @@
 import dataclasses
-from typing import Optional, Dict, Any, cast
+from typing import Optional, Dict, Any, cast, List
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 
 from function2widgets.widgets._sourcecodeedit import _SourceCodeEdit
@@ -58,3 +59,6 @@ class CodeEdit(CommonParameterWidget):
 
     def get_value_from_widget(self) -> str:
         return self._value_widget.text()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.textChanged]
@@ -1,6 +1,7 @@
 import dataclasses
-from typing import Optional, Any, cast
+from typing import Optional, Any, cast, List
 
+from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import QPlainTextEdit, QWidget, QVBoxLayout
 
 from function2widgets.widgets.base import (
@@ -69,3 +70,6 @@ class PlainTextEdit(CommonParameterWidget):
 
     def get_value_from_widget(self) -> str:
         return self._value_widget.toPlainText()
+
+    def value_change_signals(self) -> List[pyqtBoundSignal]:
+        return super().value_change_signals() + [self._value_widget.textChanged]
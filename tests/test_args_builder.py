@@ -0,0 +1,49 @@
+import pytest
+
+from function2widgets.widget import WidgetArgsBuilder, WidgetArgsError
+from function2widgets.widgets.numberinput.intspin import IntSpinBox
+
+
+def _build(**kwargs):
+    return WidgetArgsBuilder(IntSpinBox).build(kwargs)
+
+
+def test_unknown_widget_arg():
+    with pytest.raises(WidgetArgsError) as exc_info:
+        _build(parameter_name="a", lable="A")
+
+    assert str(exc_info.value) == (
+        "unknown widget arg 'lable' for IntSpinBox of parameter 'a' "
+        "(key 'lable' in section [a] of the widget configs), did you mean 'label'?"
+    )
+
+
+def test_unknown_widget_arg_without_close_match():
+    with pytest.raises(WidgetArgsError) as exc_info:
+        _build(xyz=1)
+
+    assert str(exc_info.value) == "unknown widget arg 'xyz' for IntSpinBox"
+
+
+def test_missing_widget_arg():
+    with pytest.raises(WidgetArgsError) as exc_info:
+        _build(label="A")
+
+    assert str(exc_info.value) == "missing widget args for IntSpinBox: 'parameter_name'"
+
+
+def test_widget_arg_of_wrong_type():
+    with pytest.raises(WidgetArgsError) as exc_info:
+        _build(parameter_name="a", value_changed_debounce_ms="10")
+
+    assert str(exc_info.value).startswith(
+        "invalid widget args for IntSpinBox of parameter 'a': "
+    )
+    assert isinstance(exc_info.value.__cause__, TypeError)
+
+
+def test_widget_arg_of_invalid_value():
+    with pytest.raises(ValueError, match="must not be negative"):
+        _build(parameter_name="a", value_changed_debounce_ms=-1)
+    with pytest.raises(ValueError, match="unknown value ownership 'x'"):
+        _build(parameter_name="a", value_ownership="x")
@@ -0,0 +1,142 @@
+import pytest
+
+from function2widgets.parser import (
+    BaseFunctionInfoCache,
+    FunctionInfoCache,
+    FunctionInfoParser,
+)
+
+
+def _make_function():
+    def func(a: int = 1, b: str = "x"):
+        """
+        a function
+
+        :param a: the first parameter
+        :param b: the second parameter
+        """
+
+    return func
+
+
+def _other_code(a: int = 1, b: str = "x", c: float = 0.5):
+    pass
+
+
+def _func_1(a: int = 1):
+    pass
+
+
+def _func_2(b: str = "x"):
+    pass
+
+
+def _func_3(c: float = 0.5):
+    pass
+
+
+def test_cache_hit_for_same_function():
+    cache = FunctionInfoCache()
+    parser = FunctionInfoParser(cache=cache)
+    func = _make_function()
+
+    first = parser.parse(func)
+    second = parser.parse(func)
+
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+    assert first == second
+    # the cached result is copied, the caller owns it
+    assert first is not second
+    second.parameters[0].description = "changed"
+    assert parser.parse(func).parameters[0].description == "the first parameter"
+
+
+def test_cache_miss_after_code_changed():
+    cache = FunctionInfoCache()
+    parser = FunctionInfoParser(cache=cache)
+    func = _make_function()
+    parser.parse(func)
+
+    func.__code__ = _other_code.__code__
+    func.__defaults__ = _other_code.__defaults__
+    func_info = parser.parse(func)
+
+    assert cache.info().hits == 0
+    assert [p.name for p in func_info.parameters] == ["a", "b", "c"]
+
+
+def test_cache_miss_after_docstring_changed():
+    cache = FunctionInfoCache()
+    parser = FunctionInfoParser(cache=cache)
+    func = _make_function()
+    parser.parse(func)
+
+    func.__doc__ = """
+    another function
+
+    :param a: changed
+    """
+    func_info = parser.parse(func)
+
+    assert cache.info().hits == 0
+    assert func_info.description == "another function"
+    assert func_info.parameters[0].description == "changed"
+
+
+def test_cache_miss_after_defaults_changed():
+    cache = FunctionInfoCache()
+    parser = FunctionInfoParser(cache=cache)
+    func = _make_function()
+    parser.parse(func)
+
+    func.__defaults__ = (2, "y")
+    func_info = parser.parse(func)
+
+    assert cache.info().hits == 0
+    assert [p.default for p in func_info.parameters] == [2, "y"]
+
+
+def test_cache_evicts_least_recently_used():
+    cache = FunctionInfoCache(max_size=2)
+    parser = FunctionInfoParser(cache=cache)
+    # three functions with their own code, so each of them has its own entry
+    funcs = [_func_1, _func_2, _func_3]
+
+    parser.parse(funcs[0])
+    parser.parse(funcs[1])
+    # funcs[0] becomes the most recently used one
+    parser.parse(funcs[0])
+    parser.parse(funcs[2])
+
+    assert len(cache) == 2
+    hits = cache.info().hits
+    parser.parse(funcs[0])
+    assert cache.info().hits == hits + 1
+    parser.parse(funcs[1])
+    assert cache.info().hits == hits + 1
+
+
+def test_cache_clear():
+    cache = FunctionInfoCache()
+    parser = FunctionInfoParser(cache=cache)
+    func = _make_function()
+    parser.parse(func)
+    parser.parse(func)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.info() == (0, 0, cache.max_size, 0)
+    parser.parse(func)
+    assert cache.info().misses == 1
+
+
+def test_cache_invalid_max_size():
+    with pytest.raises(ValueError):
+        FunctionInfoCache(max_size=0)
+
+
+def test_base_cache_is_abstract():
+    with pytest.raises(TypeError):
+        BaseFunctionInfoCache()
@@ -0,0 +1,115 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+from function2widgets.parser import DiskFunctionInfoCache, FunctionInfoParser
+
+MODULE_SOURCE = '''
+class MyType(object):
+    pass
+
+
+def func(a: MyType, b: int = 1):
+    """
+    a function
+
+    :param a: the first parameter
+    """
+'''
+
+# parse func in a new process, with MyType registered to the widget class given in argv
+SCRIPT = """
+import json
+import sys
+
+sys.path.insert(0, sys.argv[1])
+
+import mymodule
+from function2widgets.parser import DiskFunctionInfoCache, FunctionInfoParser
+from function2widgets.parser.function_parser import make_default_widget_resolver
+
+resolver = make_default_widget_resolver()
+resolver.register_type(mymodule.MyType, sys.argv[3])
+with DiskFunctionInfoCache(sys.argv[2]) as cache:
+    parser = FunctionInfoParser(cache=cache, widget_resolver=resolver)
+    func_info = parser.parse(mymodule.func)
+print(json.dumps({"widget_class": func_info.parameters[0].widget.widget_class, "hits": cache.hits}))
+"""
+
+
+def _write_module(tmp_path) -> str:
+    module_dir = tmp_path / "modules"
+    module_dir.mkdir()
+    (module_dir / "mymodule.py").write_text(textwrap.dedent(MODULE_SOURCE))
+    return str(module_dir)
+
+
+def _parse_in_new_process(module_dir: str, cache_dir: str, widget_class: str) -> dict:
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    output = subprocess.check_output(
+        [sys.executable, "-c", SCRIPT, module_dir, cache_dir, widget_class],
+        env=env,
+        text=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_disk_cache_is_reused_across_processes(tmp_path):
+    module_dir = _write_module(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+
+    first = _parse_in_new_process(module_dir, cache_dir, "IntSpinBox")
+    second = _parse_in_new_process(module_dir, cache_dir, "IntSpinBox")
+
+    assert first == {"widget_class": "IntSpinBox", "hits": 0}
+    assert second == {"widget_class": "IntSpinBox", "hits": 1}
+
+
+def test_disk_cache_is_not_reused_after_resolver_changed(tmp_path):
+    module_dir = _write_module(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+
+    first = _parse_in_new_process(module_dir, cache_dir, "IntSpinBox")
+    # the resolver of the second process has the same number of registrations, so the same version
+    second = _parse_in_new_process(module_dir, cache_dir, "LineEdit")
+
+    assert first["widget_class"] == "IntSpinBox"
+    assert second == {"widget_class": "LineEdit", "hits": 0}
+
+
+def test_disk_cache_key_includes_flags(tmp_path):
+    sys.path.insert(0, _write_module(tmp_path))
+    try:
+        import mymodule
+    finally:
+        sys.path.pop(0)
+    cache = DiskFunctionInfoCache(str(tmp_path / "cache"))
+    parser = FunctionInfoParser(cache=cache)
+    func_info = parser.parse(mymodule.func)
+
+    assert cache.get(mymodule.func, *parser._cache_flags(True, False)) == func_info
+    assert cache.get(mymodule.func, True, False, "another fingerprint") is None
+    sys.modules.pop("mymodule", None)
+
+
+def test_disk_cache_miss_after_defaults_changed(tmp_path):
+    sys.path.insert(0, _write_module(tmp_path))
+    try:
+        import mymodule
+    finally:
+        sys.path.pop(0)
+    cache = DiskFunctionInfoCache(str(tmp_path / "cache"))
+    parser = FunctionInfoParser(cache=cache)
+    parser.parse(mymodule.func)
+
+    # the module file is not modified
+    mymodule.func.__defaults__ = (2,)
+    func_info = parser.parse(mymodule.func)
+
+    assert cache.info().hits == 0
+    assert func_info.parameters[1].default == 2
+    sys.modules.pop("mymodule", None)
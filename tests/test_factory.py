@@ -0,0 +1,120 @@
+import logging
+
+import pytest
+
+from function2widgets.diff import diff_function_info
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.parser import FunctionInfoParser
+from function2widgets.widget import InvalidValueError
+
+
+def _old(a: int = 1, b: str = "x", c: int = 3, d: float = 1.5):
+    pass
+
+
+def _new(a: int = 2, c: str = "3", e: bool = True, d: float = 1.5):
+    pass
+
+
+def _parse(func):
+    return FunctionInfoParser().parse(func)
+
+
+def test_diff_function_info():
+    diff = diff_function_info(_parse(_old), _parse(_new))
+
+    assert [param_diff.name for param_diff in diff.parameters] == [
+        "a",
+        "c",
+        "e",
+        "d",
+        "b",
+    ]
+    assert diff.added == ["e"]
+    assert diff.removed == ["b"]
+    assert diff.changed == ["a", "c"]
+    assert diff.unchanged == ["d"]
+    # the kept parameters are in the same order
+    assert not diff.order_changed
+
+    assert diff.get("a").changes == ["default"]
+    assert not diff.get("a").type_changed
+    assert diff.get("c").type_changed
+    assert "widget_class" in diff.get("c").widget_changes
+    assert "widget_class" not in diff.get("a").widget_changes
+
+
+def test_update_widgets_for_function(qapp):
+    factory = ParameterWidgetFactory()
+    old_info, new_info = _parse(_old), _parse(_new)
+    widgets = factory.create_widgets_for_function(old_info)
+    widgets["a"].set_value(10)
+    widgets["c"].set_value(30)
+    old_c = widgets["c"]
+
+    updated = factory.update_widgets_for_function(widgets, old_info, new_info)
+
+    assert list(updated) == ["a", "c", "e", "d"]
+    assert updated["d"] is widgets["d"]
+    # the value entered by the user is kept
+    assert updated["a"].get_value() == 10
+    assert updated["a"].default == 2
+    # the type changed, the new widget shows the new default value
+    assert updated["c"] is not old_c
+    assert type(updated["c"]) is not type(old_c)
+    assert updated["c"].get_value() == "3"
+    assert updated["e"].get_value() is True
+
+
+def test_update_widgets_shows_new_default_if_value_unchanged(qapp):
+    factory = ParameterWidgetFactory()
+    old_info, new_info = _parse(_old), _parse(_new)
+    widgets = factory.create_widgets_for_function(old_info)
+
+    updated = factory.update_widgets_for_function(widgets, old_info, new_info)
+
+    assert updated["a"].get_value() == 2
+
+
+def _reject(widget_class, rejected_value, error):
+    set_value = widget_class.set_value
+
+    def reject(self, value):
+        if value == rejected_value:
+            raise error
+        set_value(self, value)
+
+    return reject
+
+
+def test_update_widgets_logs_rejected_values(qapp, monkeypatch, caplog):
+    factory = ParameterWidgetFactory()
+    old_info, new_info = _parse(_old), _parse(_new)
+    widgets = factory.create_widgets_for_function(old_info)
+    widgets["a"].set_value(10)
+    widget_class = type(widgets["a"])
+    monkeypatch.setattr(
+        widget_class,
+        "set_value",
+        _reject(widget_class, 10, InvalidValueError("rejected")),
+    )
+
+    with caplog.at_level(logging.WARNING):
+        updated = factory.update_widgets_for_function(widgets, old_info, new_info)
+
+    assert updated["a"].get_value() == 2
+    assert "parameter 'a' not kept" in caplog.text
+
+
+def test_update_widgets_raises_unexpected_errors(qapp, monkeypatch):
+    factory = ParameterWidgetFactory()
+    old_info, new_info = _parse(_old), _parse(_new)
+    widgets = factory.create_widgets_for_function(old_info)
+    widgets["a"].set_value(10)
+    widget_class = type(widgets["a"])
+    monkeypatch.setattr(
+        widget_class, "set_value", _reject(widget_class, 10, RuntimeError("bug"))
+    )
+
+    with pytest.raises(RuntimeError):
+        factory.update_widgets_for_function(widgets, old_info, new_info)
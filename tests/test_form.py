@@ -0,0 +1,66 @@
+import pytest
+
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.parser import FunctionInfoParser
+
+
+def _func(a: int = 1, b: str = "x", c: float = 0.5, d: list = None):
+    pass
+
+
+def _make_form():
+    func_info = FunctionInfoParser().parse(_func)
+    return ParameterWidgetFactory().create_form_for_function(func_info)
+
+
+def test_snapshot_restore_round_trip(qapp):
+    form = _make_form()
+    values = {"a": 5, "b": "y", "c": 1.5, "d": [1, 2]}
+
+    assert form.restore(values) == ["a", "b", "c", "d"]
+    snapshot = form.snapshot()
+    assert snapshot == values
+    assert list(snapshot) == form.parameter_names()
+
+    form.reset()
+    assert form.snapshot() == form.defaults()
+    assert form.restore(snapshot) == ["a", "b", "c", "d"]
+    assert form.snapshot() == values
+    # the values are equal already
+    assert form.restore(snapshot) == []
+
+
+def test_restore_ignores_unknown_parameters(qapp):
+    form = _make_form()
+
+    assert form.restore({"a": 2, "unknown": 1}) == ["a"]
+    assert form.snapshot()["a"] == 2
+
+
+def test_restore_strict_rejects_unknown_parameters(qapp):
+    form = _make_form()
+    before = form.snapshot()
+
+    with pytest.raises(KeyError):
+        form.restore({"a": 2, "unknown": 1}, strict=True)
+    # nothing is set
+    assert form.snapshot() == before
+
+
+def test_restore_strict_keeps_missing_parameters(qapp):
+    form = _make_form()
+    form.restore({"a": 5, "b": "y"})
+
+    assert form.restore({"a": 6}, strict=True) == ["a"]
+    assert form.snapshot()["a"] == 6
+    assert form.snapshot()["b"] == "y"
+
+
+def test_restore_rejected_value(qapp):
+    form = _make_form()
+
+    with pytest.raises(ValueError):
+        form.restore({"a": 3, "c": "not a number"})
+    # the values before the rejected one are set already
+    assert form.snapshot()["a"] == 3
+    assert form.snapshot()["c"] == 0.5
@@ -0,0 +1,54 @@
+from function2widgets.color import Color
+from function2widgets.form import ParameterForm
+from function2widgets.history import ValueHistory
+from function2widgets.widgets.misc.coloredit import ColorEdit, ColorEditArgs
+from function2widgets.widgets.numberinput.slider import Slider, SliderArgs
+
+
+def _make_form():
+    color_edit = ColorEdit(ColorEditArgs(parameter_name="c", default=Color(0, 0, 0)))
+    slider = Slider(
+        SliderArgs(parameter_name="s", default=0, min_value=0, max_value=100)
+    )
+    return ParameterForm({"c": color_edit, "s": slider})
+
+
+def _names(entries):
+    return [entry.parameter_name for entry in entries]
+
+
+def test_undo_redo(qapp):
+    form = _make_form()
+    history = ValueHistory(form, coalesce_ms=0)
+
+    form["s"].set_value(3)
+    history.flush()
+    form["s"].set_value(4)
+
+    assert [(e.old, e.new) for e in history.undo_entries()] == [(0, 3), (3, 4)]
+    assert history.undo().new == 4
+    assert form["s"].get_value() == 3
+    assert history.redo().new == 4
+    assert form["s"].get_value() == 4
+    # undo() and redo() are not recorded as changes
+    assert len(history.undo_entries()) == 2
+
+
+def test_restore_is_recorded(qapp):
+    form = _make_form()
+    history = ValueHistory(form)
+
+    form.restore({"c": Color(1, 2, 3), "s": 5})
+    qapp.processEvents()
+    # the slider signals its change with the signal of its child widget, the color edit with valueEdited only
+    assert _names(history.undo_entries()) == ["s"]
+
+    history.record()
+    assert _names(history.undo_entries()) == ["s", "c"]
+    history.record()
+    assert _names(history.undo_entries()) == ["s", "c"]
+
+    history.undo()
+    history.undo()
+    assert form["s"].get_value() == 0
+    assert form["c"].get_value().to_rgb_tuple() == (0, 0, 0, 255)
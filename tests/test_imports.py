@@ -0,0 +1,16 @@
+import os
+import subprocess
+import sys
+
+
+def test_widget_module_does_not_import_parser():
+    script = (
+        "import sys, function2widgets.widget; "
+        "print(sorted(m for m in ('function2widgets.diff', 'function2widgets.parser.function_parser') "
+        "if m in sys.modules))"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.check_output(
+        [sys.executable, "-c", script], cwd=root, text=True
+    )
+    assert output.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,57 @@
+import enum
+import pathlib
+
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.lazy import LazyParameterWidget
+from function2widgets.parser import FunctionInfoParser
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 2
+
+
+def _func(color: Color = Color.GREEN, name: str = "x", count: int = 3):
+    pass
+
+
+def _make_widgets(lazy: bool):
+    func_info = FunctionInfoParser().parse(_func)
+    return ParameterWidgetFactory().create_widgets_for_function(func_info, lazy=lazy)
+
+
+def test_lazy_values_match_eager_values(qapp):
+    eager = _make_widgets(lazy=False)
+    lazy = _make_widgets(lazy=True)
+    expected = {name: widget.get_value() for name, widget in eager.items()}
+
+    assert expected["color"] is Color.GREEN
+    assert all(isinstance(widget, LazyParameterWidget) for widget in lazy.values())
+    assert {name: widget.get_value() for name, widget in lazy.items()} == expected
+    for widget in lazy.values():
+        widget.materialize()
+    assert {name: widget.get_value() for name, widget in lazy.items()} == expected
+
+
+def test_lazy_pending_value(qapp):
+    widget = _make_widgets(lazy=True)["color"]
+
+    widget.set_value(Color.RED)
+    assert widget.get_value() is Color.RED
+    widget.materialize()
+    assert widget.get_value() is Color.RED
+
+    # the text of an item is accepted too
+    widget.set_value("GREEN")
+    assert widget.get_value() is Color.GREEN
+
+
+def test_lazy_path_value(qapp):
+    factory = ParameterWidgetFactory()
+    args = factory.create_widget_args("PathEdit", parameter_name="p", default="a.txt")
+    widget = LazyParameterWidget(factory.get_widget_class("PathEdit"), args)
+
+    widget.set_value(pathlib.Path("b.txt"))
+    assert widget.get_value() == "b.txt"
+    widget.materialize()
+    assert widget.get_value() == "b.txt"
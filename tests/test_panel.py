@@ -0,0 +1,98 @@
+import enum
+
+from function2widgets.info import ParameterInfo
+from function2widgets.panel import VirtualParameterPanel
+from function2widgets.parser import FunctionInfoParser
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 2
+
+
+def _color_param(color: Color = Color.GREEN):
+    pass
+
+
+def _make_parameters(count: int):
+    parameters = []
+    for i in range(count):
+        if i % 2 == 0:
+            parameters.append(ParameterInfo(name=f"p{i}", default=i, typename="int"))
+        else:
+            parameters.append(ParameterInfo(name=f"p{i}", default="s", typename="str"))
+    # an enum parameter at the end, off-screen
+    parameters.extend(FunctionInfoParser().parse(_color_param).parameters)
+    return parameters
+
+
+def _make_panel(qapp, count: int = 100):
+    panel = VirtualParameterPanel(row_height=50, overscan=1)
+    panel.resize(300, 200)
+    panel.show()
+    panel.set_parameters(_make_parameters(count))
+    qapp.processEvents()
+    return panel
+
+
+def test_off_screen_get_and_set(qapp):
+    panel = _make_panel(qapp)
+    assert "p90" not in panel.visible_widgets()
+
+    assert panel.get_value("p90") == 90
+    assert panel.get_value("color") is Color.GREEN
+    panel.set_value("p90", 7)
+    # the text of an item is stored as its data, like the widget does
+    panel.set_value("color", "RED")
+
+    assert panel.get_value("p90") == 7
+    assert panel.get_value("color") is Color.RED
+    assert "p90" not in panel.visible_widgets()
+    panel.deleteLater()
+
+
+def test_off_screen_widget_args_are_created_once(qapp, monkeypatch):
+    panel = _make_panel(qapp)
+    calls = []
+    create = panel.factory.create_widget_args_for_parameter
+
+    def counting_create(param_info):
+        calls.append(param_info.name)
+        return create(param_info)
+
+    monkeypatch.setattr(
+        panel.factory, "create_widget_args_for_parameter", counting_create
+    )
+    for value in range(5):
+        panel.set_value("p90", value)
+        panel.get_value("p90")
+
+    assert calls == ["p90"]
+    panel.deleteLater()
+
+
+def test_values_survive_scrolling(qapp):
+    panel = _make_panel(qapp)
+    panel.visible_widgets()["p1"].set_value("edited")
+    panel.set_value("p90", 7)
+    panel.set_value("color", Color.RED)
+
+    panel.scroll_to("p90")
+    qapp.processEvents()
+    assert "p1" not in panel.visible_widgets()
+    assert panel.visible_widgets()["p90"].get_value() == 7
+    assert panel.get_value("p1") == "edited"
+
+    panel.scroll_to("color")
+    qapp.processEvents()
+    assert panel.visible_widgets()["color"].get_value() is Color.RED
+
+    panel.verticalScrollBar().setValue(0)
+    qapp.processEvents()
+    assert panel.visible_widgets()["p1"].get_value() == "edited"
+    assert "p90" not in panel.visible_widgets()
+    assert panel.get_value("p90") == 7
+    assert panel.get_value("color") is Color.RED
+    # the widgets are recycled
+    assert panel.live_widget_count() < 20
+    panel.deleteLater()
@@ -0,0 +1,55 @@
+import sys
+import typing
+
+import pytest
+
+from function2widgets.parser.parameter_parser import resolve_type_info
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="PEP 585 generics")
+def test_builtin_generics():
+    assert resolve_type_info(list[int]) == ("list", ["int"])
+    assert resolve_type_info(dict[str, int]) == ("dict", ["str", "int"])
+    assert resolve_type_info(tuple[int, ...]) == ("tuple", ["int", "..."])
+
+
+def test_typing_generics():
+    assert resolve_type_info(typing.List[int]) == ("list", ["int"])
+    assert resolve_type_info(typing.Dict[str, int]) == ("dict", ["str", "int"])
+    assert resolve_type_info(typing.List) == ("list", None)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 unions")
+def test_pep_604_unions():
+    assert resolve_type_info(eval("int | None")) == ("typing.Optional", ["int"])
+    assert resolve_type_info(eval("int | str")) == ("typing.Union", ["int", "str"])
+    assert resolve_type_info(eval("int | str")) == resolve_type_info(
+        typing.Union[int, str]
+    )
+
+
+def test_optional():
+    assert resolve_type_info(typing.Optional[int]) == ("typing.Optional", ["int"])
+    assert resolve_type_info(typing.Optional[typing.List[int]]) == (
+        "typing.Optional",
+        ["typing.List[int]"],
+    )
+
+
+def test_nested_literal():
+    literal = typing.Literal[typing.Literal[1, 2], 3]
+
+    assert resolve_type_info(literal) == ("typing.Literal", ["1", "2", "3"])
+
+
+def test_literal_values_with_commas():
+    literal = typing.Literal["a, b", "c", "[d, e]"]
+
+    assert resolve_type_info(literal) == ("typing.Literal", ["a, b", "c", "[d, e]"])
+
+
+def test_results_are_not_shared():
+    type_extras = resolve_type_info(typing.List[int])[1]
+    type_extras.append("str")
+
+    assert resolve_type_info(typing.List[int]) == ("list", ["int"])
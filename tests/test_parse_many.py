@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from function2widgets.parser import FunctionInfoParser
+from function2widgets.parser.docstr_parser import ParseException
+
+
+def _func_1(a: int = 1):
+    pass
+
+
+def _func_2(b: str = "b", c: float = 1.0):
+    pass
+
+
+def _func_3(d: bool = True):
+    pass
+
+
+def _func_with_bad_widget_configs(e: int = 1):
+    """
+    @widgets
+    [e
+    @end
+    """
+
+
+def _func_with_unpicklable_default(lock=threading.Lock()):
+    pass
+
+
+def _param_names(result):
+    return [param.name for param in result.function_info.parameters]
+
+
+def test_results_are_in_input_order():
+    funcs = [_func_3, _func_1, _func_2, _func_1]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = FunctionInfoParser().parse_many(funcs, executor=executor)
+
+    assert [result.func_obj for result in results] == funcs
+    assert all(result.ok for result in results)
+    assert [_param_names(result) for result in results] == [
+        ["d"],
+        ["a"],
+        ["b", "c"],
+        ["a"],
+    ]
+
+
+def test_errors_are_collected():
+    funcs = [_func_1, _func_with_bad_widget_configs, 42, _func_2]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = FunctionInfoParser().parse_many(funcs, executor=executor)
+
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert isinstance(results[1].error, ParseException)
+    assert results[1].function_info is None
+    assert results[2].error is not None
+    assert _param_names(results[3]) == ["b", "c"]
+
+
+def test_unpicklable_functions_are_parsed_locally():
+    def nested(f: int = 1):
+        pass
+
+    funcs = [lambda g=1: None, nested, _func_with_unpicklable_default, _func_1]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = FunctionInfoParser().parse_many(funcs, executor=executor)
+
+    assert all(result.ok for result in results)
+    assert [_param_names(result) for result in results] == [
+        ["g"],
+        ["f"],
+        ["lock"],
+        ["a"],
+    ]
+    # the default is the object of the function, not a copy made by a worker
+    assert (
+        results[2].function_info.parameters[0].default
+        is _func_with_unpicklable_default.__defaults__[0]
+    )
@@ -0,0 +1,58 @@
+from PyQt6.QtCore import QEventLoop, QTimer
+
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.parser import FunctionInfoParser
+from function2widgets.pipeline import WidgetPipeline
+
+
+def _func(a: int = 1, b: str = "x", c: float = 0.5):
+    pass
+
+
+def _wait_for(job, timeout_ms: int = 5000):
+    loop = QEventLoop()
+    job.finished.connect(lambda *_: loop.quit())
+    job.failed.connect(lambda *_: loop.quit())
+    QTimer.singleShot(timeout_ms, loop.quit)
+    if not job.is_done():
+        loop.exec()
+
+
+def _make_pipeline(parser=None):
+    return WidgetPipeline(
+        ParameterWidgetFactory(), parser or FunctionInfoParser(), chunk_size=2
+    )
+
+
+def test_build_creates_widgets_in_chunks(qapp):
+    pipeline = _make_pipeline()
+    job = pipeline.build(_func, lazy=True)
+    created = []
+    progress = []
+    job.widgetCreated.connect(lambda name, widget: created.append(name))
+    job.progress.connect(lambda count, total: progress.append((count, total)))
+
+    _wait_for(job)
+
+    assert job.is_done() and job.error is None
+    assert job.lazy
+    assert [p.name for p in job.function_info.parameters] == ["a", "b", "c"]
+    assert created == ["a", "b", "c"]
+    assert progress == [(0, 3), (2, 3), (3, 3)]
+    assert list(job.widgets()) == ["a", "b", "c"]
+    assert job.widget_count() == 3
+    pipeline.close()
+
+
+def test_build_reports_parse_errors(qapp):
+    pipeline = _make_pipeline()
+    job = pipeline.build("not a function")
+    errors = []
+    job.failed.connect(errors.append)
+
+    _wait_for(job)
+
+    assert job.is_done()
+    assert errors and job.error is errors[0]
+    assert job.widget_count() == 0
+    pipeline.close()
@@ -0,0 +1,175 @@
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QVBoxLayout, QWidget
+
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.pool import WidgetPool
+from function2widgets.widgets.numberinput.intspin import IntSpinBox
+from function2widgets.widgets.selectwidget.combobox import ComboBox
+
+
+def _make_factory():
+    pool = WidgetPool()
+    return ParameterWidgetFactory(widget_pool=pool), pool
+
+
+def _wait(ms: int):
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def _show_in_container(qapp, widget) -> QWidget:
+    container = QWidget()
+    QVBoxLayout(container).addWidget(widget)
+    container.show()
+    qapp.processEvents()
+    return container
+
+
+def test_acquired_widget_is_reconfigured(qapp):
+    factory, pool = _make_factory()
+    args = factory.create_widget_args("IntSpinBox", parameter_name="a", label="A")
+    widget = IntSpinBox(args)
+    widget.set_value(10)
+    factory.release_widget(widget)
+
+    new_args = factory.create_widget_args(
+        "IntSpinBox", parameter_name="b", label="B", default=3
+    )
+    acquired = pool.acquire(IntSpinBox, new_args)
+
+    assert acquired is widget
+    assert acquired.parameter_name == "b"
+    assert acquired.get_label() == "B"
+    assert acquired.get_value() == 3
+    assert pool.stats()["hits"] == 1
+
+
+def test_acquired_widget_is_shown_by_its_new_layout(qapp):
+    factory, pool = _make_factory()
+    widget = IntSpinBox(factory.create_widget_args("IntSpinBox", parameter_name="a"))
+    container = _show_in_container(qapp, widget)
+    assert widget.isVisible()
+
+    factory.release_widget(widget)
+    assert widget.isHidden()
+    assert widget.parentWidget() is None
+
+    acquired = pool.acquire(
+        IntSpinBox, factory.create_widget_args("IntSpinBox", parameter_name="b")
+    )
+    assert acquired is widget
+    # a parentless widget is not shown as a window
+    assert not acquired.isVisible()
+    other = _show_in_container(qapp, acquired)
+    assert acquired.isVisible()
+    assert acquired.parentWidget() is other
+    container.deleteLater()
+    other.deleteLater()
+
+
+def test_released_window_is_hidden(qapp):
+    factory, pool = _make_factory()
+    widget = IntSpinBox(factory.create_widget_args("IntSpinBox", parameter_name="a"))
+    widget.show()
+
+    factory.release_widget(widget)
+    assert not widget.isVisible()
+
+    acquired = pool.acquire(
+        IntSpinBox, factory.create_widget_args("IntSpinBox", parameter_name="b")
+    )
+    assert acquired is widget
+    assert not acquired.isVisible()
+
+
+def test_released_widget_is_disconnected(qapp):
+    factory, pool = _make_factory()
+    widget = IntSpinBox(factory.create_widget_args("IntSpinBox", parameter_name="a"))
+    emitted = []
+    widget.valueChanged.connect(emitted.append)
+    widget.set_value(1)
+    _wait(10)
+    assert emitted == [1]
+
+    factory.release_widget(widget)
+    acquired = pool.acquire(
+        IntSpinBox, factory.create_widget_args("IntSpinBox", parameter_name="b")
+    )
+    assert acquired is widget
+    acquired.set_value(2)
+    _wait(10)
+    assert emitted == [1]
+
+    # the widget still signals its new listeners
+    acquired.valueChanged.connect(emitted.append)
+    acquired.set_value(3)
+    _wait(10)
+    assert emitted == [1, 3]
+
+
+def test_acquired_widget_with_parent(qapp):
+    factory, pool = _make_factory()
+    factory.release_widget(
+        IntSpinBox(factory.create_widget_args("IntSpinBox", parameter_name="a"))
+    )
+    parent = QWidget()
+    parent.show()
+
+    acquired = pool.acquire(
+        IntSpinBox,
+        factory.create_widget_args("IntSpinBox", parameter_name="b"),
+        parent=parent,
+    )
+
+    assert acquired.parentWidget() is parent
+    assert acquired.isVisible()
+    parent.deleteLater()
+
+
+def test_spin_box_range_is_reconfigured(qapp):
+    factory, pool = _make_factory()
+    factory.release_widget(
+        IntSpinBox(
+            factory.create_widget_args(
+                "IntSpinBox", parameter_name="a", max_value=10, suffix="s"
+            )
+        )
+    )
+
+    acquired = pool.acquire(
+        IntSpinBox,
+        factory.create_widget_args(
+            "IntSpinBox", parameter_name="b", default=50, min_value=5
+        ),
+    )
+
+    assert acquired is not None
+    assert acquired.get_value() == 50
+    acquired.set_value(1000)
+    # the range of a new QSpinBox with min_value=5
+    assert acquired.get_value() == 99
+    acquired.set_value(0)
+    assert acquired.get_value() == 5
+
+
+def test_miss_on_incompatible_args(qapp):
+    factory, pool = _make_factory()
+    combo_args = factory.create_widget_args(
+        "ComboBox", parameter_name="a", items=["x", "y"], default="x"
+    )
+    factory.release_widget(ComboBox(combo_args))
+
+    other_items = factory.create_widget_args(
+        "ComboBox", parameter_name="b", items=["x", "z"], default="x"
+    )
+    assert pool.acquire(ComboBox, other_items) is None
+    # another widget class
+    assert (
+        pool.acquire(
+            IntSpinBox, factory.create_widget_args("IntSpinBox", parameter_name="c")
+        )
+        is None
+    )
+    assert pool.stats()["misses"] == 2
+    assert pool.size(ComboBox) == 1
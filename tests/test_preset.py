@@ -0,0 +1,81 @@
+import datetime
+import enum
+import pathlib
+
+from PyQt6.QtCore import QDateTime
+
+from function2widgets.color import Color
+from function2widgets.preset import PresetStore, function_key
+
+
+class Mode(enum.Enum):
+    FAST = "fast"
+    SAFE = "safe"
+
+
+def _func(a, b):
+    pass
+
+
+def test_preset_values_round_trip(qapp):
+    values = {
+        "color": Color(10, 20, 30, 40),
+        "when": datetime.datetime(2024, 5, 6, 7, 8, 9),
+        "qwhen": QDateTime.fromString(
+            "2024-05-06T07:08:09.010", "yyyy-MM-ddTHH:mm:ss.zzz"
+        ),
+        "size": (3, 4),
+        "mode": Mode.SAFE,
+        "output": pathlib.Path("out/result.txt"),
+        "names": ["a", "b"],
+    }
+    with PresetStore() as store:
+        store.save(function_key(_func), "preset", values)
+        loaded = store.load(function_key(_func), "preset")
+
+    assert loaded.keys() == values.keys()
+    # Color does not implement __eq__
+    assert loaded.pop("color").to_rgb_tuple(with_alpha=True) == (10, 20, 30, 40)
+    values.pop("color")
+    assert loaded == values
+    assert loaded["mode"] is Mode.SAFE
+    assert type(loaded["size"]) is tuple
+
+
+def _compressed_flags(store):
+    rows = store._conn.execute(
+        "SELECT name, compressed FROM presets JOIN bodies USING (id)"
+    ).fetchall()
+    return dict(rows)
+
+
+def test_large_presets_are_compressed():
+    small = {"text": "x" * 100}
+    large = {"text": "x" * (PresetStore.COMPRESS_THRESHOLD + 1)}
+    with PresetStore() as store:
+        store.save("f", "small", small)
+        store.save("f", "large", large)
+
+        assert _compressed_flags(store) == {"small": 0, "large": 1}
+        assert store.load("f", "small") == small
+        assert store.load("f", "large") == large
+        sizes = {info.name: info.size for info in store.presets("f")}
+        # the size is the size of the uncompressed body
+        assert sizes["large"] > PresetStore.COMPRESS_THRESHOLD
+
+
+def test_listing_presets_does_not_read_bodies():
+    with PresetStore() as store:
+        store.save_many("f", {"b": {"x": 1}, "a": {"x": 2}})
+        store.save("g", "c", {"x": 3})
+
+        statements = []
+        store._conn.set_trace_callback(statements.append)
+        assert store.names("f") == ["a", "b"]
+        assert [info.name for info in store.presets("f")] == ["a", "b"]
+        assert store.functions() == ["f", "g"]
+        assert store.count() == 3
+        store._conn.set_trace_callback(None)
+
+        assert statements
+        assert not any("bodies" in statement for statement in statements)
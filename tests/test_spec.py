@@ -0,0 +1,103 @@
+import datetime
+import enum
+import json
+import pathlib
+
+import pytest
+
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.parser import FunctionInfoParser
+from function2widgets.spec import (
+    SpecError,
+    compile_function_spec,
+    decode_value,
+    dumps_spec,
+    encode_value,
+    function_info_from_spec,
+    loads_spec,
+)
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 2
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+def _func(
+    color: Color = Color.GREEN,
+    level: Level = Level.HIGH,
+    output: pathlib.Path = pathlib.Path("out/result.txt"),
+    size: tuple = (1, 2),
+):
+    pass
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        1,
+        "text",
+        [1, (2, 3)],
+        (1, "a"),
+        {1, 2},
+        {"a": 1, 2: "b"},
+        {"$key": 1},
+        b"\x00\x01",
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.date(2024, 1, 2),
+        datetime.time(3, 4, 5),
+        Color.RED,
+        Level.HIGH,
+        [Color.GREEN, {"level": Level.LOW}],
+        pathlib.Path("a/b.txt"),
+    ],
+)
+def test_encoded_values_round_trip(value):
+    encoded = encode_value(value)
+    decoded = decode_value(json.loads(json.dumps(encoded)))
+
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_enum_members_are_encoded_by_name():
+    assert encode_value(Level.HIGH) == {"$enum": [f"{__name__}:Level", "HIGH"]}
+    assert decode_value(encode_value(Color.RED)) is Color.RED
+
+
+def test_local_enums_cannot_be_encoded():
+    class LocalColor(enum.Enum):
+        RED = 1
+
+    with pytest.raises(SpecError):
+        encode_value(LocalColor.RED)
+
+
+def test_unknown_enum_members_cannot_be_decoded():
+    with pytest.raises(SpecError):
+        decode_value({"$enum": [f"{__name__}:Color", "BLUE"]})
+    with pytest.raises(SpecError):
+        decode_value({"$enum": [f"{__name__}:NoSuchEnum", "RED"]})
+
+
+def test_compiled_spec_round_trips(qapp):
+    func_info = FunctionInfoParser().parse(_func)
+    spec = loads_spec(dumps_spec(compile_function_spec(func_info)))
+    rebuilt = function_info_from_spec(spec)
+
+    assert [param.default for param in rebuilt.parameters] == [
+        Color.GREEN,
+        Level.HIGH,
+        pathlib.Path("out/result.txt"),
+        (1, 2),
+    ]
+
+    widgets = ParameterWidgetFactory().create_widgets_for_spec(spec)
+    assert widgets["color"].get_value() is Color.GREEN
+    assert widgets["level"].get_value() is Level.HIGH
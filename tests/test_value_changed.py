@@ -0,0 +1,69 @@
+from PyQt6.QtCore import QEventLoop, QTimer
+
+from function2widgets.color import Color
+from function2widgets.form import ParameterForm
+from function2widgets.widgets.misc.coloredit import ColorEdit, ColorEditArgs
+from function2widgets.widgets.numberinput.slider import Slider, SliderArgs
+
+
+def _wait(ms: int):
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def _make_form():
+    color_edit = ColorEdit(ColorEditArgs(parameter_name="c", default=Color(0, 0, 0)))
+    slider = Slider(
+        SliderArgs(parameter_name="s", default=0, min_value=0, max_value=100)
+    )
+    return ParameterForm({"c": color_edit, "s": slider})
+
+
+def _connect(form: ParameterForm):
+    emitted = []
+    for parameter_name, widget in form.widgets().items():
+        widget.valueChanged.connect(
+            lambda value, name=parameter_name: emitted.append((name, value))
+        )
+    return emitted
+
+
+def test_value_changed_is_emitted_once_per_change(qapp):
+    form = _make_form()
+    emitted = _connect(form)
+
+    for value in range(1, 11):
+        form["s"].set_value(value)
+    form["s"].set_value(10)
+    _wait(10)
+
+    assert emitted == [("s", 10)]
+
+
+def test_bulk_update_does_not_emit_value_changed(qapp):
+    form = _make_form()
+    emitted = _connect(form)
+
+    assert form.restore({"c": Color(1, 2, 3), "s": 5}) == ["c", "s"]
+    _wait(10)
+    assert emitted == []
+
+    # the restored values are the base of the later changes
+    form["s"].set_value(5)
+    _wait(10)
+    assert emitted == []
+    form["s"].set_value(6)
+    _wait(10)
+    assert emitted == [("s", 6)]
+
+
+def test_bulk_update_cancels_pending_value_changed(qapp):
+    form = _make_form()
+    emitted = _connect(form)
+
+    form["s"].set_value(3)
+    form.restore({"s": 7})
+    _wait(10)
+
+    assert emitted == []
@@ -0,0 +1,153 @@
+import datetime
+import enum
+import pathlib
+
+import pytest
+
+from function2widgets.color import Color
+from function2widgets.factory import ParameterWidgetFactory
+from function2widgets.values import (
+    VALUE_OWNERSHIP_DEEPCOPY,
+    VALUE_OWNERSHIP_FROZEN,
+    VALUE_OWNERSHIP_SHALLOW,
+    VALUE_OWNERSHIP_SHARED,
+    FrozenColor,
+    FrozenDict,
+    FrozenList,
+    freeze,
+    is_frozen,
+    thaw,
+)
+
+
+class Mode(enum.Enum):
+    A = 1
+
+
+def _make_list_editor(value_ownership: str, default: list):
+    factory = ParameterWidgetFactory()
+    args = factory.create_widget_args(
+        "ListEditor",
+        parameter_name="a",
+        default=default,
+        hide_default_value_widget=False,
+        value_ownership=value_ownership,
+    )
+    widget = factory.get_widget_class("ListEditor")(args)
+    # the value equals the default value, so get_value() returns the stored default value
+    widget.set_value([1, [2]])
+    return widget
+
+
+def _mutate_default_and_value(widget, default: list):
+    default.append(3)
+    default[1].append(3)
+    value = widget.get_value()
+    try:
+        value.append(4)
+        value[1].append(4)
+    except TypeError:
+        pass
+    return widget.get_value()
+
+
+@pytest.mark.parametrize(
+    "value_ownership, expected",
+    [
+        # the default value is the caller's object, the returned values are copies of it
+        (VALUE_OWNERSHIP_DEEPCOPY, [1, [2, 3], 3]),
+        # the returned values are shallow copies, their nested list is the one of the default value
+        (VALUE_OWNERSHIP_SHALLOW, [1, [2, 3, 4], 3]),
+        # the default value is a frozen copy, the returned value cannot be modified
+        (VALUE_OWNERSHIP_FROZEN, [1, [2]]),
+        # nothing is protected
+        (VALUE_OWNERSHIP_SHARED, [1, [2, 3, 4], 3, 4]),
+    ],
+)
+def test_value_ownership_modes(qapp, value_ownership, expected):
+    default = [1, [2]]
+    widget = _make_list_editor(value_ownership, default)
+
+    assert widget.get_value() == [1, [2]]
+    assert _mutate_default_and_value(widget, default) == expected
+
+
+def test_frozen_value_is_returned_as_it_is(qapp):
+    widget = _make_list_editor(VALUE_OWNERSHIP_FROZEN, [1, [2]])
+
+    value = widget.get_value()
+    assert isinstance(value, FrozenList)
+    assert widget.get_value() is value
+    with pytest.raises(TypeError):
+        value[1].append(3)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.date(2024, 1, 2),
+        datetime.time(3, 4, 5),
+        datetime.timedelta(seconds=1),
+        Mode.A,
+        pathlib.Path("a.txt"),
+        "text",
+        1.5,
+    ],
+)
+def test_freeze_keeps_immutable_scalars(value):
+    assert freeze(value) is value
+    assert is_frozen(value)
+    assert is_frozen((value, (value,)))
+
+
+def test_freeze_color():
+    color = Color(1, 2, 3)
+    frozen = freeze(color)
+
+    assert isinstance(frozen, FrozenColor)
+    assert frozen.to_rgb_tuple() == (1, 2, 3, 255)
+    assert freeze(frozen) is frozen
+    with pytest.raises(TypeError):
+        frozen.r = 0
+    thawed = thaw(frozen)
+    assert type(thawed) is Color
+    thawed.r = 0
+    assert frozen.r == 1
+
+
+def test_freeze_containers():
+    value = {"a": [1, {2}], "b": (Color(), [3])}
+    frozen = freeze(value)
+
+    assert isinstance(frozen, FrozenDict)
+    assert isinstance(frozen["a"], FrozenList)
+    assert frozen["a"][1] == frozenset({2})
+    assert isinstance(frozen["b"][0], FrozenColor)
+    assert freeze(frozen) is frozen
+    thawed = thaw(frozen)
+    assert thawed["a"] == [1, {2}] and type(thawed["a"]) is list
+    assert type(thawed["b"][0]) is Color
+    assert thawed["b"][1] == [3] and type(thawed["b"][1]) is list
+
+
+def test_frozen_default_of_args_created_directly(qapp):
+    from function2widgets.widgets.editor.listeditor import ListEditor, ListEditorArgs
+
+    default = [1, [2]]
+    widget = ListEditor(
+        ListEditorArgs(
+            parameter_name="a",
+            default=default,
+            hide_default_value_widget=False,
+            value_ownership=VALUE_OWNERSHIP_FROZEN,
+        )
+    )
+    widget.set_value([1, [2]])
+
+    assert widget.default is not default
+    assert isinstance(widget.default, FrozenList)
+    # the frozen default value is returned as it is
+    assert widget.get_value() is widget.get_value()
+    default.append(3)
+    assert widget.get_value() == [1, [2]]
@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+
+from function2widgets.parser import FunctionInfoParser
+from function2widgets.parser.function_parser import make_default_widget_resolver
+from function2widgets.watcher import FunctionWatcher
+
+SOURCE_1 = """
+class MyType(object):
+    pass
+
+
+def func(a: MyType = None, b: str = "x", c: float = 2.0):
+    pass
+"""
+
+SOURCE_2 = """
+class MyType(object):
+    pass
+
+
+def func(a: MyType = None, b: str = "y", d: int = 3):
+    pass
+"""
+
+
+def _write(path: str, source: str, offset_s: int):
+    with open(path, "w") as f:
+        f.write(source)
+    # make sure the mtime changes, even on file systems with a coarse mtime
+    mtime = time.time_ns() + offset_s * 10**9
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_watcher_reports_changed_parameters(qapp, tmp_path):
+    path = str(tmp_path / "watchedmodule.py")
+    _write(path, SOURCE_1, 0)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        import watchedmodule
+
+        resolver = make_default_widget_resolver()
+        # the class is created again when the module is reloaded
+        resolver.register_type("watchedmodule.MyType", "IntSpinBox")
+        watcher = FunctionWatcher(
+            parser=FunctionInfoParser(widget_resolver=resolver),
+            debounce_ms=20,
+            poll_interval_ms=20,
+            use_file_system_watcher=False,
+        )
+        key = watcher.watch(watchedmodule.func)
+        events = []
+        watcher.functionChanged.connect(
+            lambda k, func_info, diff: events.append((k, func_info, diff))
+        )
+        watcher.reloadFailed.connect(lambda k, e: events.append((k, e, None)))
+
+        _write(path, SOURCE_2, 1)
+        deadline = time.time() + 5
+        while not events and time.time() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+        watcher.close()
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop("watchedmodule", None)
+
+    assert len(events) == 1
+    changed_key, func_info, diff = events[0]
+    assert changed_key == key == "watchedmodule:func"
+    assert diff.added == ["d"]
+    assert diff.removed == ["c"]
+    assert diff.changed == ["b"]
+    # the parameters are parsed and compared with the resolver of the parser
+    assert func_info.parameters[0].widget.widget_class == "IntSpinBox"
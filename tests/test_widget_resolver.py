@@ -0,0 +1,107 @@
+import enum
+import pathlib
+
+from function2widgets.parser import FunctionInfoParser
+from function2widgets.parser.function_parser import make_default_widget_resolver
+
+
+class MyType(object):
+    pass
+
+
+def _rule_for(cls):
+    return lambda t: t is cls
+
+
+def test_fingerprint_is_stable_for_same_registrations():
+    resolver_1 = make_default_widget_resolver()
+    resolver_2 = make_default_widget_resolver()
+    resolver_1.register_type(MyType, "IntSpinBox")
+    resolver_2.register_type(MyType, "IntSpinBox")
+
+    assert resolver_1.fingerprint() == resolver_2.fingerprint()
+
+
+def test_fingerprint_changes_with_registrations():
+    resolver = make_default_widget_resolver()
+    fingerprint = resolver.fingerprint()
+
+    resolver.register_type(MyType, "IntSpinBox")
+    assert resolver.fingerprint() != fingerprint
+
+    other = make_default_widget_resolver()
+    other.register_type(MyType, "LineEdit")
+    assert other.fingerprint() != resolver.fingerprint()
+
+    resolver.unregister_type(MyType)
+    assert resolver.fingerprint() == fingerprint
+
+
+def test_fingerprint_of_rules_depends_on_closure():
+    resolver_1 = make_default_widget_resolver()
+    resolver_2 = make_default_widget_resolver()
+    resolver_1.register_type_rule(_rule_for(int), "IntSpinBox")
+    resolver_2.register_type_rule(_rule_for(str), "IntSpinBox")
+
+    assert resolver_1.fingerprint() != resolver_2.fingerprint()
+
+
+def test_parser_cache_flags_follow_resolver():
+    resolver = make_default_widget_resolver()
+    parser = FunctionInfoParser(widget_resolver=resolver)
+    flags = parser._cache_flags(True, False)
+
+    resolver.register_type(MyType, "IntSpinBox")
+
+    assert parser._cache_flags(True, False) != flags
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 2
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+def _enum_path_func(
+    color: Color = Color.GREEN,
+    level: Level = Level.LOW,
+    path: pathlib.Path = pathlib.Path("a.txt"),
+    pure_path: pathlib.PurePosixPath = None,
+):
+    pass
+
+
+def test_default_rules_for_enums_and_paths():
+    func_info = FunctionInfoParser().parse(_enum_path_func)
+    widgets = {p.name: p.widget for p in func_info.parameters}
+
+    assert widgets["color"].widget_class == "ComboBox"
+    assert widgets["color"].widget_args["items"] == [
+        ("RED", Color.RED),
+        ("GREEN", Color.GREEN),
+    ]
+    # an IntEnum is an enum rather than an int
+    assert widgets["level"].widget_class == "ComboBox"
+    assert widgets["path"].widget_class == "PathEdit"
+    assert widgets["pure_path"].widget_class == "PathEdit"
+
+
+def test_enum_and_path_widgets_round_trip(qapp):
+    from function2widgets.factory import ParameterWidgetFactory
+
+    func_info = FunctionInfoParser().parse(_enum_path_func)
+    widgets = ParameterWidgetFactory().create_widgets_for_function(func_info)
+
+    assert widgets["color"].get_value() is Color.GREEN
+    widgets["color"].set_value(Color.RED)
+    assert widgets["color"].get_value() is Color.RED
+    widgets["color"].set_value("GREEN")
+    assert widgets["color"].get_value() is Color.GREEN
+
+    assert widgets["path"].get_value() == "a.txt"
+    widgets["path"].set_value(pathlib.Path("b.txt"))
+    assert widgets["path"].get_value() == "b.txt"
@@ -0,0 +1,41 @@
+from function2widgets.parser.widgetconfigs_parser import (
+    WidgetConfigsParser,
+    find_widget_configs_block,
+)
+
+DOCSTRING = """
+a function
+
+@widgets
+[a]
+widget_class = "IntSpinBox"
+@end
+
+:param a: the first parameter
+"""
+
+
+def test_split_widget_configs_block():
+    docstring_text, block = WidgetConfigsParser.split_widget_configs_block(DOCSTRING)
+
+    assert docstring_text == "\na function\n:param a: the first parameter\n"
+    assert block.strip() == '[a]\nwidget_class = "IntSpinBox"'
+    assert WidgetConfigsParser().parse(DOCSTRING) == {
+        "a": {"widget_class": "IntSpinBox"}
+    }
+
+
+def test_tags_in_the_middle_of_lines_are_ignored():
+    text = "see @widgets\n  @widgets\nx = 1 @end\n@end x\n  @end  \ny"
+    block_start, content_start, content_end, block_end = find_widget_configs_block(text)
+
+    assert text[content_start:content_end] == "\nx = 1 @end\n@end x\n"
+    assert text[block_end:] == "y"
+    assert find_widget_configs_block("@widgets @end\n") is None
+    assert find_widget_configs_block("x @widgets\n@end\n") is None
+
+
+def test_many_tags_on_one_line():
+    # would take minutes if the start of the line were searched again for every tag
+    assert find_widget_configs_block("x" + " @widgets" * 200000) is None
+    assert find_widget_configs_block("@widgets\n" + "x @end " * 200000) is None